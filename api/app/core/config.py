@@ -32,10 +32,80 @@ class Settings(BaseSettings):
     WEB_PORT: int = 2013
 
     # Performance settings
-    WEB_CONCURRENCY: int = 6
+    # Uvicorn workers; more than one requires BROADCAST_BUS_URL. Unless noted
+    # otherwise, the limits below apply to each worker separately
+    WEB_CONCURRENCY: int = 1
+    # Per worker: the effective totals are WEB_CONCURRENCY times these
     MAX_CONNECTIONS_PER_EVENT: int = 500
     MAX_TOTAL_CONNECTIONS: int = 2000
 
+    # In-memory tally engine: how often counters are checked against the DB
+    TALLY_RECONCILE_INTERVAL_SEC: float = 30.0
+
+    # Counter rows per candidate in event_candidate_tallies; each vote batch
+    # increments a random one so concurrent writers rarely lock the same row
+    TALLY_SHARDS: int = 8
+
+    # Vote write-behind: flush after this many submissions or milliseconds
+    VOTE_BATCH_MAX_SIZE: int = 200
+    VOTE_BATCH_MAX_WAIT_MS: int = 5
+
+    # Coalesced per-vote broadcasts are flushed at most this many times per second
+    BROADCAST_TICK_HZ: float = 8.0
+
+    # Voting timers due within this many milliseconds of each other fire
+    # together, once the last of them is due (never early)
+    TIMER_TICK_MS: int = 50
+
+    # Per-connection outbound queue; slow clients are evicted instead of
+    # holding up broadcasts
+    WS_SEND_QUEUE_SIZE: int = 64
+    WS_SEND_TIMEOUT_SEC: float = 5.0
+
+    # Recent vote broadcasts kept per event for clients that reconnect. The
+    # buffer and its sequence numbers belong to one worker; a client that
+    # reconnects to another one gets a full resync
+    WS_REPLAY_BUFFER_SIZE: int = 256
+
+    # Quiet connections get an app-level ping after this many seconds and are
+    # evicted after the idle timeout; the sweeper checks 1/SLICES of them per
+    # tick (interval 0 disables it)
+    WS_HEARTBEAT_INTERVAL_SEC: float = 20.0
+    WS_IDLE_TIMEOUT_SEC: float = 60.0
+    WS_HEARTBEAT_SLICES: int = 10
+
+    # WebSocket admission: handshakes per second (0 disables pacing), burst,
+    # and how many clients may wait for a slot and for how long. Rates are
+    # scaled down while event-loop lag exceeds the target or the DB pool is
+    # nearly exhausted. The budget is per worker, so the overall handshake
+    # rate is WEB_CONCURRENCY times WS_ACCEPT_RATE
+    WS_ACCEPT_RATE: float = 200.0
+    WS_ACCEPT_BURST: int = 100
+    WS_ADMISSION_QUEUE_SIZE: int = 1000
+    WS_ADMISSION_MAX_WAIT_SEC: float = 5.0
+    WS_TARGET_LOOP_LAG_MS: float = 50.0
+
+    # Word exports are rendered in this many worker processes and cached on
+    # disk (empty dir = system temp dir) for up to MAX_FILES events. Replaced
+    # files stay on disk for STALE_TTL so downloads already handed out finish
+    EXPORT_WORKERS: int = 2
+    EXPORT_CACHE_DIR: str = ""
+    EXPORT_CACHE_MAX_FILES: int = 128
+    EXPORT_STALE_TTL_SEC: float = 300.0
+
+    # Raw vote audit export: rows per keyset page (one short query each)
+    VOTE_EXPORT_PAGE_SIZE: int = 10000
+
+    # Cache-Control for polled public endpoints (ETag-validated), sized for a
+    # reverse-proxy micro-cache
+    HTTP_CACHE_MAX_AGE_SEC: int = 1
+    HTTP_CACHE_STALE_SEC: int = 2
+
+    # Cross-worker broadcast bus (redis://...); empty means single process.
+    # Required when WEB_CONCURRENCY > 1
+    BROADCAST_BUS_URL: str = ""
+    BROADCAST_BUS_CHANNEL: str = "vote_tersu:broadcast"
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # Ignore extra fields in .env
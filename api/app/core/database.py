@@ -1,10 +1,33 @@
+import logging
+
 from sqlalchemy import create_engine, inspect, text, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
 is_sqlite = "sqlite" in settings.DATABASE_URL
 
+# Dialect-specific INSERT supporting ON CONFLICT ... DO NOTHING / DO UPDATE
+if is_sqlite:
+    from sqlalchemy.dialects.sqlite import insert as dialect_insert
+else:
+    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its asyncio driver (aiosqlite / asyncpg)."""
+    scheme, sep, rest = url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme in ("postgres", "postgresql") or scheme.startswith("postgresql+"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
 if is_sqlite:
     connect_args = {
         "check_same_thread": False,
@@ -21,7 +44,20 @@ if is_sqlite:
         echo=False,
     )
 
+    # Async engine for the event-loop paths (WebSocket, live admin actions)
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        connect_args=connect_args,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=False,
+    )
+
     @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA journal_mode=WAL")
@@ -30,6 +66,13 @@ if is_sqlite:
         cursor.execute("PRAGMA mmap_size=268435456")
         cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.close()
+
+    # isolation_level=None stops the driver from managing transactions on its
+    # own; emit BEGIN on the async engine so a failed vote batch rolls back
+    # as a whole. The sync routes keep their autocommit behaviour.
+    @event.listens_for(async_engine.sync_engine, "begin")
+    def begin_sqlite_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
 else:
     # PostgreSQL
     engine = create_engine(
@@ -42,8 +85,28 @@ else:
         echo=False,
     )
 
+    # Async engine for the event-loop paths (WebSocket, live admin actions)
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        pool_size=50,
+        max_overflow=150,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=60,
+        echo=False,
+    )
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Objects stay usable after commit so handlers can keep reading them
+# without another round trip
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -55,6 +118,18 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Every vote after the first of its (event, candidate, voter_key)
+DUPLICATE_VOTES = (
+    "SELECT * FROM votes WHERE id NOT IN ("
+    "SELECT MIN(id) FROM votes GROUP BY event_id, candidate_id, voter_key)"
+)
+
+
 def ensure_schema():
     """Lightweight migration hooks for incremental schema updates."""
     with engine.connect() as connection:
@@ -89,6 +164,14 @@ def ensure_schema():
             ))
             connection.commit()
 
+        # Ensure timer_duration_sec exists on event_candidates
+        event_candidate_columns = table_columns("event_candidates")
+        if event_candidate_columns and "timer_duration_sec" not in event_candidate_columns:
+            connection.execute(text(
+                "ALTER TABLE event_candidates ADD COLUMN timer_duration_sec INTEGER"
+            ))
+            connection.commit()
+
         # Ensure candidate_group exists on event_candidates
         event_candidate_columns = table_columns("event_candidates")
         if event_candidate_columns and "candidate_group" not in event_candidate_columns:
@@ -116,6 +199,18 @@ def ensure_schema():
             ))
             connection.commit()
 
+        # Ensure voter_key exists on votes
+        vote_columns = table_columns("votes")
+        if vote_columns and "voter_key" not in vote_columns:
+            connection.execute(text(
+                "ALTER TABLE votes ADD COLUMN voter_key VARCHAR"
+            ))
+            connection.execute(text(
+                "UPDATE votes SET voter_key = ip_address || '_' || COALESCE(device_id, '') "
+                "WHERE voter_key IS NULL"
+            ))
+            connection.commit()
+
         # Ensure participant_count exists on event_candidates
         event_candidate_columns = table_columns("event_candidates")
         if event_candidate_columns and "participant_count" not in event_candidate_columns:
@@ -143,6 +238,25 @@ def ensure_schema():
             ))
             connection.commit()
 
+        if not index_exists("uq_votes_voter_key"):
+            # Duplicates could slip through the old read-then-write check. They
+            # are not removed here: dedupe_votes.py does that explicitly.
+            duplicates = connection.execute(text(
+                f"SELECT event_id, COUNT(*) FROM ({DUPLICATE_VOTES}) d GROUP BY event_id"
+            )).all()
+            if duplicates:
+                for event_id, count in duplicates:
+                    logger.error(f"Event {event_id} has {count} duplicate votes")
+                raise RuntimeError(
+                    "Cannot create uq_votes_voter_key: votes contains duplicate voters. "
+                    "Review them with `python dedupe_votes.py` and remove them with "
+                    "`python dedupe_votes.py --apply`."
+                )
+            connection.execute(text(
+                "CREATE UNIQUE INDEX uq_votes_voter_key ON votes(event_id, candidate_id, voter_key)"
+            ))
+            connection.commit()
+
         if not index_exists("idx_event_candidates_event"):
             if is_sqlite:
                 connection.execute(text(
@@ -159,3 +273,55 @@ def ensure_schema():
                 "CREATE INDEX idx_events_link ON events(link)"
             ))
             connection.commit()
+
+        # Ensure unique_voters exists on events, backfilled from the voter registry
+        # (runs after uq_votes_voter_key, which refuses to start while duplicates exist)
+        event_columns = table_columns("events")
+        if event_columns and "unique_voters" not in event_columns:
+            connection.execute(text(
+                "ALTER TABLE events ADD COLUMN unique_voters INTEGER DEFAULT 0"
+            ))
+            connection.execute(text(
+                "INSERT INTO event_voters (event_id, voter_key) "
+                "SELECT DISTINCT event_id, voter_key FROM votes "
+                "WHERE voter_key IS NOT NULL "
+                "AND NOT EXISTS (SELECT 1 FROM event_voters ev "
+                "WHERE ev.event_id = votes.event_id AND ev.voter_key = votes.voter_key)"
+            ))
+            connection.execute(text(
+                "UPDATE events SET unique_voters = "
+                "(SELECT COUNT(*) FROM event_voters WHERE event_voters.event_id = events.id)"
+            ))
+            # participant_count now counts distinct voter keys (one vote row each)
+            connection.execute(text(
+                "UPDATE event_candidates SET participant_count = "
+                "(SELECT COUNT(*) FROM votes WHERE votes.event_id = event_candidates.event_id "
+                "AND votes.candidate_id = event_candidates.candidate_id)"
+            ))
+            connection.commit()
+
+        # Ensure version exists on event_candidate_tallies
+        tally_columns = table_columns("event_candidate_tallies")
+        if tally_columns and "version" not in tally_columns:
+            connection.execute(text(
+                "ALTER TABLE event_candidate_tallies ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+            ))
+            connection.commit()
+
+        # Backfill the results summary table for votes cast before it existed;
+        # from then on the vote writer keeps it current
+        has_tallies = connection.execute(text(
+            "SELECT 1 FROM event_candidate_tallies LIMIT 1"
+        )).first()
+        has_votes = connection.execute(text("SELECT 1 FROM votes LIMIT 1")).first()
+        if has_votes and not has_tallies:
+            connection.execute(text(
+                "INSERT INTO event_candidate_tallies "
+                "(event_id, candidate_id, shard, yes_votes, no_votes, neutral_votes, version) "
+                "SELECT event_id, candidate_id, 0, "
+                "SUM(CASE WHEN vote_type = 'yes' THEN 1 ELSE 0 END), "
+                "SUM(CASE WHEN vote_type = 'no' THEN 1 ELSE 0 END), "
+                "SUM(CASE WHEN vote_type = 'neutral' THEN 1 ELSE 0 END), 0 "
+                "FROM votes GROUP BY event_id, candidate_id"
+            ))
+            connection.commit()
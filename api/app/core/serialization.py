@@ -0,0 +1,49 @@
+from typing import Any
+from datetime import date, datetime
+from fastapi.responses import JSONResponse
+import enum
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any):
+    """Handle the non-JSON types that show up in payloads (stdlib fallback only)."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+def dumps_text(obj: Any) -> str:
+    """Serialize to a JSON string, e.g. for a WebSocket text frame."""
+    return dumps(obj).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Default HTTP response class, rendered with the fast serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
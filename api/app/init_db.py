@@ -3,7 +3,7 @@ Initialize database with admin user
 Run this script to create initial admin user
 """
 from sqlalchemy.orm import Session
-from .core.database import SessionLocal, engine, Base
+from .core.database import SessionLocal, engine, Base, ensure_schema
 from .core.security import get_password_hash
 from .core.config import settings
 from .models.admin import AdminUser
@@ -11,8 +11,9 @@ from .models.admin import AdminUser
 
 def init_db():
     """Initialize database with tables and admin user"""
-    # Create all tables
+    # Create all tables and migrate them before any API worker starts
     Base.metadata.create_all(bind=engine)
+    ensure_schema()
 
     db = SessionLocal()
     try:
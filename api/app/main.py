@@ -4,8 +4,20 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pathlib import Path
 from .core.config import settings
-from .core.database import engine, Base, ensure_schema
+from .core.serialization import FastJSONResponse
+from .core.database import engine, Base, ensure_schema, SessionLocal
 from .routes import auth, candidates, events, display, websocket, event_management
+from .services.tally_engine import tally_engine
+from .services.vote_pipeline import vote_pipeline
+from .services.event_cache import event_cache
+from .services.display_state import display_tracker
+from .services.broadcast_bus import broadcast_bus
+from .services.timer_service import timer_service
+from .services.admission import admission
+from .services.replay_buffer import replay_buffer
+from .services.welcome_cache import welcome_cache
+from .services.http_cache import http_cache
+from .services.export_renderer import export_renderer
 
 # Create database tables and apply lightweight migrations
 Base.metadata.create_all(bind=engine)
@@ -14,7 +26,8 @@ ensure_schema()
 app = FastAPI(
     title="Real-Time Voting System API",
     description="FastAPI backend for real-time voting with WebSocket support",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware - origins derived from SERVER_HOST, API_PORT, WEB_PORT
@@ -61,6 +74,24 @@ app.include_router(display.router)
 app.include_router(websocket.router)
 
 
+@app.on_event("startup")
+async def start_background_services():
+    await broadcast_bus.start()
+    tally_engine.start(SessionLocal)
+    vote_pipeline.start()
+    await timer_service.start()
+    admission.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_services():
+    await admission.stop()
+    await vote_pipeline.stop()
+    await tally_engine.stop()
+    await broadcast_bus.stop()
+    export_renderer.shutdown()
+
+
 @app.get("/")
 def root():
     return {
@@ -100,6 +131,17 @@ def websocket_stats():
 
     # Get connection stats
     stats = manager.get_connection_stats()
+    stats["tally_engine"] = tally_engine.get_stats()
+    stats["vote_pipeline"] = vote_pipeline.get_stats()
+    stats["event_cache"] = event_cache.get_stats()
+    stats["display"] = display_tracker.get_stats()
+    stats["broadcast_bus"] = broadcast_bus.get_stats()
+    stats["timers"] = timer_service.get_stats()
+    stats["admission"] = admission.get_stats()
+    stats["replay"] = replay_buffer.get_stats()
+    stats["welcome"] = welcome_cache.get_stats()
+    stats["http_cache"] = http_cache.get_stats()
+    stats["exports"] = export_renderer.get_stats()
 
     # Add system resource info
     stats["system"] = {
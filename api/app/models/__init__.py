@@ -2,6 +2,10 @@ from .admin import AdminUser
 from .candidate import Candidate
 from .event import Event, EventCandidate
 from .vote import Vote
+from .voter import EventVoter
 from .display import DisplayState
+from .timer import TimerLease
+from .tally import EventCandidateTally
+from .snapshot import ResultsSnapshot
 
-__all__ = ["AdminUser", "Candidate", "Event", "EventCandidate", "Vote", "DisplayState"]
+__all__ = ["AdminUser", "Candidate", "Event", "EventCandidate", "Vote", "EventVoter", "DisplayState", "TimerLease", "EventCandidateTally", "ResultsSnapshot"]
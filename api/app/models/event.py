@@ -22,6 +22,7 @@ class Event(Base):
     start_time = Column(DateTime, nullable=True)
     end_time = Column(DateTime, nullable=True)
     current_candidate_index = Column(Integer, default=0)  # For sequential voting
+    unique_voters = Column(Integer, default=0)  # Distinct voters across the event (see EventVoter)
 
     # Relationships
     event_candidates = relationship("EventCandidate", back_populates="event")
@@ -38,6 +39,7 @@ class EventCandidate(Base):
     order = Column(Integer, default=0)  # Order for sequential voting
     status = Column(String, default="pending")  # pending, active, completed
     timer_started_at = Column(DateTime, nullable=True)  # When timer was started for this candidate
+    timer_duration_sec = Column(Integer, nullable=True)  # Duration the timer was started with (defaults to event.duration_sec)
     candidate_group = Column(String, nullable=True)  # Group identifier for grouped voting
     participant_count = Column(Integer, default=0)  # Number of unique participants who voted
 
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, Text, LargeBinary, DateTime, ForeignKey
+from sqlalchemy.orm import deferred
+from datetime import datetime
+from ..core.database import Base
+
+
+class ResultsSnapshot(Base):
+    """Results of a finished/archived event, frozen so reads skip the aggregation."""
+    __tablename__ = "results_snapshots"
+
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    results = Column(Text, nullable=False)  # JSON {"results": [...], "total_votes": n}
+    # Pre-rendered Word export (None when there are no results); loaded only when needed
+    docx = deferred(Column(LargeBinary, nullable=True))
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from ..core.database import Base
+
+
+class EventCandidateTally(Base):
+    """Vote counts per event candidate, split over a few shard rows.
+
+    Incremented in the same transaction as the votes; the real count is the
+    sum over shards. ``version`` grows with every increment of the row, so a
+    counter loaded from the table can tell which increments it already holds.
+    """
+    __tablename__ = "event_candidate_tallies"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
+    shard = Column(Integer, nullable=False, default=0)
+    yes_votes = Column(Integer, nullable=False, default=0)
+    no_votes = Column(Integer, nullable=False, default=0)
+    neutral_votes = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("uq_event_candidate_tallies_shard", "event_id", "candidate_id", "shard", unique=True),
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from ..core.database import Base
+
+
+class TimerLease(Base):
+    """Claim row for one timer expiry; the unique key lets exactly one process fire it."""
+    __tablename__ = "timer_leases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_candidate_id = Column(Integer, ForeignKey("event_candidates.id"), nullable=False)
+    timer_started_at = Column(DateTime, nullable=False)  # Naive UTC, identifies the timer run
+    owner = Column(String, nullable=False)  # Worker that fired the expiry
+    claimed_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("uq_timer_leases_timer", "event_candidate_id", "timer_started_at", unique=True),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.database import Base
@@ -13,6 +13,7 @@ class Vote(Base):
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
     ip_address = Column(String, nullable=False)
     device_id = Column(String, nullable=True)  # Device fingerprint for multi-device voting
+    voter_key = Column(String, nullable=True)  # "<ip>_<device_id>", unique per candidate
     nonce = Column(String, nullable=False)
     vote_type = Column(String, nullable=False)  # 'yes', 'no', 'neutral'
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -21,3 +22,17 @@ class Vote(Base):
     event = relationship("Event", back_populates="votes")
     event_candidate = relationship("EventCandidate", back_populates="votes")
     candidate = relationship("Candidate")
+
+    __table_args__ = (
+        # One vote per voter per candidate, enforced by INSERT ... ON CONFLICT
+        Index("uq_votes_voter_key", "event_id", "candidate_id", "voter_key", unique=True),
+    )
+
+
+def make_voter_key(ip_address: str, device_id: str | None) -> str:
+    """Identity used for duplicate-vote protection and participant counting.
+
+    A vote without a device id is also refused when its IP already voted for
+    the candidate from any device (checked by the vote pipeline).
+    """
+    return f"{ip_address}_{device_id or ''}"
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from ..core.database import Base
+
+
+class EventVoter(Base):
+    """Insert-once registry of voters per event, drives Event.unique_voters."""
+    __tablename__ = "event_voters"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    voter_key = Column(String, nullable=False)  # Same key as Vote.voter_key
+    first_seen = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("uq_event_voters_event_voter", "event_id", "voter_key", unique=True),
+    )
@@ -11,6 +11,7 @@ from ..core.dependencies import get_current_user
 from ..core.config import settings
 from ..models.candidate import Candidate
 from ..models.admin import AdminUser
+from ..services.event_cache import event_cache
 
 router = APIRouter(prefix="/candidates", tags=["Candidates"])
 
@@ -159,6 +160,7 @@ async def sync_candidates_from_api(
             synced_count += 1
 
         db.commit()
+        event_cache.invalidate_all()
         return {"message": f"Synced {synced_count} candidates", "count": synced_count}
 
     except httpx.HTTPError as e:
@@ -235,6 +237,7 @@ def update_candidate(
             setattr(candidate, key, value)
 
     db.commit()
+    event_cache.invalidate_all()
     db.refresh(candidate)
     return candidate
 
@@ -301,4 +304,5 @@ def delete_candidate(
 
     db.delete(candidate)
     db.commit()
+    event_cache.invalidate_all()
     return {"message": "Candidate deleted successfully"}
@@ -1,16 +1,26 @@
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from pydantic import BaseModel
-from ..core.database import get_db
+from ..core.database import get_db, get_async_db
 from ..core.dependencies import get_current_user
 from ..models.event import Event, EventCandidate, EventStatus
 from ..models.candidate import Candidate
 from ..models.display import DisplayState
 from ..models.admin import AdminUser
 from ..models.vote import Vote
+from ..models.timer import TimerLease
 from ..services.websocket_manager import manager
+from ..services.tally_engine import tally_engine
+from ..services.voter_registry import rebuild_event_voters
+from ..services.tally_summary import clear_tallies
+from ..services.results_snapshot import freeze_results, invalidate_results
+from ..services.event_cache import event_cache
+from ..services.timer_service import timer_service
+from ..services.http_cache import http_cache
 
 router = APIRouter(prefix="/event-management", tags=["Event Management"])
 
@@ -77,7 +87,9 @@ def reorder_event_candidates(
         if event_candidate:
             event_candidate.order = new_order
 
+    invalidate_results(db, event_id)
     db.commit()
+    event_cache.invalidate(event_id)
     return {"message": "Candidates reordered successfully"}
 
 
@@ -85,23 +97,25 @@ def reorder_event_candidates(
 async def set_current_candidate(
     event_id: int,
     candidate_index: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """Set current candidate to a specific index (allows going back to previous candidates)"""
     from ..services.websocket_manager import manager
-    from ..routes.websocket import get_current_voting_candidate, build_display_update_payload
+    from ..routes.websocket import get_current_voting_candidate, load_display_update_payload
 
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    event_candidates = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id
-    ).order_by(EventCandidate.order).all()
+    event_candidates = (await db.scalars(
+        select(EventCandidate).where(
+            EventCandidate.event_id == event_id
+        ).order_by(EventCandidate.order)
+    )).all()
 
     total_candidates = len(event_candidates)
 
@@ -128,30 +142,34 @@ async def set_current_candidate(
     event.current_candidate_index = candidate_index
 
     # Update event status if needed
-    if event.status == EventStatus.finished:
+    reactivated = event.status == EventStatus.finished
+    if reactivated:
         event.status = EventStatus.active
 
     # Cancel any running timer
-    manager.cancel_timer(event.link)
+    timer_service.cancel(event.link)
 
     # Reset display state until the timer is started again
-    display_state = db.query(DisplayState).filter(DisplayState.event_id == event_id).first()
+    display_state = await db.scalar(select(DisplayState).where(DisplayState.event_id == event_id))
     if display_state:
         display_state.current_candidate_id = None
         display_state.countdown_until = None
 
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    event_cache.invalidate(event_id)
+
+    if reactivated:
+        await db.run_sync(tally_engine.seed, event_id)
 
     # Broadcast new candidate to all connected vote clients
-    current_candidate = get_current_voting_candidate(db, event_id)
+    current_candidate = await db.run_sync(get_current_voting_candidate, event_id)
     await manager.broadcast_vote(event.link, {
         "type": "current_candidate",
         "data": current_candidate
     })
 
     # Broadcast to display screens
-    display_payload = build_display_update_payload(db, event)
+    display_payload = await db.run_sync(load_display_update_payload, event_id)
     await manager.broadcast_display(event.link, display_payload)
 
     return {
@@ -164,23 +182,25 @@ async def set_current_candidate(
 @router.post("/{event_id}/next-candidate")
 async def move_to_next_candidate(
     event_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """Move to next candidate in sequential voting"""
     from ..services.websocket_manager import manager
-    from ..routes.websocket import get_current_voting_candidate, build_display_update_payload
+    from ..routes.websocket import get_current_voting_candidate, load_display_update_payload
 
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    event_candidates = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id
-    ).order_by(EventCandidate.order).all()
+    event_candidates = (await db.scalars(
+        select(EventCandidate).where(
+            EventCandidate.event_id == event_id
+        ).order_by(EventCandidate.order)
+    )).all()
 
     total_candidates = len(event_candidates)
 
@@ -203,6 +223,12 @@ async def move_to_next_candidate(
                 if ec.candidate_group == current_group:
                     ec.status = "completed"
 
+    # Vote totals per candidate from the in-memory tally engine
+    vote_totals = await db.run_sync(lambda sync_db: {
+        ec.candidate_id: tally_engine.get(sync_db, event_id, ec.candidate_id)["total"]
+        for ec in event_candidates
+    })
+
     # Helper function to check if a candidate or group has votes
     def has_votes(candidate_id: int, group_name: str = None) -> bool:
         if group_name:
@@ -211,18 +237,10 @@ async def move_to_next_candidate(
                 ec.candidate_id for ec in event_candidates
                 if ec.candidate_group == group_name
             ]
-            vote_count = db.query(Vote).filter(
-                Vote.event_id == event_id,
-                Vote.candidate_id.in_(group_candidate_ids)
-            ).count()
-            return vote_count > 0
+            return any(vote_totals.get(cid, 0) > 0 for cid in group_candidate_ids)
         else:
             # Check if this candidate has votes
-            vote_count = db.query(Vote).filter(
-                Vote.event_id == event_id,
-                Vote.candidate_id == candidate_id
-            ).count()
-            return vote_count > 0
+            return vote_totals.get(candidate_id, 0) > 0
 
     # Advance to the next candidate or finish the event
     # Skip candidates that already have votes and candidates in the same group as current
@@ -270,26 +288,29 @@ async def move_to_next_candidate(
         event.current_candidate_index = total_candidates  # prevent out-of-range lookups
 
     # Cancel any running timer
-    manager.cancel_timer(event.link)
+    timer_service.cancel(event.link)
+
+    if event.status == EventStatus.finished:
+        await db.run_sync(freeze_results, event_id, False)
 
     # Reset display state until the timer is started again
-    display_state = db.query(DisplayState).filter(DisplayState.event_id == event_id).first()
+    display_state = await db.scalar(select(DisplayState).where(DisplayState.event_id == event_id))
     if display_state:
         display_state.current_candidate_id = None
         display_state.countdown_until = None
 
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    event_cache.invalidate(event_id)
 
     # Broadcast new candidate to all connected vote clients
-    current_candidate = get_current_voting_candidate(db, event_id)
+    current_candidate = await db.run_sync(get_current_voting_candidate, event_id)
     await manager.broadcast_vote(event.link, {
         "type": "current_candidate",
         "data": current_candidate
     })
 
     # Broadcast to display screens
-    display_payload = build_display_update_payload(db, event)
+    display_payload = await db.run_sync(load_display_update_payload, event_id)
     await manager.broadcast_display(event.link, display_payload)
 
     return {
@@ -303,7 +324,7 @@ async def move_to_next_candidate(
 async def start_candidate_timer(
     event_id: int,
     data: Optional[StartTimerRequest] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """Start or restart the countdown for the current candidate"""
@@ -311,10 +332,10 @@ async def start_candidate_timer(
     from ..routes.websocket import (
         get_current_voting_candidate,
         get_candidate_vote_tally,
-        build_display_update_payload,
+        load_display_update_payload,
     )
 
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -327,9 +348,11 @@ async def start_candidate_timer(
             detail="Event must be active to start the timer"
         )
 
-    event_candidates = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id
-    ).order_by(EventCandidate.order).all()
+    event_candidates = (await db.scalars(
+        select(EventCandidate).where(
+            EventCandidate.event_id == event_id
+        ).order_by(EventCandidate.order)
+    )).all()
 
     if not event_candidates:
         raise HTTPException(
@@ -354,7 +377,10 @@ async def start_candidate_timer(
         )
 
     now = datetime.now(timezone.utc)
-    current_ec.timer_started_at = now
+    # The DateTime columns are naive UTC; asyncpg rejects aware values for them
+    stored_now = now.replace(tzinfo=None)
+    current_ec.timer_started_at = stored_now
+    current_ec.timer_duration_sec = duration_sec
     current_ec.status = "active"
 
     # Ensure previous candidates are marked as completed
@@ -365,70 +391,36 @@ async def start_candidate_timer(
             ec.status = "pending"
 
     # Update display state countdown
-    display_state = db.query(DisplayState).filter(DisplayState.event_id == event_id).first()
+    display_state = await db.scalar(select(DisplayState).where(DisplayState.event_id == event_id))
     if not display_state:
         display_state = DisplayState(event_id=event_id)
         db.add(display_state)
     display_state.current_candidate_id = current_ec.candidate_id
-    display_state.countdown_until = now + timedelta(seconds=duration_sec)
+    display_state.countdown_until = stored_now + timedelta(seconds=duration_sec)
 
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    event_cache.invalidate(event_id)
 
     event_link = event.link
 
-    current_candidate = get_current_voting_candidate(db, event_id)
+    current_candidate = await db.run_sync(get_current_voting_candidate, event_id)
     await manager.broadcast_vote(event_link, {
         "type": "current_candidate",
         "data": current_candidate
     })
 
     if current_candidate and current_candidate.get("candidate"):
-        tally = get_candidate_vote_tally(db, event.id, current_candidate["candidate"]["id"])
+        tally = await db.run_sync(get_candidate_vote_tally, event.id, current_candidate["candidate"]["id"])
         await manager.broadcast_vote(event_link, {
             "type": "tally_update",
             "data": tally
         })
 
-    display_payload = build_display_update_payload(db, event)
+    display_payload = await db.run_sync(load_display_update_payload, event_id)
     await manager.broadcast_display(event_link, display_payload)
 
     # Schedule server-side timer expiry
-    async def on_timer_expired():
-        """Broadcast timer_expired to all clients when voting time ends."""
-        from ..core.database import SessionLocal
-        timer_db = SessionLocal()
-        try:
-            ev = timer_db.query(Event).filter(Event.id == event_id).first()
-            if not ev or ev.status != EventStatus.active:
-                return
-
-            # Re-check that the timer actually expired (wasn't restarted)
-            ecs = timer_db.query(EventCandidate).filter(
-                EventCandidate.event_id == event_id
-            ).order_by(EventCandidate.order).all()
-            if ev.current_candidate_index >= len(ecs):
-                return
-            ec = ecs[ev.current_candidate_index]
-            if ec.timer_started_at != now:
-                # Timer was restarted, this expiry is stale
-                return
-
-            # Broadcast timer_expired to vote clients
-            await manager.broadcast_vote(event_link, {
-                "type": "timer_expired",
-                "candidate_id": ec.candidate_id,
-            })
-
-            # Refresh display with updated timer state
-            ev_fresh = timer_db.query(Event).filter(Event.id == event_id).first()
-            if ev_fresh:
-                dp = build_display_update_payload(timer_db, ev_fresh)
-                await manager.broadcast_display(event_link, dp)
-        finally:
-            timer_db.close()
-
-    manager.schedule_timer_expiry(event_link, duration_sec, on_timer_expired)
+    timer_service.arm(event_id, event_link, current_ec.id, now, duration_sec)
 
     return {
         "message": "Timer started",
@@ -438,18 +430,35 @@ async def start_candidate_timer(
 
 
 @router.get("/{event_id}/current-candidate")
-def get_current_candidate(event_id: int, db: Session = Depends(get_db)):
+def get_current_candidate(event_id: int, request: Request, db: Session = Depends(get_db)):
     """Get current candidate for sequential voting (public)"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = event_cache.get(db, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    from ..routes.websocket import get_current_voting_candidate
+    from ..routes.websocket import get_current_voting_candidate, compute_timer_info
+
+    # The body only changes with the event structure and when the timer runs
+    # out; it carries no timer.remaining_ms, clients count down from
+    # timer.ends_at_ts
+    current_entry = event.current_entry()
+    timer_running = bool(current_entry and compute_timer_info(event, current_entry)["running"])
+    state = ("current_candidate", event_id, event.fingerprint, timer_running)
+
+    def build():
+        current_candidate = get_current_voting_candidate(db, event_id)
+        timer = (current_candidate or {}).get("timer")
+        if timer:
+            current_candidate = {
+                **current_candidate,
+                "timer": {key: value for key, value in timer.items() if key != "remaining_ms"},
+            }
+        return current_candidate
 
-    return get_current_voting_candidate(db, event_id)
+    return http_cache.respond(request, state, build)
 
 
 @router.post("/{event_id}/add-candidate/{candidate_id}")
@@ -500,7 +509,9 @@ def add_candidate_to_event(
         status="pending"
     )
     db.add(event_candidate)
+    invalidate_results(db, event_id)
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event_candidate)
 
     return {"message": "Candidate added successfully", "event_candidate": event_candidate}
@@ -537,6 +548,7 @@ def remove_candidate_from_event(
     removed_order = event_candidate.order
 
     # Delete
+    db.query(TimerLease).filter(TimerLease.event_candidate_id == event_candidate.id).delete(synchronize_session=False)
     db.delete(event_candidate)
 
     # Reorder remaining candidates
@@ -548,7 +560,9 @@ def remove_candidate_from_event(
     for ec in remaining:
         ec.order -= 1
 
+    invalidate_results(db, event_id)
     db.commit()
+    event_cache.invalidate(event_id)
 
     return {"message": "Candidate removed successfully"}
 
@@ -601,6 +615,7 @@ def set_candidate_group(
         event_candidate.candidate_group = request.group_name
 
     db.commit()
+    event_cache.invalidate(event_id)
 
     return {"message": f"Group '{request.group_name}' assigned to {len(request.event_candidate_ids)} candidates"}
 
@@ -626,6 +641,7 @@ def unset_candidate_group(
 
     event_candidate.candidate_group = None
     db.commit()
+    event_cache.invalidate(event_id)
 
     return {"message": "Group assignment removed"}
 
@@ -634,12 +650,12 @@ def unset_candidate_group(
 async def clear_candidate_votes(
     event_id: int,
     candidate_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """Clear all votes for a specific candidate in an event"""
     # Verify event exists
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -647,10 +663,12 @@ async def clear_candidate_votes(
         )
 
     # Verify candidate exists in this event
-    event_candidate = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id,
-        EventCandidate.candidate_id == candidate_id
-    ).first()
+    event_candidate = await db.scalar(
+        select(EventCandidate).where(
+            EventCandidate.event_id == event_id,
+            EventCandidate.candidate_id == candidate_id
+        )
+    )
 
     if not event_candidate:
         raise HTTPException(
@@ -659,17 +677,26 @@ async def clear_candidate_votes(
         )
 
     # Delete all votes for this candidate in this event
-    deleted_count = db.query(Vote).filter(
-        Vote.event_id == event_id,
-        Vote.candidate_id == candidate_id
-    ).delete(synchronize_session=False)
+    deleted_count = (await db.execute(
+        delete(Vote).where(
+            Vote.event_id == event_id,
+            Vote.candidate_id == candidate_id
+        )
+    )).rowcount
+
+    # Voters who only voted for this candidate drop out of the event count
+    await db.run_sync(rebuild_event_voters, event_id)
+    await db.run_sync(clear_tallies, event_id, [candidate_id])
+    await db.run_sync(invalidate_results, event_id)
 
     # Reset candidate status to pending and participant count
     event_candidate.status = "pending"
     event_candidate.timer_started_at = None
     event_candidate.participant_count = 0
 
-    db.commit()
+    await db.commit()
+    event_cache.invalidate(event_id)
+    tally_engine.reset_candidates(event_id, [candidate_id])
 
     # Broadcast votes cleared event to reset hasVoted state for this candidate
     await manager.broadcast_vote(event.link, {
@@ -678,13 +705,16 @@ async def clear_candidate_votes(
     })
 
     # Broadcast updated tally (now all zeros) to update vote counts in real-time
-    from ..routes.websocket import get_candidate_vote_tally
-    tally = get_candidate_vote_tally(db, event_id, candidate_id)
+    from ..routes.websocket import get_candidate_vote_tally, load_display_update_payload
+    tally = await db.run_sync(get_candidate_vote_tally, event_id, candidate_id)
     await manager.broadcast_vote(event.link, {
         "type": "tally_update",
         "data": tally
     })
 
+    display_payload = await db.run_sync(load_display_update_payload, event_id)
+    await manager.broadcast_display(event.link, display_payload)
+
     return {
         "message": f"Cleared {deleted_count} votes for candidate",
         "deleted_count": deleted_count
@@ -695,12 +725,12 @@ async def clear_candidate_votes(
 async def clear_group_votes(
     event_id: int,
     group_name: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """Clear all votes for all candidates in a group"""
     # Verify event exists
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -708,10 +738,12 @@ async def clear_group_votes(
         )
 
     # Get all candidates in this group
-    group_candidates = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id,
-        EventCandidate.candidate_group == group_name
-    ).all()
+    group_candidates = (await db.scalars(
+        select(EventCandidate).where(
+            EventCandidate.event_id == event_id,
+            EventCandidate.candidate_group == group_name
+        )
+    )).all()
 
     if not group_candidates:
         raise HTTPException(
@@ -723,10 +755,17 @@ async def clear_group_votes(
     candidate_ids = [ec.candidate_id for ec in group_candidates]
 
     # Delete all votes for these candidates in this event
-    deleted_count = db.query(Vote).filter(
-        Vote.event_id == event_id,
-        Vote.candidate_id.in_(candidate_ids)
-    ).delete(synchronize_session=False)
+    deleted_count = (await db.execute(
+        delete(Vote).where(
+            Vote.event_id == event_id,
+            Vote.candidate_id.in_(candidate_ids)
+        )
+    )).rowcount
+
+    # Voters who only voted for this group drop out of the event count
+    await db.run_sync(rebuild_event_voters, event_id)
+    await db.run_sync(clear_tallies, event_id, candidate_ids)
+    await db.run_sync(invalidate_results, event_id)
 
     # Reset all group candidates' status to pending and participant count
     for ec in group_candidates:
@@ -734,7 +773,9 @@ async def clear_group_votes(
         ec.timer_started_at = None
         ec.participant_count = 0
 
-    db.commit()
+    await db.commit()
+    event_cache.invalidate(event_id)
+    tally_engine.reset_candidates(event_id, candidate_ids)
 
     # Broadcast votes cleared event to reset hasVoted state for group candidates
     await manager.broadcast_vote(event.link, {
@@ -744,14 +785,17 @@ async def clear_group_votes(
     })
 
     # Broadcast updated tally for each candidate in the group
-    from ..routes.websocket import get_candidate_vote_tally
+    from ..routes.websocket import get_candidate_vote_tally, load_display_update_payload
     for candidate_id in candidate_ids:
-        tally = get_candidate_vote_tally(db, event_id, candidate_id)
+        tally = await db.run_sync(get_candidate_vote_tally, event_id, candidate_id)
         await manager.broadcast_vote(event.link, {
             "type": "tally_update",
             "data": tally
         })
 
+    display_payload = await db.run_sync(load_display_update_payload, event_id)
+    await manager.broadcast_display(event.link, display_payload)
+
     return {
         "message": f"Cleared {deleted_count} votes for group '{group_name}'",
         "deleted_count": deleted_count,
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
-from datetime import datetime
+from datetime import datetime, timedelta
 from urllib.parse import quote
 import uuid
 from ..core.database import get_db
@@ -12,9 +12,21 @@ from ..models.event import Event, EventCandidate, EventStatus
 from ..models.candidate import Candidate
 from ..models.display import DisplayState
 from ..models.vote import Vote
+from ..models.voter import EventVoter
+from ..models.timer import TimerLease
+from ..models.snapshot import ResultsSnapshot
 from ..models.admin import AdminUser
 from ..services.event_results import calculate_event_results
-from ..services.word_export import generate_results_word
+from ..services.export_renderer import export_renderer
+from ..services.vote_export import stream_votes
+from ..services.tally_engine import tally_engine
+from ..services.voter_registry import clear_event_voters
+from ..services.tally_summary import clear_tallies
+from ..services.results_snapshot import (
+    CLOSED_STATUSES, freeze_results, get_frozen_results, snapshot_results, invalidate_results
+)
+from ..services.event_cache import EventSnapshot, event_cache
+from ..services.http_cache import http_cache
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
@@ -115,7 +127,11 @@ def start_event(
     event.status = EventStatus.active
     event.start_time = datetime.utcnow()
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event)
+
+    # Load vote counters into memory so live tallies cost no queries
+    tally_engine.seed(db, event_id)
     return event
 
 
@@ -139,13 +155,12 @@ def stop_event(
             detail=f"Event is not active"
         )
 
-    # Cancel any running timer
-    from ..services.websocket_manager import manager
-    manager.cancel_timer(event.link)
-
     event.status = EventStatus.finished
     event.end_time = datetime.utcnow()
+    clear_running_timers(db, event)
+    freeze_results(db, event_id)
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event)
     return event
 
@@ -173,73 +188,113 @@ def archive_event(
     event.status = EventStatus.archived
     if not event.end_time:
         event.end_time = datetime.utcnow()
+    clear_running_timers(db, event)
+    freeze_results(db, event_id)
 
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event)
     return event
 
 
-@router.get("/{event_id}/results")
-def get_event_results(event_id: int, db: Session = Depends(get_db)):
-    """Get voting results for an event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+def clear_running_timers(db: Session, event: Event):
+    """Clear a still running candidate timer when the event closes; the caller commits.
+
+    Votes are only accepted while the timer runs, so this keeps them from
+    landing after the results were frozen.
+    """
+    from ..services.timer_service import timer_service
+    timer_service.cancel(event.link)
+
+    now = datetime.utcnow()
+    started = db.query(EventCandidate).filter(
+        EventCandidate.event_id == event.id,
+        EventCandidate.timer_started_at.isnot(None)
+    ).all()
+    for ec in started:
+        duration_sec = ec.timer_duration_sec or event.duration_sec or 0
+        if ec.timer_started_at + timedelta(seconds=duration_sec) > now:
+            ec.timer_started_at = None
+
+    display_state = db.query(DisplayState).filter(DisplayState.event_id == event.id).first()
+    if display_state:
+        display_state.countdown_until = None
+
+
+def respond_with_results(request: Request, db: Session, event: EventSnapshot | None):
+    """Results response, validated by the event's snapshot fingerprint and vote counts."""
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    results, total_votes = calculate_event_results(db, event_id)
-    return {
-        "event_id": event_id,
-        "event_name": event.name,
-        "status": event.status,
-        "total_votes": total_votes,
-        "results": results
-    }
+    frozen = event.status in CLOSED_STATUSES
+    if frozen:
+        # Closed events serve their snapshot, which is re-frozen after a vote clear
+        frozen_at = db.query(ResultsSnapshot.created_at).filter(
+            ResultsSnapshot.event_id == event.id
+        ).scalar()
+        if frozen_at is None:
+            frozen_at = get_frozen_results(db, event.id).created_at
+        state = ("results", event.id, event.fingerprint, "frozen", frozen_at)
+    else:
+        state = ("results", event.id, event.fingerprint, tally_engine.counts_key(db, event.id))
+
+    def build():
+        if frozen:
+            results, total_votes = snapshot_results(get_frozen_results(db, event.id))
+        else:
+            results, total_votes = calculate_event_results(db, event.id)
+        return {
+            "event_id": event.id,
+            "event_name": event.name,
+            "status": event.status,
+            "total_votes": total_votes,
+            "results": results
+        }
+
+    return http_cache.respond(request, state, build)
+
+
+@router.get("/{event_id}/results")
+def get_event_results(event_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get voting results for an event"""
+    return respond_with_results(request, db, event_cache.get(db, event_id))
 
 
 @router.get("/by-link/{link}/results")
-def get_event_results_by_link(link: str, db: Session = Depends(get_db)):
+def get_event_results_by_link(link: str, request: Request, db: Session = Depends(get_db)):
     """Get voting results for an event by its public link"""
-    event = db.query(Event).filter(Event.link == link).first()
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found"
-        )
-
-    results, total_votes = calculate_event_results(db, event.id)
-    return {
-        "event_id": event.id,
-        "event_name": event.name,
-        "status": event.status,
-        "total_votes": total_votes,
-        "results": results
-    }
+    return respond_with_results(request, db, event_cache.get_by_link(db, link))
 
 
 @router.get("/by-link/{link}", response_model=EventWithCandidates)
-def get_event_by_link(link: str, db: Session = Depends(get_db)):
+def get_event_by_link(link: str, request: Request, db: Session = Depends(get_db)):
     """Get event by link (public endpoint)"""
-    event = db.query(Event).filter(Event.link == link).first()
-    if not event:
+    snapshot = event_cache.get_by_link(db, link)
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    # Get event candidates
-    candidates = db.query(Candidate).join(
-        EventCandidate, EventCandidate.candidate_id == Candidate.id
-    ).filter(
-        EventCandidate.event_id == event.id
-    ).all()
+    def build():
+        event = db.query(Event).filter(Event.id == snapshot.id).first()
 
-    return {
-        **event.__dict__,
-        "candidates": candidates
-    }
+        # Get event candidates
+        candidates = db.query(Candidate).join(
+            EventCandidate, EventCandidate.candidate_id == Candidate.id
+        ).filter(
+            EventCandidate.event_id == event.id
+        ).all()
+
+        return EventWithCandidates.model_validate({
+            **event.__dict__,
+            "candidates": candidates
+        }).model_dump(mode="json")
+
+    return http_cache.respond(request, ("event", snapshot.id, snapshot.fingerprint), build)
 
 
 @router.get("", response_model=List[EventResponse])
@@ -295,6 +350,44 @@ def get_event(
     }
 
 
+def results_word_response(db: Session, event: Event):
+    """Word export of an event's results, rendered off the request thread and cached per results version."""
+    if event.status in CLOSED_STATUSES:
+        snapshot = get_frozen_results(db, event.id)
+        version = ("frozen", snapshot.created_at)
+
+        def load():
+            if snapshot.docx:
+                return snapshot.docx
+            results, total_participants = snapshot_results(snapshot)
+            return (event.name, results, total_participants) if results else None
+    else:
+        if not tally_engine.is_loaded(event.id):
+            tally_engine.seed(db, event.id)
+        version = (event_cache.version(event.id), tally_engine.generation(event.id))
+
+        def load():
+            results, total_participants = calculate_event_results(db, event.id)
+            return (event.name, results, total_participants) if results else None
+
+    path = export_renderer.get(event.id, version, load)
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No results available for this event"
+        )
+
+    # Create filename
+    filename = f"{event.name.replace(' ', '_')}_natijalar.docx"
+    encoded_filename = quote(filename)
+
+    return FileResponse(
+        path,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"}
+    )
+
+
 @router.get("/{event_id}/results/download")
 def download_event_results(
     event_id: int,
@@ -309,26 +402,7 @@ def download_event_results(
             detail="Event not found"
         )
 
-    results, total_participants = calculate_event_results(db, event_id)
-
-    if not results:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No results available for this event"
-        )
-
-    # Generate Word document
-    buffer = generate_results_word(event.name, results, total_participants)
-
-    # Create filename
-    filename = f"{event.name.replace(' ', '_')}_natijalar.docx"
-    encoded_filename = quote(filename)
-
-    return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"}
-    )
+    return results_word_response(db, event)
 
 
 @router.get("/by-link/{link}/results/download")
@@ -341,24 +415,35 @@ def download_event_results_by_link(link: str, db: Session = Depends(get_db)):
             detail="Event not found"
         )
 
-    results, total_participants = calculate_event_results(db, event.id)
+    return results_word_response(db, event)
+
 
-    if not results:
+@router.get("/{event_id}/votes/export")
+def export_event_votes(
+    event_id: int,
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+    current_user: AdminUser = Depends(get_current_user)
+):
+    """Stream the raw votes of an event as CSV or NDJSON for auditing (admin only)"""
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No results available for this event"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
         )
 
-    # Generate Word document
-    buffer = generate_results_word(event.name, results, total_participants)
-
-    # Create filename
-    filename = f"{event.name.replace(' ', '_')}_natijalar.docx"
+    filename = f"{event.name.replace(' ', '_')}_ovozlar.{export_format}"
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
     encoded_filename = quote(filename)
 
     return StreamingResponse(
-        buffer,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        stream_votes(event.id, export_format, gzip=gzip),
+        media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"}
     )
 
@@ -438,6 +523,14 @@ def reset_event(
 
     # Delete all votes for this event
     db.query(Vote).filter(Vote.event_id == event_id).delete(synchronize_session=False)
+    clear_event_voters(db, event_id)
+    clear_tallies(db, event_id)
+    invalidate_results(db, event_id)
+
+    # Reset participant counts
+    db.query(EventCandidate).filter(
+        EventCandidate.event_id == event_id
+    ).update({"participant_count": 0}, synchronize_session=False)
 
     # Reset event_candidates timer_started_at
     db.query(EventCandidate).filter(
@@ -457,7 +550,9 @@ def reset_event(
         display_state.timer_started_at = None
 
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event)
+    tally_engine.reset_event(event_id)
     return event
 
 
@@ -478,11 +573,15 @@ def update_event(
 
     # Update fields if provided
     if event_update.name is not None:
+        if event_update.name != event.name:
+            # The frozen Word export carries the event name in its title
+            invalidate_results(db, event_id)
         event.name = event_update.name
     if event_update.duration_sec is not None:
         event.duration_sec = event_update.duration_sec
 
     db.commit()
+    event_cache.invalidate(event_id)
     db.refresh(event)
     return event
 
@@ -501,12 +600,18 @@ def delete_event(
             detail="Event not found"
         )
 
-    # Remove votes, event candidates, display state
+    # Remove votes, voter registry, event candidates, display state
     db.query(Vote).filter(Vote.event_id == event_id).delete(synchronize_session=False)
+    db.query(EventVoter).filter(EventVoter.event_id == event_id).delete(synchronize_session=False)
+    clear_tallies(db, event_id)
+    invalidate_results(db, event_id)
+    db.query(TimerLease).filter(TimerLease.event_id == event_id).delete(synchronize_session=False)
     db.query(EventCandidate).filter(EventCandidate.event_id == event_id).delete(synchronize_session=False)
     db.query(DisplayState).filter(DisplayState.event_id == event_id).delete(synchronize_session=False)
 
     db.delete(event)
     db.commit()
+    event_cache.invalidate(event_id)
+    tally_engine.drop(event_id)
 
     return {"message": "Event deleted successfully"}
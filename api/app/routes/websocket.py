@@ -1,16 +1,29 @@
+from typing import Tuple
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
-from ..core.database import SessionLocal
+import logging
+from ..core.database import AsyncSessionLocal
+from ..core.serialization import dumps_text, loads
 from ..models.event import Event, EventCandidate, EventStatus
-from ..models.vote import Vote
+from ..models.vote import make_voter_key
 from ..models.candidate import Candidate
 from ..services.websocket_manager import manager
 from ..services.event_results import calculate_event_results
+from ..services.results_snapshot import CLOSED_STATUSES, load_frozen_results
+from ..services.event_cache import EventSnapshot, event_cache
+from ..services.display_state import display_tracker
+from ..services.broadcast_bus import broadcast_bus
+from ..services.tally_engine import tally_engine
+from ..services.vote_pipeline import vote_pipeline
+from ..services.replay_buffer import replay_buffer
+from ..services.welcome_cache import welcome_cache
 
 router = APIRouter(tags=["WebSocket"])
 
+logger = logging.getLogger(__name__)
+
 
 def ensure_utc(dt: datetime | None):
     if not dt:
@@ -61,7 +74,7 @@ def build_related_candidates(event_candidates: list[EventCandidate], target: Can
 
 def compute_timer_info(event: Event, event_candidate: EventCandidate):
     """Calculate timer metadata for the current candidate."""
-    duration_sec = event.duration_sec or 0
+    duration_sec = event_candidate.timer_duration_sec or event.duration_sec or 0
     timer_started_at = ensure_utc(event_candidate.timer_started_at)
     ends_at = None
     remaining_ms = 0
@@ -69,7 +82,7 @@ def compute_timer_info(event: Event, event_candidate: EventCandidate):
 
     if timer_started_at:
         ends_at = timer_started_at + timedelta(seconds=duration_sec)
-        now = datetime.now(timezone.utc)
+        now = manager.clock.now()
         remaining = (ends_at - now).total_seconds()
         if remaining > 0:
             timer_running = True
@@ -83,14 +96,41 @@ def compute_timer_info(event: Event, event_candidate: EventCandidate):
         "duration_sec": duration_sec,
         "started_at": iso_utc(timer_started_at),
         "ends_at": iso_utc(ends_at),
-        "ends_at_ts": int(ends_at.timestamp() * 1000) if ends_at else None,
+        "ends_at_ts": epoch_ms(ends_at) if ends_at else None,
+    }
+
+
+def parse_seq(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def epoch_ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def build_time_sync_reply(data: dict, received_at: datetime) -> dict:
+    """Answer an NTP-style time_sync request.
+
+    The client sends its clock reading as ``client_sent``; with the receive
+    and send times below and its own receive time it estimates the offset
+    to the server clock, so countdowns can run locally against ``ends_at_ts``.
+    """
+    return {
+        "type": "time_sync",
+        "client_sent": data.get("client_sent"),
+        "server_received": epoch_ms(received_at),
+        "server_sent": epoch_ms(manager.clock.now()),
     }
 
 
-def build_display_update_payload(db: Session, event: Event):
+def build_display_update_payload(db: Session, event: EventSnapshot | None):
     """Aggregate display payload so it can be reused across HTTP + WS contexts."""
     base_payload = {
         "type": "display_update",
+        "event_id": event.id if event else None,
         "candidate": None,
         "current_candidate": None,
         "related_candidates": [],
@@ -114,11 +154,7 @@ def build_display_update_payload(db: Session, event: Event):
     if not event:
         return base_payload
 
-    event_candidates = db.query(EventCandidate).options(
-        joinedload(EventCandidate.candidate)
-    ).filter(
-        EventCandidate.event_id == event.id
-    ).order_by(EventCandidate.order).all()
+    event_candidates = event.candidates
 
     total_candidates = len(event_candidates)
     if total_candidates == 0:
@@ -130,7 +166,6 @@ def build_display_update_payload(db: Session, event: Event):
         current_ec = event_candidates[event.current_candidate_index]
         candidate = current_ec.candidate
         timer = compute_timer_info(event, current_ec)
-        vote_results = get_candidate_vote_tally(db, event.id, candidate.id) if candidate else {"yes": 0, "no": 0, "neutral": 0, "total": 0}
 
         candidate_payload = {
             "id": candidate.id,
@@ -142,34 +177,19 @@ def build_display_update_payload(db: Session, event: Event):
 
         related_candidates = build_related_candidates(event_candidates, candidate, current_ec)
 
-        # If grouped, get vote results for each candidate in the group
-        group_results = []
-        if current_ec.candidate_group and len(related_candidates) > 1:
-            for rc in related_candidates:
-                rc_votes = get_candidate_vote_tally(db, event.id, rc["id"])
-                group_results.append({
-                    "candidate": rc,
-                    "votes": rc_votes
-                })
-
         base_payload.update({
             "candidate": candidate_payload,
             "current_candidate": candidate_payload,
             "related_candidates": related_candidates,
-            "group_results": group_results,
             "remaining_ms": timer["remaining_ms"],
             "timer_running": timer["running"],
             "timer": timer,
-            "vote_results": vote_results,
         })
+        base_payload.update(build_display_vote_fields(db, event))
 
-    completed = (
-        event.status in (EventStatus.finished, EventStatus.archived)
-        or event.current_candidate_index >= total_candidates
-    )
-
-    if completed:
-        results, total_votes = calculate_event_results(db, event.id)
+    if is_display_completed(event):
+        frozen = load_frozen_results(db, event.id) if event.status in CLOSED_STATUSES else None
+        results, total_votes = frozen or calculate_event_results(db, event.id)
 
         # Format results for DisplayPage (uses 'votes' and 'percent' fields)
         display_results = []
@@ -192,46 +212,57 @@ def build_display_update_payload(db: Session, event: Event):
     return base_payload
 
 
-def get_candidate_vote_tally(db: Session, event_id: int, candidate_id: int):
-    """Get vote tally for a specific candidate."""
-    yes_count = db.query(func.count(Vote.id)).filter(
-        Vote.event_id == event_id,
-        Vote.candidate_id == candidate_id,
-        Vote.vote_type == 'yes'
-    ).scalar() or 0
-
-    no_count = db.query(func.count(Vote.id)).filter(
-        Vote.event_id == event_id,
-        Vote.candidate_id == candidate_id,
-        Vote.vote_type == 'no'
-    ).scalar() or 0
-
-    neutral_count = db.query(func.count(Vote.id)).filter(
-        Vote.event_id == event_id,
-        Vote.candidate_id == candidate_id,
-        Vote.vote_type == 'neutral'
-    ).scalar() or 0
+def is_display_completed(event: EventSnapshot) -> bool:
+    return (
+        event.status in (EventStatus.finished, EventStatus.archived)
+        or event.current_candidate_index >= len(event.candidates)
+    )
 
-    return {
-        "yes": yes_count,
-        "no": no_count,
-        "neutral": neutral_count,
-        "total": yes_count + no_count + neutral_count
+
+def build_display_vote_fields(db: Session, event: EventSnapshot):
+    """The vote-driven part of the display payload: current tally and group results."""
+    fields = {
+        "vote_results": {"yes": 0, "no": 0, "neutral": 0, "total": 0},
+        "group_results": [],
     }
+    current_ec = event.current_entry()
+    candidate = current_ec.candidate if current_ec else None
+    if not candidate:
+        return fields
+
+    fields["vote_results"] = get_candidate_vote_tally(db, event.id, candidate.id)
+
+    # If grouped, get vote results for each candidate in the group
+    related_candidates = build_related_candidates(event.candidates, candidate, current_ec)
+    if current_ec.candidate_group and len(related_candidates) > 1:
+        for rc in related_candidates:
+            fields["group_results"].append({
+                "candidate": rc,
+                "votes": get_candidate_vote_tally(db, event.id, rc["id"])
+            })
+    return fields
+
+
+def load_display_vote_patch(db: Session, link: str, event_id: int):
+    """Build the display message for a vote: a patch of the vote fields when possible."""
+    event = event_cache.get(db, event_id)
+    if not event or is_display_completed(event) or not display_tracker.can_patch(link, event.version):
+        return build_display_update_payload(db, event)
+    return display_tracker.patch(link, build_display_vote_fields(db, event))
+
+
+def get_candidate_vote_tally(db: Session, event_id: int, candidate_id: int):
+    """Get vote tally for a specific candidate (served from the in-memory tally engine)."""
+    return tally_engine.get(db, event_id, candidate_id)
 
 
 def get_current_voting_candidate(db: Session, event_id: int):
-    """Get current candidate for sequential voting"""
-    db.expire_all()
-    event = db.query(Event).filter(Event.id == event_id).first()
+    """Get current candidate for sequential voting (built from the cached event snapshot)"""
+    event = event_cache.get(db, event_id)
     if not event:
         return None
 
-    event_candidates = db.query(EventCandidate).options(
-        joinedload(EventCandidate.candidate)
-    ).filter(
-        EventCandidate.event_id == event_id
-    ).order_by(EventCandidate.order).all()
+    event_candidates = event.candidates
 
     total = len(event_candidates)
 
@@ -272,86 +303,95 @@ async def websocket_vote_endpoint(websocket: WebSocket, link: str):
     connected = False
     event_id = None
 
-    # Verify event and connect — use short-lived DB session
+    # Verify event and connect — use short-lived async DB session
     try:
-        db = SessionLocal()
-        try:
-            event = db.query(Event).filter(Event.link == link).first()
-            if not event:
-                await websocket.close(code=4004, reason="Event not found")
-                return
-            if event.status not in (EventStatus.active, EventStatus.finished):
-                await websocket.close(code=4003, reason="Event is not available")
-                return
-            event_id = event.id
-        finally:
-            db.close()
-
-        await manager.connect_vote(websocket, link)
+        if not await manager.admit(websocket):
+            return
+
+        event = await resolve_event_link(link)
+        if not event:
+            await websocket.close(code=4004, reason="Event not found")
+            return
+        if event.status not in (EventStatus.active, EventStatus.finished):
+            await websocket.close(code=4003, reason="Event is not available")
+            return
+        event_id = event.id
+
+        # A reconnecting client presents the stream and last seq it saw and
+        # only gets the messages it missed. Anyone else gets a welcome, built
+        # before registering so it can't arrive after newer broadcasts
+        stream_id = websocket.query_params.get("stream")
+        last_seq = parse_seq(websocket.query_params.get("seq"))
+        welcome = None
+        if not replay_buffer.can_resume(link, stream_id, last_seq):
+            welcome, welcome_seq = await get_vote_welcome(link, event_id)
+
+        if not await manager.connect_vote(websocket, link):
+            return
         connected = True
 
-        # Send initial data
-        db = SessionLocal()
-        try:
-            current_candidate = get_current_voting_candidate(db, event_id)
-            await websocket.send_json({
-                "type": "current_candidate",
-                "data": current_candidate
-            })
-            if current_candidate and current_candidate.get("candidate"):
-                tally = get_candidate_vote_tally(db, event_id, current_candidate["candidate"]["id"])
-                await websocket.send_json({
-                    "type": "tally_update",
-                    "data": tally
-                })
-        finally:
-            db.close()
+        if welcome is not None:
+            started = manager.start_fresh_vote_session(websocket, link, welcome, welcome_seq)
+        else:
+            started = manager.start_vote_session(websocket, link, stream_id, last_seq)
+        if not started:
+            # The replay buffer moved on while the client was connecting
+            welcome, _ = await get_vote_welcome(link, event_id)
+            await manager.send_personal_text(websocket, welcome)
 
         # Main loop — no DB session held open
         while True:
             try:
-                data = await websocket.receive_json()
+                data = loads(await websocket.receive_text())
+                received_at = manager.clock.now()
+                manager.touch(websocket)
             except Exception as e:
                 print(f"Error receiving message: {e}")
                 break
 
+            # Answer to a server heartbeat ping; receiving it was enough
+            if data.get("type") == "pong":
+                continue
+
+            if data.get("type") == "time_sync":
+                await manager.send_personal_message(websocket, build_time_sync_reply(data, received_at))
+                continue
+
             # Handle ping-pong for connection health
             if data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await manager.send_personal_message(websocket, {"type": "pong"})
                 continue
 
             if data.get("type") == "cast_vote":
                 # Open DB session only for vote processing
-                db = SessionLocal()
-                try:
+                async with AsyncSessionLocal() as db:
                     await _process_vote(db, websocket, link, event_id, data)
-                finally:
-                    db.close()
 
     except WebSocketDisconnect:
-        if connected:
-            manager.disconnect_vote(websocket, link)
+        pass
     except Exception as e:
         print(f"WebSocket error: {type(e).__name__}: {e}")
+    finally:
+        # Also reached when the receive loop breaks, so no connection leaks
         if connected:
             manager.disconnect_vote(websocket, link)
 
 
-async def _process_vote(db: Session, websocket: WebSocket, link: str, event_id: int, data: dict):
+async def _process_vote(db: AsyncSession, websocket: WebSocket, link: str, event_id: int, data: dict):
     """Process a single vote — uses its own DB session."""
     vote_type = data.get("vote_type")
     nonce = data.get("nonce")
     device_id = data.get("device_id")
 
     if not vote_type or not nonce:
-        await websocket.send_json({
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "Missing vote_type or nonce"
         })
         return
 
     if vote_type not in ['yes', 'no', 'neutral']:
-        await websocket.send_json({
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "Invalid vote_type. Must be 'yes', 'no', or 'neutral'"
         })
@@ -359,38 +399,46 @@ async def _process_vote(db: Session, websocket: WebSocket, link: str, event_id:
 
     client_ip = websocket.client.host if websocket.client else "unknown"
 
-    current_cand = get_current_voting_candidate(db, event_id)
-    if not current_cand or not current_cand.get("candidate"):
-        await websocket.send_json({
+    # Validation runs against the cached event snapshot, no queries on a hit
+    snapshot = await db.run_sync(event_cache.get, event_id)
+    if snapshot and snapshot.status in CLOSED_STATUSES:
+        await manager.send_personal_message(websocket, {
+            "type": "error",
+            "message": "Voting has ended for this event"
+        })
+        return
+    current_entry = snapshot.current_entry() if snapshot else None
+    if not current_entry or not current_entry.candidate:
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "No active candidate for voting"
         })
         return
 
-    timer_info = current_cand.get("timer") or {}
+    timer_info = compute_timer_info(snapshot, current_entry)
     if not timer_info.get("running"):
-        await websocket.send_json({
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "Voting has not started for this candidate yet"
         })
         return
 
     if timer_info.get("remaining_ms", 0) <= 0:
-        await websocket.send_json({
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "Voting time has ended for this candidate"
         })
         return
 
-    candidate_id = data.get("candidate_id", current_cand["candidate"]["id"])
+    try:
+        candidate_id = int(data.get("candidate_id", current_entry.candidate_id))
+    except (TypeError, ValueError):
+        candidate_id = None
 
-    event_candidate = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id,
-        EventCandidate.candidate_id == candidate_id
-    ).first()
+    event_candidate = snapshot.by_candidate_id.get(candidate_id)
 
     if not event_candidate:
-        await websocket.send_json({
+        await manager.send_personal_message(websocket, {
             "type": "error",
             "message": "Selected candidate not found in this event"
         })
@@ -398,148 +446,76 @@ async def _process_vote(db: Session, websocket: WebSocket, link: str, event_id:
 
     event_candidate_id = event_candidate.id
 
-    # Check if already voted
-    if device_id:
-        existing_vote = db.query(Vote).filter(
-            Vote.event_id == event_id,
-            Vote.candidate_id == candidate_id,
-            Vote.ip_address == client_ip,
-            Vote.device_id == device_id
-        ).first()
-    else:
-        existing_vote = db.query(Vote).filter(
-            Vote.event_id == event_id,
-            Vote.candidate_id == candidate_id,
-            Vote.ip_address == client_ip
-        ).first()
-
-    if existing_vote:
-        await websocket.send_json({
-            "type": "error",
-            "message": "Siz allaqachon ovoz bergansiz (bu qurilmadan)"
-        })
-        return
+    candidate_record = event_candidate.candidate
 
-    candidate_record = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-
-    # Record vote
-    vote = Vote(
-        event_id=event_id,
-        event_candidate_id=event_candidate_id,
-        candidate_id=candidate_id,
-        ip_address=client_ip,
-        device_id=device_id,
-        nonce=nonce,
-        vote_type=vote_type,
-        timestamp=datetime.utcnow()
-    )
-    db.add(vote)
-
-    # Update participant count
-    participant_event_candidate = db.query(EventCandidate).filter(
-        EventCandidate.event_id == event_id,
-        EventCandidate.candidate_id == candidate_id
-    ).first()
-
-    if participant_event_candidate:
-        if device_id:
-            unique_participants = db.query(
-                func.count(func.distinct(Vote.ip_address + '_' + func.coalesce(Vote.device_id, '')))
-            ).filter(
-                Vote.event_id == event_id,
-                Vote.candidate_id == candidate_id
-            ).scalar() or 0
+    # Build vote rows; they are written by the group-commit pipeline, which
+    # rejects duplicates through the unique (event, candidate, voter_key) index
+    voter_key = make_voter_key(client_ip, device_id)
+    vote_rows = [{
+        "event_id": event_id,
+        "event_candidate_id": event_candidate_id,
+        "candidate_id": candidate_id,
+        "ip_address": client_ip,
+        "device_id": device_id,
+        "voter_key": voter_key,
+        "nonce": nonce,
+        "vote_type": vote_type,
+        "timestamp": datetime.utcnow(),
+    }]
+
+    # Auto-vote logic for grouped candidates
+    if candidate_record and event_candidate.candidate_group:
+        related_event_candidates = snapshot.group_members(event_candidate.candidate_group)
+
+        if vote_type == "yes":
+            auto_vote_type = "no"
+        elif vote_type == "neutral":
+            auto_vote_type = "neutral"
         else:
-            unique_participants = db.query(
-                func.count(func.distinct(Vote.ip_address))
-            ).filter(
-                Vote.event_id == event_id,
-                Vote.candidate_id == candidate_id
-            ).scalar() or 0
+            auto_vote_type = None
 
-        participant_event_candidate.participant_count = unique_participants
+        if auto_vote_type:
+            for related in related_event_candidates:
+                related_candidate = related.candidate
+                if not related_candidate or related_candidate.id == candidate_id:
+                    continue
 
-    auto_voted_candidate_ids: list[int] = []
+                vote_rows.append({
+                    "event_id": event_id,
+                    "event_candidate_id": related.id,
+                    "candidate_id": related.candidate_id,
+                    "ip_address": client_ip,
+                    "device_id": device_id,
+                    "voter_key": voter_key,
+                    "nonce": f"{nonce}-{auto_vote_type}-{related.candidate_id}",
+                    "vote_type": auto_vote_type,
+                    "timestamp": datetime.utcnow(),
+                })
 
-    # Auto-vote logic for grouped candidates
-    if candidate_record:
-        current_event_candidate = db.query(EventCandidate).filter(
-            EventCandidate.event_id == event_id,
-            EventCandidate.candidate_id == candidate_id
-        ).first()
-
-        if current_event_candidate and current_event_candidate.candidate_group:
-            related_event_candidates = db.query(EventCandidate).options(
-                joinedload(EventCandidate.candidate)
-            ).filter(
-                EventCandidate.event_id == event_id,
-                EventCandidate.candidate_group == current_event_candidate.candidate_group
-            ).all()
-
-            if vote_type == "yes":
-                auto_vote_type = "no"
-            elif vote_type == "neutral":
-                auto_vote_type = "neutral"
-            else:
-                auto_vote_type = None
-
-            if auto_vote_type:
-                for related in related_event_candidates:
-                    related_candidate = related.candidate
-                    if not related_candidate or related_candidate.id == candidate_id:
-                        continue
-
-                    if device_id:
-                        existing_related_vote = db.query(Vote).filter(
-                            Vote.event_id == event_id,
-                            Vote.candidate_id == related_candidate.id,
-                            Vote.ip_address == client_ip,
-                            Vote.device_id == device_id
-                        ).first()
-                    else:
-                        existing_related_vote = db.query(Vote).filter(
-                            Vote.event_id == event_id,
-                            Vote.candidate_id == related_candidate.id,
-                            Vote.ip_address == client_ip
-                        ).first()
-
-                    if existing_related_vote:
-                        continue
-
-                    auto_vote = Vote(
-                        event_id=event_id,
-                        event_candidate_id=related.id,
-                        candidate_id=related.candidate_id,
-                        ip_address=client_ip,
-                        device_id=device_id,
-                        nonce=f"{nonce}-{auto_vote_type}-{related.candidate_id}",
-                        vote_type=auto_vote_type,
-                        timestamp=datetime.utcnow()
-                    )
-                    db.add(auto_vote)
-                    auto_voted_candidate_ids.append(related.candidate_id)
-
-                    if device_id:
-                        unique_participants = db.query(
-                            func.count(func.distinct(Vote.ip_address + '_' + func.coalesce(Vote.device_id, '')))
-                        ).filter(
-                            Vote.event_id == event_id,
-                            Vote.candidate_id == related.candidate_id
-                        ).scalar() or 0
-                    else:
-                        unique_participants = db.query(
-                            func.count(func.distinct(Vote.ip_address))
-                        ).filter(
-                            Vote.event_id == event_id,
-                            Vote.candidate_id == related.candidate_id
-                        ).scalar() or 0
-
-                    related.participant_count = unique_participants
-
-    db.commit()
+    # Resolves once the batch containing these rows is committed; the
+    # pipeline also updates participant counts and the in-memory tallies
+    try:
+        inserted_rows = await vote_pipeline.submit(vote_rows)
+    except Exception:
+        logger.exception(f"Vote write failed for event {event_id}")
+        await manager.send_personal_message(websocket, {
+            "type": "error",
+            "message": "Failed to record vote, please try again"
+        })
+        return
+
+    if not inserted_rows:
+        await manager.send_personal_message(websocket, {
+            "type": "error",
+            "message": "Siz allaqachon ovoz bergansiz (bu qurilmadan)"
+        })
+        return
+
+    # Group members the voter had already voted for are skipped
+    auto_voted_candidate_ids = [row["candidate_id"] for row in inserted_rows[1:]]
 
     # Send confirmation
-    await websocket.send_json({
+    await manager.send_personal_message(websocket, {
         "type": "vote_confirmed",
         "vote_type": vote_type,
         "candidate_id": candidate_id,
@@ -547,24 +523,37 @@ async def _process_vote(db: Session, websocket: WebSocket, link: str, event_id:
         "auto_voted_candidates": auto_voted_candidate_ids
     })
 
-    # Broadcast updated tally
-    tally = get_candidate_vote_tally(db, event_id, candidate_id)
-    await manager.broadcast_vote(link, {
-        "type": "tally_update",
-        "data": tally
-    })
+    # Tally, candidate state and display payload are coalesced per tick
+    schedule_vote_state_broadcasts(link, event_id, candidate_id)
 
-    # Broadcast current candidate state
-    current_candidate = get_current_voting_candidate(db, event_id)
-    await manager.broadcast_vote(link, {
-        "type": "current_candidate",
-        "data": current_candidate
-    })
 
-    event = db.query(Event).filter(Event.id == event_id).first()
-    display_payload = build_display_update_payload(db, event)
-    if display_payload:
-        await manager.broadcast_display(link, display_payload)
+def schedule_vote_state_broadcasts(link: str, event_id: int, candidate_id: int):
+    """Mark vote-driven state dirty on every worker; each sends the latest state once per tick."""
+    _schedule_local_vote_state_broadcasts(link, event_id, candidate_id)
+    broadcast_bus.publish("vote_state", {"link": link, "event_id": event_id, "candidate_id": candidate_id})
+
+
+def _schedule_local_vote_state_broadcasts(link: str, event_id: int, candidate_id: int):
+    # current_candidate is only sent on transitions: votes don't change it and
+    # clients count down locally against timer.ends_at_ts
+
+    async def tally_message():
+        async with AsyncSessionLocal() as db:
+            tally = await db.run_sync(get_candidate_vote_tally, event_id, candidate_id)
+        return {"type": "tally_update", "data": tally}
+
+    async def display_message():
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(load_display_vote_patch, link, event_id)
+
+    manager.schedule_vote_broadcast(link, f"tally_update:{candidate_id}", tally_message)
+    manager.schedule_display_broadcast(link, "display_update", display_message)
+
+
+broadcast_bus.subscribe(
+    "vote_state",
+    lambda payload: _schedule_local_vote_state_broadcasts(payload["link"], payload["event_id"], payload["candidate_id"]),
+)
 
 
 @router.websocket("/ws/display/{link}")
@@ -573,52 +562,113 @@ async def websocket_display_endpoint(websocket: WebSocket, link: str):
     connected = False
 
     try:
-        # Verify event — short-lived DB session
-        db = SessionLocal()
-        try:
-            event = db.query(Event).filter(Event.link == link).first()
-            if not event:
-                await websocket.close(code=4004, reason="Event not found")
-                return
-            event_id = event.id
-        finally:
-            db.close()
-
-        await manager.connect_display(websocket, link)
+        if not await manager.admit(websocket):
+            return
+
+        event = await resolve_event_link(link)
+        if not event:
+            await websocket.close(code=4004, reason="Event not found")
+            return
+        event_id = event.id
+
+        if not await manager.connect_display(websocket, link):
+            return
         connected = True
 
         # Send initial state
-        db = SessionLocal()
-        try:
-            await send_display_update(websocket, db, event_id)
-        finally:
-            db.close()
+        sent_version = event_cache.version(event_id)
+        await send_display_update(websocket, link, event_id)
 
+        # Votes arrive as display_patch broadcasts. "update" asks for a full
+        # snapshot; "sync" is the periodic keep-alive and only gets one when
+        # the event structure changed since the last snapshot we sent. JSON
+        # messages carry time_sync requests.
         while True:
             try:
                 message = await websocket.receive_text()
-                if message == "update":
-                    db = SessionLocal()
-                    try:
-                        await send_display_update(websocket, db, event_id)
-                    finally:
-                        db.close()
+                manager.touch(websocket)
+                if message.startswith("{"):
+                    received_at = manager.clock.now()
+                    data = loads(message)
+                    if data.get("type") == "time_sync":
+                        await manager.send_personal_message(websocket, build_time_sync_reply(data, received_at))
+                elif message == "update" or (message == "sync" and event_cache.version(event_id) != sent_version):
+                    sent_version = event_cache.version(event_id)
+                    await send_display_update(websocket, link, event_id)
             except:
                 break
 
     except WebSocketDisconnect:
-        if connected:
-            manager.disconnect_display(websocket, link)
+        pass
     except Exception as e:
         print(f"Display WebSocket error: {e}")
+    finally:
         if connected:
             manager.disconnect_display(websocket, link)
 
 
-async def send_display_update(websocket: WebSocket, db: Session, event_id: int):
-    """Send current display state to display screen"""
-    db.expire_all()
-    event = db.query(Event).filter(Event.id == event_id).first()
-    payload = build_display_update_payload(db, event)
-    if payload:
-        await websocket.send_json(payload)
+def load_display_update_payload(db: Session, event_id: int):
+    """Build the display payload from the cached event snapshot (run via AsyncSession.run_sync)."""
+    event = event_cache.get(db, event_id)
+    return build_display_update_payload(db, event)
+
+
+async def send_display_update(websocket: WebSocket, link: str, event_id: int):
+    """Send a full display snapshot to one display screen"""
+    key = (display_tracker.current_seq(link), event_cache.version(event_id), tally_engine.generation(event_id))
+
+    async def build():
+        async with AsyncSessionLocal() as db:
+            payload = await db.run_sync(load_display_update_payload, event_id)
+        return dumps_text(display_tracker.tag(link, payload)), timer_valid_until(payload.get("timer"))
+
+    await manager.send_personal_text(
+        websocket, await welcome_cache.get("display", event_id, key, manager.clock.now(), build)
+    )
+
+
+async def resolve_event_link(link: str) -> EventSnapshot | None:
+    """Look up the event behind a link; no DB work while its snapshot is cached."""
+    event = event_cache.peek_link(link)
+    if event is None:
+        async with AsyncSessionLocal() as db:
+            event = await db.run_sync(event_cache.get_by_link, link)
+    return event
+
+
+def timer_valid_until(timer: dict | None) -> datetime | None:
+    """When a snapshot showing this timer goes stale (it stops running)."""
+    if not timer or not timer.get("running"):
+        return None
+    return manager.clock.now() + timedelta(milliseconds=timer["remaining_ms"])
+
+
+async def get_vote_welcome(link: str, event_id: int) -> Tuple[str, int]:
+    """The serialized ``welcome`` message for a new vote client (session position,
+    current candidate with its timer, and tally) and the seq it was built at.
+
+    Shared by every client that connects while the event is in the same state.
+    """
+    key = (replay_buffer.current_seq(link), event_cache.version(event_id), tally_engine.generation(event_id))
+
+    def load(db: Session):
+        current_candidate = get_current_voting_candidate(db, event_id)
+        tally = None
+        if current_candidate and current_candidate.get("candidate"):
+            tally = get_candidate_vote_tally(db, event_id, current_candidate["candidate"]["id"])
+        return current_candidate, tally
+
+    async def build():
+        async with AsyncSessionLocal() as db:
+            current_candidate, tally = await db.run_sync(load)
+        text = dumps_text({
+            "type": "welcome",
+            "stream": replay_buffer.stream_id,
+            "seq": key[0],
+            "current_candidate": current_candidate,
+            "tally": tally,
+        })
+        return text, timer_valid_until((current_candidate or {}).get("timer"))
+
+    text = await welcome_cache.get("vote", event_id, key, manager.clock.now(), build)
+    return text, key[0]
@@ -0,0 +1,166 @@
+from typing import Optional
+import asyncio
+import logging
+import random
+import time
+
+from ..core.config import settings
+from ..core.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Paces WebSocket handshakes so a connect storm doesn't swamp the loop.
+
+    A token bucket (kept as a GCRA theoretical arrival time, so there is no
+    refill task) lets ``burst`` handshakes through at once and ``rate`` per
+    second after that. Clients beyond that wait their turn in a bounded
+    queue; when the queue is full or the wait would be too long they are
+    rejected with a jittered retry-after hint, so rejected clients don't come
+    back in lockstep.
+
+    A monitor task measures event-loop lag and async DB pool usage and scales
+    the rate and queue size down while either is saturated.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        queue_size: int,
+        max_wait_sec: float,
+        target_lag_ms: float,
+        pool=None,
+    ):
+        self.base_rate = rate
+        self.burst = max(burst, 1)
+        self.base_queue_size = queue_size
+        self.max_wait_sec = max_wait_sec
+        self.target_lag_ms = target_lag_ms
+        self._pool = pool
+        self._tat = 0.0
+        self._monitor_task: Optional[asyncio.Task] = None
+        self.waiting = 0
+        self.loop_lag_ms = 0.0
+        self.pool_usage = 0.0
+        self.load_factor = 1.0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+    @property
+    def rate(self) -> float:
+        return self.base_rate * self.load_factor
+
+    @property
+    def queue_size(self) -> int:
+        return max(1, int(self.base_queue_size * self.load_factor))
+
+    async def admit(self) -> Optional[float]:
+        """Wait for a handshake slot.
+
+        Returns None once admitted, or a retry-after hint in seconds if the
+        client was rejected.
+        """
+        if self.base_rate <= 0:
+            self.admitted += 1
+            return None
+
+        now = time.monotonic()
+        interval = 1 / self.rate
+        tat = max(self._tat, now)
+        wait = tat - now - (self.burst - 1) * interval
+
+        if wait > 0:
+            if self.waiting >= self.queue_size or wait > self.max_wait_sec:
+                self.rejected += 1
+                return self.jittered(wait)
+
+            self._tat = tat + interval
+            self.waiting += 1
+            self.queued += 1
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self.waiting -= 1
+        else:
+            self._tat = tat + interval
+
+        self.admitted += 1
+        return None
+
+    def jittered(self, seconds: float) -> float:
+        """Spread retries over [1x, 2x) the hinted delay, at least one second."""
+        return max(seconds, 1.0) * random.uniform(1.0, 2.0)
+
+    def start(self):
+        if self._monitor_task is None:
+            self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def stop(self):
+        task, self._monitor_task = self._monitor_task, None
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _monitor(self, interval: float = 0.5):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lag_ms = max(0.0, (loop.time() - started - interval) * 1000)
+            # Smooth out single slow ticks
+            self.loop_lag_ms = 0.7 * self.loop_lag_ms + 0.3 * lag_ms
+            self.pool_usage = self._measure_pool_usage()
+            self._update_load_factor()
+
+    def _measure_pool_usage(self) -> float:
+        pool = self._pool
+        if pool is None or not hasattr(pool, "checkedout"):
+            return 0.0
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        return pool.checkedout() / capacity if capacity > 0 else 0.0
+
+    def _update_load_factor(self):
+        lag_factor = 1.0
+        if self.target_lag_ms > 0 and self.loop_lag_ms > self.target_lag_ms:
+            lag_factor = self.target_lag_ms / self.loop_lag_ms
+
+        # Start backing off once 80% of the pool is checked out
+        pool_factor = 1.0
+        if self.pool_usage > 0.8:
+            pool_factor = (1.0 - self.pool_usage) / 0.2
+
+        factor = max(0.1, min(lag_factor, pool_factor))
+        if factor < 1.0 <= self.load_factor:
+            logger.warning(
+                f"Throttling WebSocket admission: loop lag {self.loop_lag_ms:.0f}ms, "
+                f"DB pool {self.pool_usage:.0%} in use"
+            )
+        self.load_factor = factor
+
+    def get_stats(self) -> dict:
+        """Get admission statistics for monitoring."""
+        return {
+            "rate": round(self.rate, 1),
+            "burst": self.burst,
+            "queue_size": self.queue_size,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "loop_lag_ms": round(self.loop_lag_ms, 1),
+            "db_pool_usage": round(self.pool_usage, 2),
+            "load_factor": round(self.load_factor, 2),
+        }
+
+
+admission = AdmissionController(
+    rate=settings.WS_ACCEPT_RATE,
+    burst=settings.WS_ACCEPT_BURST,
+    queue_size=settings.WS_ADMISSION_QUEUE_SIZE,
+    max_wait_sec=settings.WS_ADMISSION_MAX_WAIT_SEC,
+    target_lag_ms=settings.WS_TARGET_LOOP_LAG_MS,
+    pool=async_engine.pool,
+)
@@ -0,0 +1,188 @@
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from ..core.config import settings
+from ..core.serialization import dumps, loads
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Receives the payload of a message published by another worker
+BusHandler = Callable[[dict], None]
+
+
+class BroadcastBus:
+    """Carries broadcasts and state changes between API worker processes.
+
+    A worker always applies a change to its own state first (fan-out to its
+    sockets, tally counters, cache invalidation) and then publishes it once;
+    every other worker applies it through the handler subscribed for the
+    topic. A worker never receives its own messages back.
+    """
+
+    backend = "in-process"
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, BusHandler] = {}
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, topic: str, handler: BusHandler):
+        self._handlers[topic] = handler
+
+    def publish(self, topic: str, payload: dict):
+        """Send a change to the other workers; a single process has none."""
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def _dispatch(self, envelope: dict):
+        handler = self._handlers.get(envelope.get("topic"))
+        if not handler:
+            return
+        self.received += 1
+        try:
+            handler(envelope["payload"])
+        except Exception as e:
+            logger.error(f"Bus handler for {envelope.get('topic')} failed: {e}")
+
+    def get_stats(self) -> dict:
+        """Get bus statistics for monitoring."""
+        return {
+            "backend": self.backend,
+            "worker_id": self.worker_id,
+            "published": self.published,
+            "received": self.received,
+        }
+
+
+class InProcessBus(BroadcastBus):
+    """Default backend for a single worker: nothing to forward."""
+
+
+class RedisBus(BroadcastBus):
+    """Pub/sub over one Redis channel, shared by all workers.
+
+    ``publish`` never blocks: messages go to an outbox drained by a publisher
+    task. It may be called from the threadpool (sync admin routes), in which
+    case the message is handed over to the event loop thread.
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, channel: str, client=None):
+        super().__init__()
+        self.url = url
+        self.channel = channel
+        self._client = client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._tasks: list = []
+        self.publish_failures = 0
+
+    async def start(self):
+        if self._tasks:
+            return
+        if self._client is None:
+            if aioredis is None:
+                raise RuntimeError("BROADCAST_BUS_URL is set but the 'redis' package is not installed")
+            self._client = aioredis.from_url(self.url)
+
+        self._loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue()
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        self._tasks = [
+            asyncio.create_task(self._listen(pubsub)),
+            asyncio.create_task(self._publish_loop()),
+        ]
+        logger.info(f"Broadcast bus connected to {self.channel} as {self.worker_id}")
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        # Let queued messages go out before shutting down
+        try:
+            await asyncio.wait_for(self._outbox.join(), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    def publish(self, topic: str, payload: dict):
+        if self._loop is None:
+            return
+        envelope = dumps({"origin": self.worker_id, "topic": topic, "payload": payload})
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._outbox.put_nowait(envelope)
+        else:
+            self._loop.call_soon_threadsafe(self._outbox.put_nowait, envelope)
+
+    async def _publish_loop(self):
+        while True:
+            envelope = await self._outbox.get()
+            try:
+                await self._client.publish(self.channel, envelope)
+                self.published += 1
+            except Exception as e:
+                self.publish_failures += 1
+                logger.error(f"Broadcast bus publish failed: {e}")
+            finally:
+                self._outbox.task_done()
+
+    async def _listen(self, pubsub):
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    envelope = loads(message["data"])
+                    if envelope.get("origin") == self.worker_id:
+                        continue
+                    self._dispatch(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Broadcast bus listener error, retrying: {e}")
+                await asyncio.sleep(1.0)
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats["publish_failures"] = self.publish_failures
+        stats["outbox_depth"] = self._outbox.qsize() if self._outbox else 0
+        return stats
+
+
+def create_broadcast_bus() -> BroadcastBus:
+    if settings.BROADCAST_BUS_URL:
+        return RedisBus(settings.BROADCAST_BUS_URL, settings.BROADCAST_BUS_CHANNEL)
+    if settings.WEB_CONCURRENCY > 1:
+        # Workers would silently serve diverging tallies and miss broadcasts
+        raise RuntimeError(
+            f"WEB_CONCURRENCY={settings.WEB_CONCURRENCY} requires BROADCAST_BUS_URL; "
+            "set it to a Redis URL or run a single worker"
+        )
+    return InProcessBus()
+
+
+broadcast_bus = create_broadcast_bus()
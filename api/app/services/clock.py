@@ -0,0 +1,52 @@
+from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
+import asyncio
+import heapq
+import itertools
+
+
+class SystemClock:
+    """Wall clock used by the timer service in production."""
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(max(seconds, 0))
+
+
+class VirtualClock(SystemClock):
+    """Manually advanced clock for exercising timers without waiting.
+
+    ``sleep`` only returns once ``advance``/``set`` moves the clock past the
+    sleeper's wake-up time.
+    """
+
+    def __init__(self, start: datetime | None = None):
+        self._now = start or datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self._sleepers: List[Tuple[datetime, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    def now(self) -> datetime:
+        return self._now
+
+    async def sleep(self, seconds: float):
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self._now + timedelta(seconds=seconds), next(self._counter), future))
+        await future
+
+    def set(self, when: datetime):
+        self._now = when
+        while self._sleepers and self._sleepers[0][0] <= self._now:
+            _, _, future = heapq.heappop(self._sleepers)
+            if not future.done():
+                future.set_result(None)
+
+    def advance(self, seconds: float):
+        self.set(self._now + timedelta(seconds=seconds))
+
+    def pending_sleepers(self) -> int:
+        return sum(1 for _, _, future in self._sleepers if not future.done())
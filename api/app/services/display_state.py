@@ -0,0 +1,74 @@
+from typing import Dict, Optional
+import copy
+
+
+class DisplayStateTracker:
+    """Last display document broadcast per event, plus a sequence number.
+
+    Admin transitions broadcast a full ``display_update`` (``full``); votes
+    only change ``vote_results``/``group_results``, which go out as a
+    ``display_patch`` holding just the fields that differ from the last
+    broadcast document (``patch``). Every broadcast bumps ``seq``; a display
+    that sees a gap asks for a full snapshot. Patch values are absolute, so
+    applying one twice or on top of a newer snapshot is harmless.
+
+    The document remembers the event structure version it was built from;
+    once the event changes, votes fall back to a full broadcast.
+    """
+
+    def __init__(self):
+        # event_link -> (seq, structure version, last broadcast document)
+        self._states: Dict[str, tuple] = {}
+        self.full_sent = 0
+        self.patches_sent = 0
+        self.patches_skipped = 0
+
+    def current_seq(self, event_link: str) -> int:
+        state = self._states.get(event_link)
+        return state[0] if state else 0
+
+    def can_patch(self, event_link: str, version: int) -> bool:
+        state = self._states.get(event_link)
+        return state is not None and state[1] == version
+
+    def full(self, event_link: str, payload: dict, version: int) -> dict:
+        """Record a full document that is about to be broadcast and tag it with the next seq."""
+        seq = self.current_seq(event_link) + 1
+        payload = dict(payload, seq=seq)
+        self._states[event_link] = (seq, version, copy.deepcopy(payload))
+        self.full_sent += 1
+        return payload
+
+    def tag(self, event_link: str, payload: dict) -> dict:
+        """Tag a snapshot sent to a single display with the current seq, without recording it."""
+        return dict(payload, seq=self.current_seq(event_link))
+
+    def patch(self, event_link: str, fields: dict) -> Optional[dict]:
+        """Build a ``display_patch`` for the fields that changed, or None if nothing did."""
+        seq, version, document = self._states[event_link]
+        changes = {key: value for key, value in fields.items() if document.get(key) != value}
+        if not changes:
+            self.patches_skipped += 1
+            return None
+
+        seq += 1
+        document.update(copy.deepcopy(changes))
+        document["seq"] = seq
+        self._states[event_link] = (seq, version, document)
+        self.patches_sent += 1
+        return {"type": "display_patch", "seq": seq, "changes": changes}
+
+    def drop(self, event_link: str):
+        self._states.pop(event_link, None)
+
+    def get_stats(self) -> dict:
+        """Get display broadcast statistics for monitoring."""
+        return {
+            "events_tracked": len(self._states),
+            "full_sent": self.full_sent,
+            "patches_sent": self.patches_sent,
+            "patches_skipped": self.patches_skipped,
+        }
+
+
+display_tracker = DisplayStateTracker()
@@ -0,0 +1,214 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session, joinedload
+import hashlib
+import logging
+import threading
+
+from ..models.event import Event, EventCandidate, EventStatus
+from ..models.candidate import Candidate
+from .broadcast_bus import broadcast_bus
+
+logger = logging.getLogger(__name__)
+
+
+class CandidateInfo:
+    """Read-only copy of the Candidate fields used by voting and display payloads."""
+
+    __slots__ = ("id", "full_name", "image", "which_position", "position", "degree",
+                 "description", "election_time")
+
+    def __init__(self, candidate: Candidate):
+        self.id = candidate.id
+        self.full_name = candidate.full_name
+        self.image = candidate.image
+        self.which_position = candidate.which_position
+        self.position = candidate.position
+        self.degree = candidate.degree
+        self.description = candidate.description
+        self.election_time = candidate.election_time
+
+
+class CandidateEntry:
+    """Read-only copy of an EventCandidate row with its candidate attached."""
+
+    __slots__ = ("id", "candidate_id", "order", "status", "candidate_group",
+                 "timer_started_at", "timer_duration_sec", "candidate")
+
+    def __init__(self, event_candidate: EventCandidate):
+        self.id = event_candidate.id
+        self.candidate_id = event_candidate.candidate_id
+        self.order = event_candidate.order
+        self.status = event_candidate.status
+        self.candidate_group = event_candidate.candidate_group
+        self.timer_started_at: Optional[datetime] = event_candidate.timer_started_at
+        self.timer_duration_sec: Optional[int] = event_candidate.timer_duration_sec
+        self.candidate: Optional[CandidateInfo] = (
+            CandidateInfo(event_candidate.candidate) if event_candidate.candidate else None
+        )
+
+
+# Counters that votes update; snapshots are not invalidated for them
+VOTE_COUNTER_COLUMNS = {"unique_voters", "participant_count"}
+
+
+def row_values(row) -> tuple:
+    return tuple(
+        getattr(row, column.key) for column in row.__table__.columns
+        if column.key not in VOTE_COUNTER_COLUMNS
+    )
+
+
+class EventSnapshot:
+    """Immutable view of an event's ordering, groups, timer and display metadata.
+
+    Attribute names mirror the ORM models so payload helpers accept either.
+    ``fingerprint`` hashes every row the snapshot was loaded from, so unlike
+    ``version`` it is the same on every worker that loaded the same data.
+    """
+
+    __slots__ = ("id", "name", "link", "status", "duration_sec", "current_candidate_index",
+                 "candidates", "by_candidate_id", "version", "fingerprint")
+
+    def __init__(self, event: Event, event_candidates: List[EventCandidate], version: int):
+        self.id = event.id
+        self.name = event.name
+        self.link = event.link
+        self.status: EventStatus = event.status
+        self.duration_sec = event.duration_sec
+        self.current_candidate_index = event.current_candidate_index or 0
+        self.candidates: Tuple[CandidateEntry, ...] = tuple(CandidateEntry(ec) for ec in event_candidates)
+        self.by_candidate_id: Dict[int, CandidateEntry] = {
+            entry.candidate_id: entry for entry in self.candidates
+        }
+        self.version = version
+        rows = [row_values(event)] + [
+            (row_values(ec), row_values(ec.candidate) if ec.candidate else None)
+            for ec in event_candidates
+        ]
+        self.fingerprint = hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+
+    def current_entry(self) -> Optional[CandidateEntry]:
+        if 0 <= self.current_candidate_index < len(self.candidates):
+            return self.candidates[self.current_candidate_index]
+        return None
+
+    def group_members(self, group: Optional[str]) -> List[CandidateEntry]:
+        if not group:
+            return []
+        return [entry for entry in self.candidates if entry.candidate_group == group]
+
+
+class EventStructureCache:
+    """Versioned in-process snapshots of event structure.
+
+    Hot paths (vote validation, broadcasts, display payloads) read snapshots
+    without touching the database. Every admin mutation of an event calls
+    ``invalidate`` after committing, which bumps the version and drops the
+    snapshot so the next reader reloads it. Invalidations are published on
+    the broadcast bus so other workers drop their snapshots too.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[int, EventSnapshot] = {}
+        # event link -> id; links never change, deleted events are dropped on lookup
+        self._links: Dict[str, int] = {}
+        self._versions: Dict[int, int] = {}
+        self._global_version = 0
+        # Sync admin routes run in the threadpool, so guard the dicts
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, event_id: int) -> int:
+        return self._global_version + self._versions.get(event_id, 0)
+
+    def get(self, db: Session, event_id: int) -> Optional[EventSnapshot]:
+        """Return the current snapshot, loading it from the DB on a miss."""
+        version = self.version(event_id)
+        snapshot = self._snapshots.get(event_id)
+        if snapshot is not None and snapshot.version == version:
+            self.hits += 1
+            return snapshot
+
+        self.misses += 1
+        # populate_existing so objects already in this session are refreshed
+        event = db.query(Event).filter(
+            Event.id == event_id
+        ).execution_options(populate_existing=True).first()
+        if not event:
+            return None
+
+        event_candidates = db.query(EventCandidate).options(
+            joinedload(EventCandidate.candidate)
+        ).filter(
+            EventCandidate.event_id == event_id
+        ).order_by(EventCandidate.order).execution_options(populate_existing=True).all()
+
+        snapshot = EventSnapshot(event, event_candidates, version)
+        with self._lock:
+            # Only cache if nothing was invalidated while we were loading
+            if self.version(event_id) == version:
+                self._snapshots[event_id] = snapshot
+            self._links[snapshot.link] = event_id
+        return snapshot
+
+    def peek_link(self, link: str) -> Optional[EventSnapshot]:
+        """Return the current snapshot of the event behind a link, only if it's cached."""
+        event_id = self._links.get(link)
+        if event_id is None:
+            return None
+        snapshot = self._snapshots.get(event_id)
+        if snapshot is not None and snapshot.version == self.version(event_id):
+            self.hits += 1
+            return snapshot
+        return None
+
+    def get_by_link(self, db: Session, link: str) -> Optional[EventSnapshot]:
+        """Resolve a link and return its event's snapshot, loading it on a miss."""
+        event_id = self._links.get(link)
+        if event_id is None:
+            event_id = db.query(Event.id).filter(Event.link == link).scalar()
+            if event_id is None:
+                return None
+
+        snapshot = self.get(db, event_id)
+        if snapshot is None:
+            with self._lock:
+                self._links.pop(link, None)
+        return snapshot
+
+    def invalidate(self, event_id: int):
+        """Drop an event's snapshot after its structure or state changed."""
+        self._invalidate(event_id)
+        broadcast_bus.publish("event_cache", {"event_id": event_id})
+
+    def invalidate_all(self):
+        """Drop every snapshot, e.g. after candidate metadata changed."""
+        self._invalidate(None)
+        broadcast_bus.publish("event_cache", {"event_id": None})
+
+    def _invalidate(self, event_id: Optional[int]):
+        with self._lock:
+            if event_id is None:
+                self._global_version += 1
+                self._snapshots.clear()
+            else:
+                self._versions[event_id] = self._versions.get(event_id, 0) + 1
+                self._snapshots.pop(event_id, None)
+
+    def apply_remote(self, payload: dict):
+        """Apply an invalidation published by another worker."""
+        self._invalidate(payload["event_id"])
+
+    def get_stats(self) -> dict:
+        """Get cache statistics for monitoring."""
+        return {
+            "events_cached": len(self._snapshots),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+event_cache = EventStructureCache()
+broadcast_bus.subscribe("event_cache", event_cache.apply_remote)
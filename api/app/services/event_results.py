@@ -1,9 +1,8 @@
 from typing import List, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, case
 
-from ..models.event import EventCandidate
-from ..models.vote import Vote
+from ..models.event import Event, EventCandidate
+from .tally_summary import load_tallies
 
 
 def calculate_event_results(db: Session, event_id: int) -> Tuple[List[dict], int]:
@@ -15,41 +14,11 @@ def calculate_event_results(db: Session, event_id: int) -> Tuple[List[dict], int
         EventCandidate.event_id == event_id
     ).order_by(EventCandidate.order).all()
 
-    # Get vote breakdown by type
-    vote_breakdown = db.query(
-        Vote.candidate_id,
-        func.sum(case((Vote.vote_type == 'yes', 1), else_=0)).label("yes_votes"),
-        func.sum(case((Vote.vote_type == 'no', 1), else_=0)).label("no_votes"),
-        func.sum(case((Vote.vote_type == 'neutral', 1), else_=0)).label("neutral_votes"),
-        func.count(Vote.id).label("total_votes")
-    ).filter(
-        Vote.event_id == event_id
-    ).group_by(
-        Vote.candidate_id
-    ).all()
-
-    # Create a map for easy lookup
-    vote_map = {
-        row.candidate_id: {
-            "yes": row.yes_votes or 0,
-            "no": row.no_votes or 0,
-            "neutral": row.neutral_votes or 0,
-            "total": row.total_votes or 0
-        }
-        for row in vote_breakdown
-    }
+    # Vote breakdown is kept up to date in the summary table by the vote writer
+    tallies = load_tallies(db, event_id)
 
-    # Get unique voters count (by IP + device_id combination)
-    # Count distinct (ip_address, device_id) pairs
-    # For votes without device_id, we still count them by IP
-    unique_voters_subquery = db.query(
-        Vote.ip_address,
-        Vote.device_id
-    ).filter(
-        Vote.event_id == event_id
-    ).distinct().subquery()
-
-    unique_voters = db.query(func.count()).select_from(unique_voters_subquery).scalar() or 0
+    # Unique voters (by IP + device_id) are maintained incrementally on the event
+    unique_voters = db.query(Event.unique_voters).filter(Event.id == event_id).scalar() or 0
 
     results = []
     for idx, event_candidate in enumerate(event_candidates, start=1):
@@ -57,12 +26,8 @@ def calculate_event_results(db: Session, event_id: int) -> Tuple[List[dict], int
         if not candidate:
             continue
 
-        vote_data = vote_map.get(candidate.id, {"yes": 0, "no": 0, "neutral": 0, "total": 0})
-
-        yes_votes = vote_data["yes"]
-        no_votes = vote_data["no"]
-        neutral_votes = vote_data["neutral"]
-        total_votes = vote_data["total"]
+        yes_votes, no_votes, neutral_votes = tallies.get(candidate.id, (0, 0, 0))
+        total_votes = yes_votes + no_votes + neutral_votes
 
         # Calculate percentages based on total votes for THIS candidate
         # Example: 4 total votes: 2 yes (50%), 1 no (25%), 1 neutral (25%)
@@ -0,0 +1,194 @@
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from ..core.config import settings
+from .word_export import render_results_word, write_results_word
+
+logger = logging.getLogger(__name__)
+
+# (event_name, results, total_participants) to render, pre-rendered bytes,
+# or None when there is nothing to export
+ExportSource = Union[Tuple[str, list, int], bytes, None]
+
+
+class ExportRenderer:
+    """Word exports rendered in a process pool and cached on disk.
+
+    python-docx rendering is pure CPU and would hold the GIL (and with it
+    the event loop) for the whole document, so it runs in a small
+    ``ProcessPoolExecutor``. Finished files are kept per event under the
+    results version they were rendered from and served from disk until the
+    version changes. Concurrent requests for the same version wait for one
+    render instead of starting their own. A replaced file is deleted only
+    after a grace period, as a response may not have opened it yet.
+
+    Used from the threadpool (sync routes), so waiting on a render never
+    blocks the event loop.
+    """
+
+    def __init__(self, max_workers: int, cache_dir: str, max_files: int, stale_ttl: float):
+        self.max_workers = max(max_workers, 1)
+        self.cache_dir = cache_dir
+        self.max_files = max(max_files, 1)
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dir: Optional[str] = None
+        # event_id -> (version, path), least recently used first
+        self._files: "OrderedDict[int, Tuple[tuple, str]]" = OrderedDict()
+        self._pending: Dict[Tuple[int, tuple], Future] = {}
+        # (retired at, path) of replaced files, oldest first
+        self._retired: Deque[Tuple[float, str]] = deque()
+        self._file_seq = 0
+        self.hits = 0
+        self.renders = 0
+        self.coalesced = 0
+
+    def get(self, event_id: int, version: tuple, load: Callable[[], ExportSource]) -> Optional[str]:
+        """Path of the export for this results version, rendering it on a miss.
+
+        ``load`` runs only on a miss, in the calling thread.
+        """
+        key = (event_id, version)
+        with self._lock:
+            entry = self._files.get(event_id)
+            if entry and entry[0] == version:
+                self._files.move_to_end(event_id)
+                self.hits += 1
+                return entry[1]
+
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+            else:
+                future = self._pending[key] = Future()
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            path = self._produce(event_id, load())
+            if path:
+                self._remember(event_id, version, path)
+            future.set_result(path)
+            return path
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    def render_bytes(self, event_name: str, results: list, total_participants: int) -> bytes:
+        """Render a document in the pool and return its bytes (e.g. for a results snapshot)."""
+        return self._submit(render_results_word, event_name, results, total_participants)
+
+    def _produce(self, event_id: int, source: ExportSource) -> Optional[str]:
+        if source is None:
+            return None
+
+        with self._lock:
+            self._file_seq += 1
+            path = os.path.join(self._cache_path(), f"{event_id}-{self._file_seq}.docx")
+
+        if isinstance(source, bytes):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+        else:
+            self._submit(write_results_word, path, *source)
+            self.renders += 1
+        return path
+
+    def _remember(self, event_id: int, version: tuple, path: str):
+        now = time.monotonic()
+        with self._lock:
+            replaced = [self._files.pop(event_id, (None, None))[1]]
+            self._files[event_id] = (version, path)
+            while len(self._files) > self.max_files:
+                replaced.append(self._files.popitem(last=False)[1][1])
+            self._retired.extend((now, stale_path) for stale_path in replaced if stale_path)
+
+            expired = []
+            while self._retired and now - self._retired[0][0] >= self.stale_ttl:
+                expired.append(self._retired.popleft()[1])
+
+        for stale_path in expired:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                # Already gone, or still open on Windows
+                pass
+
+    def _submit(self, fn, *args):
+        executor = self._get_executor()
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool for the next request
+            logger.error("Word export process pool broke; restarting it")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _cache_path(self) -> str:
+        # Called with the lock held. One directory per process: versions are
+        # only meaningful within the process that produced them
+        if self._dir is None:
+            base = self.cache_dir or None
+            if base:
+                os.makedirs(base, exist_ok=True)
+            self._dir = tempfile.mkdtemp(prefix="vote_tersu_exports_", dir=base)
+        return self._dir
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            cache_dir, self._dir = self._dir, None
+            self._files.clear()
+            self._retired.clear()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if cache_dir:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def get_stats(self) -> dict:
+        """Get Word export statistics for monitoring."""
+        return {
+            "max_workers": self.max_workers,
+            "cached_files": len(self._files),
+            "retired_files": len(self._retired),
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "renders": self.renders,
+            "coalesced": self.coalesced,
+        }
+
+
+export_renderer = ExportRenderer(
+    max_workers=settings.EXPORT_WORKERS,
+    cache_dir=settings.EXPORT_CACHE_DIR,
+    max_files=settings.EXPORT_CACHE_MAX_FILES,
+    stale_ttl=settings.EXPORT_STALE_TTL_SEC,
+)
@@ -0,0 +1,84 @@
+from typing import Any, Callable, Dict
+from collections import OrderedDict
+from fastapi import Request, Response
+import hashlib
+import threading
+
+from ..core.config import settings
+from ..core.serialization import dumps
+
+
+class ConditionalResponseCache:
+    """ETag / If-None-Match support for polled public endpoints.
+
+    The ETag is derived from the state the caller passes in (event snapshot
+    fingerprint, vote counts, ...), which every worker computes alike, so a
+    client polling through a load balancer still gets its 304s. A matching
+    ``If-None-Match`` gets a 304 before anything is built. Rendered bodies
+    are kept per ETag (bounded LRU) so repeated polls skip the aggregation
+    as well.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._bodies: "OrderedDict[str, bytes]" = OrderedDict()
+        # Sync routes run in the threadpool
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.hits = 0
+        self.misses = 0
+
+    def etag(self, *state: Any) -> str:
+        raw = ":".join(str(part) for part in state)
+        return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:24] + '"'
+
+    def respond(self, request: Request, state: tuple, build: Callable[[], Any]) -> Response:
+        """Answer with 304 if the client has this state, else the (cached) JSON body."""
+        etag = self.etag(*state)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SEC}, "
+                             f"stale-while-revalidate={settings.HTTP_CACHE_STALE_SEC}",
+        }
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        with self._lock:
+            body = self._bodies.get(etag)
+            if body is not None:
+                self._bodies.move_to_end(etag)
+        if body is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            body = dumps(build())
+            with self._lock:
+                self._bodies[etag] = body
+                while len(self._bodies) > self.max_entries:
+                    self._bodies.popitem(last=False)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get conditional GET statistics for monitoring."""
+        return {
+            "bodies_cached": len(self._bodies),
+            "not_modified": self.not_modified,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match requires
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+http_cache = ConditionalResponseCache()
@@ -0,0 +1,82 @@
+from typing import Deque, Dict, List, Optional, Tuple
+from collections import deque
+import uuid
+
+from ..core.config import settings
+from ..core.serialization import dumps_text
+
+
+class ReplayBuffer:
+    """Recent vote broadcasts per event, numbered so clients can resume.
+
+    Every broadcast to an event's vote clients gets the next ``seq`` and is
+    kept, serialized, in a bounded ring. A client that reconnects with the
+    ``stream`` id and last ``seq`` it saw gets only the messages it missed,
+    from memory; if they already fell out of the ring (or it was connected
+    to another worker or process) it needs full state instead.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        # Identifies this process's numbering; seqs from elsewhere don't apply
+        self.stream_id = uuid.uuid4().hex[:12]
+        # event_link -> (last seq, ring of (seq, state_key, text))
+        self._events: Dict[str, Tuple[int, Deque[Tuple[int, Optional[str], str]]]] = {}
+        self.resumed = 0
+        self.replayed_messages = 0
+        self.resume_misses = 0
+
+    def current_seq(self, event_link: str) -> int:
+        state = self._events.get(event_link)
+        return state[0] if state else 0
+
+    def append(self, event_link: str, message: dict, state_key: Optional[str] = None) -> str:
+        """Number a broadcast, remember it and return its serialized text."""
+        seq, ring = self._events.get(event_link) or (0, deque(maxlen=self.size))
+        seq += 1
+        text = dumps_text(dict(message, seq=seq))
+        ring.append((seq, state_key, text))
+        self._events[event_link] = (seq, ring)
+        return text
+
+    def can_resume(self, event_link: str, stream_id: Optional[str], seq: Optional[int]) -> bool:
+        """Whether every message after ``seq`` of ``stream_id`` is still in the ring."""
+        if stream_id != self.stream_id or seq is None:
+            return False
+        current, ring = self._events.get(event_link) or (0, deque())
+        return seq <= current and (seq == current or (bool(ring) and ring[0][0] <= seq + 1))
+
+    def since(self, event_link: str, stream_id: str, seq: int) -> Optional[List[str]]:
+        """Messages after ``seq``, or None if they can't all be replayed."""
+        if not self.can_resume(event_link, stream_id, seq):
+            self.resume_misses += 1
+            return None
+
+        texts = self.after(event_link, seq)
+        self.resumed += 1
+        self.replayed_messages += len(texts)
+        return texts
+
+    def after(self, event_link: str, seq: int) -> List[str]:
+        """Buffered messages after ``seq``; only the newest one of each state key."""
+        _, ring = self._events.get(event_link) or (0, deque())
+        missed = [entry for entry in ring if entry[0] > seq]
+        latest = {key: entry_seq for entry_seq, key, _ in missed if key is not None}
+        return [text for entry_seq, key, text in missed if key is None or latest[key] == entry_seq]
+
+    def drop(self, event_link: str):
+        self._events.pop(event_link, None)
+
+    def get_stats(self) -> dict:
+        """Get resume statistics for monitoring."""
+        return {
+            "stream_id": self.stream_id,
+            "events_buffered": len(self._events),
+            "buffer_size": self.size,
+            "resumed": self.resumed,
+            "replayed_messages": self.replayed_messages,
+            "resume_misses": self.resume_misses,
+        }
+
+
+replay_buffer = ReplayBuffer(settings.WS_REPLAY_BUFFER_SIZE)
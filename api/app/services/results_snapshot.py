@@ -0,0 +1,82 @@
+from typing import Iterable, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, select
+
+from ..core.serialization import dumps_text, loads
+from ..models.event import Event, EventStatus
+from ..models.snapshot import ResultsSnapshot
+from .event_results import calculate_event_results
+from .export_renderer import export_renderer
+
+# Results of these events no longer change unless votes are cleared
+CLOSED_STATUSES = (EventStatus.finished, EventStatus.archived)
+
+
+def freeze_results(db: Session, event_id: int, render_docx: bool = True) -> ResultsSnapshot:
+    """Store the event's current results and Word export; the caller commits.
+
+    Rendering waits on the export process pool, so callers on the event loop
+    pass ``render_docx=False`` and the file is rendered on first download.
+    """
+    event = db.get(Event, event_id)
+    results, total_votes = calculate_event_results(db, event_id)
+    docx = None
+    if render_docx and results:
+        docx = export_renderer.render_bytes(event.name, results, total_votes)
+
+    snapshot = db.get(ResultsSnapshot, event_id) or ResultsSnapshot(event_id=event_id)
+    snapshot.results = dumps_text({"results": results, "total_votes": total_votes})
+    snapshot.docx = docx
+    snapshot.created_at = datetime.utcnow()
+    db.add(snapshot)
+    return snapshot
+
+
+def get_frozen_results(db: Session, event_id: int) -> ResultsSnapshot:
+    """Snapshot of a closed event, frozen on first read if it is missing (e.g. after a vote clear)."""
+    snapshot = db.get(ResultsSnapshot, event_id)
+    if snapshot is not None:
+        return snapshot
+
+    freeze_results(db, event_id)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request froze it first
+        db.rollback()
+    return db.get(ResultsSnapshot, event_id)
+
+
+def load_frozen_results(db: Session, event_id: int) -> Optional[Tuple[List[dict], int]]:
+    """(results, total_votes) from the snapshot, or None if the event has none."""
+    snapshot = db.get(ResultsSnapshot, event_id)
+    return snapshot_results(snapshot) if snapshot else None
+
+
+def snapshot_results(snapshot: ResultsSnapshot) -> Tuple[List[dict], int]:
+    data = loads(snapshot.results)
+    return data["results"], data["total_votes"]
+
+
+def invalidate_results(db: Session, event_id: int):
+    """Drop an event's snapshot after its votes or candidates changed; the caller commits."""
+    db.execute(delete(ResultsSnapshot).where(ResultsSnapshot.event_id == event_id))
+
+
+async def drop_closed_results(db: AsyncSession, event_ids: Iterable[int]) -> List[int]:
+    """Drop the snapshots of the closed events among ``event_ids``; the caller commits.
+
+    For votes that were accepted just before their event closed.
+    """
+    event_ids = list(event_ids)
+    if not event_ids:
+        return []
+    closed = list((await db.scalars(
+        select(Event.id).where(Event.id.in_(event_ids), Event.status.in_(CLOSED_STATUSES))
+    )).all())
+    if closed:
+        await db.execute(delete(ResultsSnapshot).where(ResultsSnapshot.event_id.in_(closed)))
+    return closed
@@ -0,0 +1,401 @@
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
+from datetime import datetime, timezone
+from sqlalchemy.orm import Session
+import asyncio
+import logging
+import threading
+
+from ..core.config import settings
+from .broadcast_bus import broadcast_bus
+from .tally_summary import TallyStamp, load_tally_shards, load_vote_state, repair_tallies
+
+logger = logging.getLogger(__name__)
+
+VOTE_TYPES = ("yes", "no", "neutral")
+
+
+def empty_tally() -> dict:
+    return {"yes": 0, "no": 0, "neutral": 0, "total": 0}
+
+
+class ShardVersions:
+    """Which increments of one summary shard row the counters already hold.
+
+    Everything up to ``base`` came with the loaded counts; later versions are
+    kept individually, as increments from different workers may arrive out
+    of order.
+    """
+
+    __slots__ = ("base", "applied")
+
+    def __init__(self, base: int = 0):
+        self.base = base
+        self.applied: set = set()
+
+    def claim(self, version: int) -> bool:
+        """True the first time a version is seen, False for increments already counted."""
+        if version <= self.base or version in self.applied:
+            return False
+        self.applied.add(version)
+        while self.base + 1 in self.applied:
+            self.base += 1
+            self.applied.discard(self.base)
+        return True
+
+
+def count_drift(
+    counts: Dict[int, Dict[str, int]], reference: Dict[int, Dict[str, int]]
+) -> Dict[int, Dict[str, int]]:
+    """``candidate_id -> {vote_type: counts - reference}`` for every mismatch."""
+    drift: Dict[int, Dict[str, int]] = {}
+    for candidate_id in set(counts) | set(reference):
+        have = counts.get(candidate_id, {})
+        want = reference.get(candidate_id, {})
+        diff = {
+            vote_type: have.get(vote_type, 0) - want.get(vote_type, 0)
+            for vote_type in VOTE_TYPES
+            if have.get(vote_type, 0) != want.get(vote_type, 0)
+        }
+        if diff:
+            drift[candidate_id] = diff
+    return drift
+
+
+class TallyEngine:
+    """In-memory per-event vote tallies.
+
+    Seeded from the results summary table once per event, then updated in
+    O(1) for every accepted vote so that tally reads never touch the database.
+    A background task periodically checks both the counters and the summary
+    table against the ``votes`` rows, reports any drift and corrects it.
+    Mutations are published on the broadcast bus so the
+    counters of every worker stay in step; each one carries the summary row
+    versions it produced, so an increment the loaded counts already include
+    is not applied twice.
+    """
+
+    def __init__(self):
+        # event_id -> candidate_id -> {"yes", "no", "neutral"}
+        self._tallies: Dict[int, Dict[int, Dict[str, int]]] = {}
+        # event_id -> number of in-memory mutations, used to skip reconciling
+        # an event whose counters moved while the DB snapshot was being read
+        self._generations: Dict[int, int] = {}
+        # event_id -> (candidate_id, shard) -> increments held by the counters
+        self._versions: Dict[int, Dict[Tuple[int, int], ShardVersions]] = {}
+        # event_id -> vote batches between insert and record_many; their rows
+        # may already be visible in the DB but not yet in the counters
+        self._writing: Dict[int, int] = {}
+        # Sync admin routes run in the threadpool, so guard the dicts
+        self._lock = threading.Lock()
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self.reconcile_interval = settings.TALLY_RECONCILE_INTERVAL_SEC
+        self.last_reconcile_at: Optional[datetime] = None
+        self.last_drift: Dict[int, Dict[int, Dict[str, int]]] = {}
+        self.total_drift_events = 0
+        self.last_summary_drift: Dict[int, Dict[int, Dict[str, int]]] = {}
+        self.total_summary_repairs = 0
+
+    def _load_counts(self, db: Session, event_id: int):
+        return self._sum_shards(load_tally_shards(db, event_id))
+
+    @staticmethod
+    def _sum_shards(shard_rows) -> Tuple[Dict[int, Dict[str, int]], Dict[Tuple[int, int], ShardVersions]]:
+        counts: Dict[int, Dict[str, int]] = {}
+        versions: Dict[Tuple[int, int], ShardVersions] = {}
+        for candidate_id, shard, yes, no, neutral, version in shard_rows:
+            versions[(candidate_id, shard)] = ShardVersions(version)
+            if not (yes or no or neutral):
+                continue
+            bucket = counts.setdefault(candidate_id, {"yes": 0, "no": 0, "neutral": 0})
+            bucket["yes"] += yes
+            bucket["no"] += no
+            bucket["neutral"] += neutral
+        return counts, versions
+
+    def is_loaded(self, event_id: int) -> bool:
+        return event_id in self._tallies
+
+    def generation(self, event_id: int) -> int:
+        """Changes whenever any counter of the event changes."""
+        return self._generations.get(event_id, 0)
+
+    def seed(self, db: Session, event_id: int):
+        """(Re)load all counters for an event from the database."""
+        counts, versions = self._load_counts(db, event_id)
+        with self._lock:
+            self._tallies[event_id] = counts
+            self._versions[event_id] = versions
+            self._generations[event_id] = self._generations.get(event_id, 0) + 1
+        logger.info(f"Tally engine seeded for event {event_id}: {len(counts)} candidates")
+
+    def get(self, db: Session, event_id: int, candidate_id: int) -> dict:
+        """Return the tally for a candidate, seeding the event on first access."""
+        if event_id not in self._tallies:
+            self.seed(db, event_id)
+
+        bucket = self._tallies.get(event_id, {}).get(candidate_id)
+        if not bucket:
+            return empty_tally()
+
+        yes, no, neutral = bucket["yes"], bucket["no"], bucket["neutral"]
+        return {"yes": yes, "no": no, "neutral": neutral, "total": yes + no + neutral}
+
+    def counts_key(self, db: Session, event_id: int) -> tuple:
+        """The event's counters as a hashable value, the same on every worker that applied the same votes."""
+        if event_id not in self._tallies:
+            self.seed(db, event_id)
+        with self._lock:
+            counts = self._tallies.get(event_id, {})
+            return tuple(sorted(
+                (candidate_id, bucket["yes"], bucket["no"], bucket["neutral"])
+                for candidate_id, bucket in counts.items()
+            ))
+
+    def begin_write(self, event_ids: Iterable[int]):
+        """Mark events whose votes are being committed; pair with ``end_write``.
+
+        Reconcile skips these events: between the commit and ``record_many``
+        the DB already holds the batch while the counters do not, and adopting
+        the DB counts would make ``record_many`` count the batch twice.
+        """
+        with self._lock:
+            for event_id in event_ids:
+                self._writing[event_id] = self._writing.get(event_id, 0) + 1
+
+    def end_write(self, event_ids: Iterable[int]):
+        """The batch was recorded (or failed); counts read meanwhile are stale."""
+        with self._lock:
+            for event_id in event_ids:
+                remaining = self._writing.get(event_id, 0) - 1
+                if remaining > 0:
+                    self._writing[event_id] = remaining
+                else:
+                    self._writing.pop(event_id, None)
+                if event_id in self._generations:
+                    self._generations[event_id] += 1
+
+    def record(self, event_id: int, candidate_id: int, vote_type: str, count: int = 1):
+        """Apply committed votes to the counters."""
+        self.record_many([(event_id, candidate_id, vote_type, count)])
+
+    def record_many(self, votes: List[Tuple[int, int, str, int]], stamps: Iterable[TallyStamp] = ()):
+        """Apply a batch of committed ``(event_id, candidate_id, vote_type, count)``.
+
+        ``stamps`` are the summary row versions the batch's transaction wrote
+        (one per candidate); candidates whose increment the counters already
+        hold are skipped.
+        """
+        if not votes:
+            return
+        stamps = list(stamps)
+        self._record(votes, stamps)
+        broadcast_bus.publish("tally", {"op": "record", "votes": votes, "stamps": stamps})
+
+    def _record(self, votes: Iterable[Tuple[int, int, str, int]], stamps: Iterable[TallyStamp] = ()):
+        with self._lock:
+            counted = set()
+            for event_id, candidate_id, shard, version in stamps:
+                event_versions = self._versions.get(event_id)
+                if event_versions is None:
+                    continue
+                shard_versions = event_versions.setdefault((candidate_id, shard), ShardVersions())
+                if not shard_versions.claim(version):
+                    counted.add((event_id, candidate_id))
+
+            for event_id, candidate_id, vote_type, count in votes:
+                if vote_type not in VOTE_TYPES or (event_id, candidate_id) in counted:
+                    continue
+                event_tallies = self._tallies.get(event_id)
+                if event_tallies is None:
+                    # Not seeded yet: the first read will load the committed row
+                    continue
+                bucket = event_tallies.setdefault(candidate_id, {"yes": 0, "no": 0, "neutral": 0})
+                bucket[vote_type] += count
+                self._generations[event_id] = self._generations.get(event_id, 0) + 1
+
+    def reset_candidates(self, event_id: int, candidate_ids: Iterable[int]):
+        """Zero the counters after a candidate's or group's votes were cleared."""
+        candidate_ids = list(candidate_ids)
+        self._reset_candidates(event_id, candidate_ids)
+        broadcast_bus.publish("tally", {"op": "reset_candidates", "event_id": event_id, "candidate_ids": candidate_ids})
+
+    def _reset_candidates(self, event_id: int, candidate_ids: List[int]):
+        with self._lock:
+            event_tallies = self._tallies.get(event_id)
+            if event_tallies is None:
+                return
+            for candidate_id in candidate_ids:
+                event_tallies.pop(candidate_id, None)
+            # The summary rows were deleted, so their versions start over
+            event_versions = self._versions.get(event_id, {})
+            for key in [key for key in event_versions if key[0] in candidate_ids]:
+                del event_versions[key]
+            self._generations[event_id] = self._generations.get(event_id, 0) + 1
+
+    def reset_event(self, event_id: int):
+        """Zero all counters after every vote of the event was deleted."""
+        self._reset_event(event_id)
+        broadcast_bus.publish("tally", {"op": "reset_event", "event_id": event_id})
+
+    def _reset_event(self, event_id: int):
+        with self._lock:
+            self._tallies[event_id] = {}
+            self._versions[event_id] = {}
+            self._generations[event_id] = self._generations.get(event_id, 0) + 1
+
+    def drop(self, event_id: int):
+        """Forget an event entirely (e.g. when it is deleted)."""
+        self._drop(event_id)
+        broadcast_bus.publish("tally", {"op": "drop", "event_id": event_id})
+
+    def _drop(self, event_id: int):
+        with self._lock:
+            self._tallies.pop(event_id, None)
+            self._versions.pop(event_id, None)
+            self._generations.pop(event_id, None)
+            self.last_drift.pop(event_id, None)
+
+    def apply_remote(self, payload: dict):
+        """Apply a mutation published by another worker."""
+        op = payload["op"]
+        if op == "record":
+            self._record(
+                [tuple(vote) for vote in payload["votes"]],
+                [tuple(stamp) for stamp in payload.get("stamps", ())],
+            )
+        elif op == "reset_candidates":
+            self._reset_candidates(payload["event_id"], payload["candidate_ids"])
+        elif op == "reset_event":
+            self._reset_event(payload["event_id"])
+        elif op == "drop":
+            self._drop(payload["event_id"])
+
+    def reconcile(self, db: Session, event_id: int) -> Optional[Dict[int, Dict[str, int]]]:
+        """Compare the counters and the summary table with the ``votes`` rows and correct them.
+
+        Returns a ``candidate_id -> {vote_type: memory - votes}`` map of the
+        counter drift found (empty when consistent), or ``None`` if the event
+        was busy and the comparison was skipped.
+        """
+        loaded, generation = self._reconcile_generation(event_id)
+        if not loaded:
+            return {}
+        if generation is None:
+            return None
+
+        vote_counts, shard_rows = load_vote_state(db, event_id)
+        summary_counts, db_versions = self._sum_shards(shard_rows)
+        summary_drift = count_drift(summary_counts, vote_counts)
+        if summary_drift:
+            self._repair_summary(db, event_id, summary_drift)
+            # The correction went through record_many; compare the counters
+            # with the repaired table
+            loaded, generation = self._reconcile_generation(event_id)
+            if not loaded:
+                return {}
+            if generation is None:
+                return None
+            vote_counts, shard_rows = load_vote_state(db, event_id)
+            _, db_versions = self._sum_shards(shard_rows)
+
+        with self._lock:
+            if self._generations.get(event_id) != generation or self._writing.get(event_id):
+                # Votes were written or applied while we were reading, try again next round
+                return None
+
+            drift = count_drift(self._tallies.get(event_id, {}), vote_counts)
+            # Nothing was applied since the read, so the counters now match
+            # (or are replaced by) exactly the increments the read saw
+            self._versions[event_id] = db_versions
+            if drift:
+                self._tallies[event_id] = vote_counts
+                self._generations[event_id] = generation + 1
+                self.last_drift[event_id] = drift
+                self.total_drift_events += 1
+            else:
+                self.last_drift.pop(event_id, None)
+
+        if drift:
+            logger.warning(f"Tally drift corrected for event {event_id}: {drift}")
+        return drift
+
+    def _reconcile_generation(self, event_id: int) -> Tuple[bool, Optional[int]]:
+        """(loaded, generation to compare against); the generation is None while a batch is being written."""
+        with self._lock:
+            if event_id not in self._generations:
+                return False, None
+            if self._writing.get(event_id):
+                # A batch is between commit and record_many, try again next round
+                return True, None
+            return True, self._generations[event_id]
+
+    def _repair_summary(self, db: Session, event_id: int, drift: Dict[int, Dict[str, int]]):
+        """Bring the summary rows back to the ``votes`` counts and tell every worker."""
+        deltas = {
+            candidate_id: {vote_type: -diff for vote_type, diff in candidate_drift.items()}
+            for candidate_id, candidate_drift in drift.items()
+        }
+        stamps = repair_tallies(db, event_id, deltas)
+        db.commit()
+        self.last_summary_drift[event_id] = drift
+        self.total_summary_repairs += 1
+        logger.warning(f"Results summary drift corrected for event {event_id}: {drift}")
+        # Applied like any other increment, so counters that were loaded from
+        # the broken rows get the correction exactly once
+        self.record_many([
+            (event_id, candidate_id, vote_type, delta)
+            for candidate_id, candidate_deltas in sorted(deltas.items())
+            for vote_type, delta in candidate_deltas.items()
+        ], stamps)
+
+    def reconcile_all(self, session_factory: Callable[[], Session]):
+        """Reconcile every loaded event using a fresh session."""
+        db = session_factory()
+        try:
+            for event_id in list(self._tallies.keys()):
+                self.reconcile(db, event_id)
+        finally:
+            db.close()
+        self.last_reconcile_at = datetime.now(timezone.utc)
+
+    def start(self, session_factory: Callable[[], Session]):
+        """Start the periodic reconciliation loop."""
+        if self._reconcile_task or self.reconcile_interval <= 0:
+            return
+
+        async def _reconcile_loop():
+            while True:
+                await asyncio.sleep(self.reconcile_interval)
+                try:
+                    # DB reads happen off the event loop
+                    await asyncio.to_thread(self.reconcile_all, session_factory)
+                except Exception as e:
+                    logger.error(f"Tally reconciliation error: {e}")
+
+        self._reconcile_task = asyncio.create_task(_reconcile_loop())
+
+    async def stop(self):
+        task = self._reconcile_task
+        self._reconcile_task = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> dict:
+        """Get tally engine statistics for monitoring."""
+        return {
+            "events_loaded": len(self._tallies),
+            "reconcile_interval_sec": self.reconcile_interval,
+            "last_reconcile_at": self.last_reconcile_at.isoformat() if self.last_reconcile_at else None,
+            "total_drift_events": self.total_drift_events,
+            "events_with_drift": {str(k): v for k, v in self.last_drift.items()},
+            "total_summary_repairs": self.total_summary_repairs,
+            "events_with_summary_drift": {str(k): v for k, v in self.last_summary_drift.items()},
+        }
+
+
+tally_engine = TallyEngine()
+broadcast_bus.subscribe("tally", tally_engine.apply_remote)
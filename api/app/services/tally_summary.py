@@ -0,0 +1,174 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func, literal, union_all
+import random
+
+from ..core.config import settings
+from ..core.database import dialect_insert, is_sqlite
+from ..models.tally import EventCandidateTally
+from ..models.vote import Vote
+
+VOTE_COLUMNS = {"yes": "yes_votes", "no": "no_votes", "neutral": "neutral_votes"}
+
+
+# (event_id, candidate_id, shard, version) of one shard row increment
+TallyStamp = Tuple[int, int, int, int]
+
+
+async def increment_tallies(db: AsyncSession, rows: List[dict]) -> List[TallyStamp]:
+    """Add freshly inserted vote rows to the results summary table.
+
+    The whole batch goes to one randomly picked shard row per candidate, so
+    concurrent transactions on Postgres mostly update different rows. SQLite
+    has a single writer anyway and keeps one row per candidate.
+
+    Returns the new version of every incremented row.
+    """
+    if not rows:
+        return []
+
+    per_candidate: Dict[Tuple[int, int], Dict[str, int]] = {}
+    for row in rows:
+        column = VOTE_COLUMNS.get(row["vote_type"])
+        if column is None:
+            continue
+        counts = per_candidate.setdefault(
+            (row["event_id"], row["candidate_id"]),
+            {"yes_votes": 0, "no_votes": 0, "neutral_votes": 0}
+        )
+        counts[column] += 1
+
+    if not per_candidate:
+        return []
+
+    shard = 0 if is_sqlite else random.randrange(max(settings.TALLY_SHARDS, 1))
+    # Sorted so concurrent batches lock rows in the same order
+    result = await db.execute(_add_to_shard(), [
+        {"event_id": event_id, "candidate_id": candidate_id, "shard": shard, "version": 1, **counts}
+        for (event_id, candidate_id), counts in sorted(per_candidate.items())
+    ])
+    return [tuple(row) for row in result.all()]
+
+
+def _add_to_shard():
+    """Upsert adding the given counts to a shard row and bumping its version."""
+    stmt = dialect_insert(EventCandidateTally)
+    return stmt.on_conflict_do_update(
+        index_elements=["event_id", "candidate_id", "shard"],
+        set_={
+            **{
+                column: getattr(EventCandidateTally, column) + getattr(stmt.excluded, column)
+                for column in VOTE_COLUMNS.values()
+            },
+            "version": EventCandidateTally.version + 1,
+        }
+    ).returning(
+        EventCandidateTally.event_id,
+        EventCandidateTally.candidate_id,
+        EventCandidateTally.shard,
+        EventCandidateTally.version,
+    )
+
+
+def repair_tallies(db: Session, event_id: int, deltas: Dict[int, Dict[str, int]]) -> List[TallyStamp]:
+    """Add ``candidate_id -> {vote_type: delta}`` corrections to shard 0; the caller commits.
+
+    Returns the new version of every corrected row.
+    """
+    result = db.execute(_add_to_shard(), [
+        {
+            "event_id": event_id,
+            "candidate_id": candidate_id,
+            "shard": 0,
+            "version": 1,
+            **{column: delta.get(vote_type, 0) for vote_type, column in VOTE_COLUMNS.items()},
+        }
+        for candidate_id, delta in sorted(deltas.items())
+    ])
+    return [tuple(row) for row in result.all()]
+
+
+def load_tallies(db: Session, event_id: int) -> Dict[int, Tuple[int, int, int]]:
+    """(yes, no, neutral) per candidate of an event, summed over shards."""
+    rows = db.execute(
+        select(
+            EventCandidateTally.candidate_id,
+            func.sum(EventCandidateTally.yes_votes),
+            func.sum(EventCandidateTally.no_votes),
+            func.sum(EventCandidateTally.neutral_votes),
+        ).where(
+            EventCandidateTally.event_id == event_id
+        ).group_by(EventCandidateTally.candidate_id)
+    ).all()
+    return {
+        candidate_id: (yes or 0, no or 0, neutral or 0)
+        for candidate_id, yes, no, neutral in rows
+    }
+
+
+def load_vote_state(db: Session, event_id: int):
+    """Counts from the ``votes`` table plus every summary shard row of an event.
+
+    Returns ``({candidate_id: {vote_type: count}}, [(candidate_id, shard, yes,
+    no, neutral, version), ...])``. A single statement, so both come from the
+    same snapshot.
+    """
+    votes = select(
+        literal("votes").label("source"),
+        Vote.candidate_id,
+        Vote.vote_type,
+        literal(0).label("shard"),
+        func.count(Vote.id).label("first"),
+        literal(0).label("second"),
+        literal(0).label("third"),
+        literal(0).label("version"),
+    ).where(
+        Vote.event_id == event_id,
+        Vote.vote_type.in_(list(VOTE_COLUMNS))
+    ).group_by(Vote.candidate_id, Vote.vote_type)
+    shards = select(
+        literal("tallies"),
+        EventCandidateTally.candidate_id,
+        literal(""),
+        EventCandidateTally.shard,
+        EventCandidateTally.yes_votes,
+        EventCandidateTally.no_votes,
+        EventCandidateTally.neutral_votes,
+        EventCandidateTally.version,
+    ).where(EventCandidateTally.event_id == event_id)
+
+    vote_counts: Dict[int, Dict[str, int]] = {}
+    shard_rows = []
+    for source, candidate_id, vote_type, shard, first, second, third, version in db.execute(union_all(votes, shards)):
+        if source == "votes":
+            vote_counts.setdefault(candidate_id, {"yes": 0, "no": 0, "neutral": 0})[vote_type] = first
+        else:
+            shard_rows.append((candidate_id, shard, first, second, third, version))
+    return vote_counts, shard_rows
+
+
+def load_tally_shards(db: Session, event_id: int) -> List[Tuple[int, int, int, int, int, int]]:
+    """(candidate_id, shard, yes, no, neutral, version) of every shard row of an event.
+
+    A single statement, so counts and versions come from the same snapshot.
+    """
+    rows = db.execute(
+        select(
+            EventCandidateTally.candidate_id,
+            EventCandidateTally.shard,
+            EventCandidateTally.yes_votes,
+            EventCandidateTally.no_votes,
+            EventCandidateTally.neutral_votes,
+            EventCandidateTally.version,
+        ).where(EventCandidateTally.event_id == event_id)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+def clear_tallies(db: Session, event_id: int, candidate_ids: Optional[Iterable[int]] = None):
+    """Drop the summary rows of an event (or some of its candidates) whose votes were deleted; the caller commits."""
+    stmt = delete(EventCandidateTally).where(EventCandidateTally.event_id == event_id)
+    if candidate_ids is not None:
+        stmt = stmt.where(EventCandidateTally.candidate_id.in_(list(candidate_ids)))
+    db.execute(stmt)
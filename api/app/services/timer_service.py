@@ -0,0 +1,197 @@
+from typing import Callable, Optional
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+
+from ..core.database import AsyncSessionLocal, dialect_insert
+from ..models.event import Event, EventCandidate, EventStatus
+from ..models.timer import TimerLease
+from .broadcast_bus import broadcast_bus
+from .websocket_manager import manager
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_utc(dt: datetime | None):
+    if not dt:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+class TimerService:
+    """Fires ``timer_expired`` when a candidate's voting time runs out.
+
+    Deadlines come from the persisted ``timer_started_at`` plus the timer
+    duration, so running timers are re-armed after a restart. Every worker
+    arms every timer (arm/cancel are relayed over the broadcast bus); when
+    one is due, the workers race to insert its ``TimerLease`` row and only
+    the winner broadcasts the expiry.
+
+    Time is read from ``manager.clock`` so tests can swap in a VirtualClock.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.fired = 0
+        self.lost_claims = 0
+        self.rearmed = 0
+
+    @property
+    def clock(self):
+        return manager.clock
+
+    async def start(self):
+        """Re-arm the timers of all active events from the database."""
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self.rearm_all()
+        except Exception as e:
+            logger.error(f"Failed to re-arm timers: {e}")
+
+    async def rearm_all(self):
+        async with self._session_factory() as db:
+            events = (await db.scalars(
+                select(Event).where(Event.status == EventStatus.active)
+            )).all()
+            for event in events:
+                event_candidates = (await db.scalars(
+                    select(EventCandidate).where(
+                        EventCandidate.event_id == event.id
+                    ).order_by(EventCandidate.order)
+                )).all()
+                if not 0 <= event.current_candidate_index < len(event_candidates):
+                    continue
+                ec = event_candidates[event.current_candidate_index]
+                if not ec.timer_started_at:
+                    continue
+                # Already expired timers fire right away unless another
+                # process holds their lease
+                self._arm(event.id, event.link, ec.id, ec.timer_started_at,
+                          ec.timer_duration_sec or event.duration_sec or 0)
+                self.rearmed += 1
+
+        if self.rearmed:
+            logger.info(f"Re-armed {self.rearmed} voting timers")
+
+    def arm(self, event_id: int, event_link: str, event_candidate_id: int, started_at: datetime, duration_sec: float):
+        """Arm a timer on every worker; any previous timer of the event is replaced."""
+        self._arm(event_id, event_link, event_candidate_id, started_at, duration_sec)
+        broadcast_bus.publish("timer", {
+            "op": "arm",
+            "event_id": event_id,
+            "event_link": event_link,
+            "event_candidate_id": event_candidate_id,
+            "started_at": ensure_utc(started_at).isoformat(),
+            "duration_sec": duration_sec,
+        })
+
+    def cancel(self, event_link: str):
+        """Cancel an event's timer on every worker."""
+        self._cancel(event_link)
+        broadcast_bus.publish("timer", {"op": "cancel", "event_link": event_link})
+
+    def _arm(self, event_id: int, event_link: str, event_candidate_id: int, started_at: datetime, duration_sec: float):
+        deadline = ensure_utc(started_at) + timedelta(seconds=duration_sec)
+        delay = (deadline - self.clock.now()).total_seconds()
+        on_expire = partial(self._expire, event_id, event_link, event_candidate_id, started_at)
+        self._call_in_loop(manager.schedule_timer_expiry, event_link, delay, on_expire)
+
+    def _cancel(self, event_link: str):
+        self._call_in_loop(manager.cancel_timer, event_link)
+
+    def _call_in_loop(self, fn, *args):
+        # Sync admin routes (e.g. stop event) run in the threadpool
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self._loop is not None and running_loop is not self._loop:
+            self._loop.call_soon_threadsafe(fn, *args)
+        else:
+            fn(*args)
+
+    def apply_remote(self, payload: dict):
+        """Apply an arm/cancel published by another worker."""
+        if payload["op"] == "arm":
+            self._arm(
+                payload["event_id"],
+                payload["event_link"],
+                payload["event_candidate_id"],
+                datetime.fromisoformat(payload["started_at"]),
+                payload["duration_sec"],
+            )
+        elif payload["op"] == "cancel":
+            self._cancel(payload["event_link"])
+
+    async def _claim(self, db: AsyncSession, event_id: int, event_candidate_id: int, started_at: datetime) -> bool:
+        stmt = dialect_insert(TimerLease).values(
+            event_id=event_id,
+            event_candidate_id=event_candidate_id,
+            timer_started_at=ensure_utc(started_at).replace(tzinfo=None),
+            owner=broadcast_bus.worker_id,
+            claimed_at=datetime.utcnow(),
+        ).on_conflict_do_nothing(
+            index_elements=["event_candidate_id", "timer_started_at"]
+        ).returning(TimerLease.id)
+        return (await db.execute(stmt)).first() is not None
+
+    async def _expire(self, event_id: int, event_link: str, event_candidate_id: int, started_at: datetime):
+        from ..routes.websocket import load_display_update_payload
+
+        async with self._session_factory() as db:
+            event = await db.get(Event, event_id)
+            if not event or event.status != EventStatus.active:
+                return
+
+            # Re-check that the timer actually expired (wasn't restarted or moved on)
+            ordered_ids = (await db.scalars(
+                select(EventCandidate.id).where(
+                    EventCandidate.event_id == event_id
+                ).order_by(EventCandidate.order)
+            )).all()
+            if not 0 <= event.current_candidate_index < len(ordered_ids):
+                return
+            if ordered_ids[event.current_candidate_index] != event_candidate_id:
+                return
+            ec = await db.get(EventCandidate, event_candidate_id)
+            if ensure_utc(ec.timer_started_at) != ensure_utc(started_at):
+                return
+            candidate_id = ec.candidate_id
+            # End the read transaction first: on SQLite a reader can't take the
+            # write lock once another worker has claimed, it fails right away
+            await db.rollback()
+
+            if not await self._claim(db, event_id, event_candidate_id, started_at):
+                # Another process fired this expiry
+                self.lost_claims += 1
+                return
+            await db.commit()
+            self.fired += 1
+
+            await manager.broadcast_vote(event_link, {
+                "type": "timer_expired",
+                "candidate_id": candidate_id,
+            })
+
+            # Refresh display with updated timer state
+            display_payload = await db.run_sync(load_display_update_payload, event_id)
+            await manager.broadcast_display(event_link, display_payload)
+
+    def get_stats(self) -> dict:
+        """Get timer statistics for monitoring."""
+        return {
+            "fired": self.fired,
+            "lost_claims": self.lost_claims,
+            "rearmed": self.rearmed,
+        }
+
+
+timer_service = TimerService(AsyncSessionLocal)
+broadcast_bus.subscribe("timer", timer_service.apply_remote)
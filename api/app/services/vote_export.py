@@ -0,0 +1,105 @@
+from typing import Iterator, Optional
+from sqlalchemy import select
+import csv
+import io
+import zlib
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.serialization import dumps
+from ..models.candidate import Candidate
+from ..models.vote import Vote
+
+EXPORT_COLUMNS = [
+    "id", "event_candidate_id", "candidate_id", "candidate_name", "vote_type",
+    "ip_address", "device_id", "voter_key", "nonce", "timestamp",
+]
+
+# Rows fetched from the cursor at a time within a page
+FETCH_SIZE = 1000
+
+# Spreadsheets evaluate cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def iter_vote_pages(event_id: int, page_size: int) -> Iterator[list]:
+    """Votes of an event in id order, in batches of at most FETCH_SIZE rows.
+
+    Keyset pagination (``id > last id``) keeps every page an indexed range
+    scan, and each page runs in its own short session, so a long export
+    neither holds a transaction open nor re-reads skipped rows. Within a
+    page rows are streamed from a server-side cursor via ``yield_per``.
+    """
+    last_id = 0
+    while True:
+        stmt = select(
+            Vote.id, Vote.event_candidate_id, Vote.candidate_id, Candidate.full_name,
+            Vote.vote_type, Vote.ip_address, Vote.device_id, Vote.voter_key,
+            Vote.nonce, Vote.timestamp,
+        ).outerjoin(
+            Candidate, Candidate.id == Vote.candidate_id
+        ).where(
+            Vote.event_id == event_id,
+            Vote.id > last_id
+        ).order_by(Vote.id).limit(page_size)
+
+        fetched = 0
+        with SessionLocal() as db:
+            result = db.execute(stmt.execution_options(yield_per=min(FETCH_SIZE, page_size)))
+            for partition in result.partitions():
+                fetched += len(partition)
+                last_id = partition[-1].id
+                yield partition
+
+        if fetched < page_size:
+            return
+
+
+def csv_cell(value):
+    """Client-supplied text (device id, nonce, names) quoted so it can't run as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_chunks(event_id: int, page_size: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in iter_vote_pages(event_id, page_size):
+        for row in rows:
+            writer.writerow([
+                *(csv_cell(value) for value in row[:-1]),
+                row.timestamp.isoformat() if row.timestamp else "",
+            ])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only when the event has no votes
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunks(event_id: int, page_size: int) -> Iterator[bytes]:
+    for rows in iter_vote_pages(event_id, page_size):
+        yield b"".join(dumps(dict(zip(EXPORT_COLUMNS, row))) + b"\n" for row in rows)
+
+
+def _gzipped(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_votes(event_id: int, export_format: str, gzip: bool = False, page_size: Optional[int] = None) -> Iterator[bytes]:
+    """Raw votes of an event as CSV or NDJSON bytes, optionally gzipped.
+
+    Memory use depends on the page size, not on the number of votes.
+    """
+    page_size = max(page_size or settings.VOTE_EXPORT_PAGE_SIZE, 1)
+    chunks = _csv_chunks(event_id, page_size) if export_format == "csv" else _ndjson_chunks(event_id, page_size)
+    return _gzipped(chunks) if gzip else chunks
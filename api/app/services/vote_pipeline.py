@@ -0,0 +1,278 @@
+from typing import Callable, List, Optional, Set, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+import time
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal, dialect_insert
+from ..models.vote import Vote
+from .event_cache import event_cache
+from .results_snapshot import drop_closed_results
+from .tally_engine import tally_engine
+from .tally_summary import TallyStamp, increment_tallies
+from .voter_registry import register_inserted_votes
+
+logger = logging.getLogger(__name__)
+
+
+class VoteSubmission:
+    """A cast vote (first row) plus its auto-votes, written together."""
+
+    __slots__ = ("rows", "future", "enqueued_at", "inserted")
+
+    def __init__(self, rows: List[dict], future: asyncio.Future):
+        self.rows = rows
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+        self.inserted: List[dict] = []
+
+
+def voter_unique_key(row: dict) -> Tuple:
+    return (row["event_id"], row["candidate_id"], row["voter_key"])
+
+
+async def insert_ignoring_duplicates(db: AsyncSession, rows: List[dict]) -> Set[Tuple]:
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING; return the keys actually written."""
+    if not rows:
+        return set()
+    stmt = dialect_insert(Vote).on_conflict_do_nothing(
+        index_elements=["event_id", "candidate_id", "voter_key"]
+    ).returning(Vote.event_id, Vote.candidate_id, Vote.voter_key)
+    result = await db.execute(stmt, rows)
+    return {tuple(row) for row in result}
+
+
+async def ips_already_voted(db: AsyncSession, rows: List[dict]) -> Set[Tuple]:
+    """(event_id, candidate_id, ip_address) of the given rows that already have a vote from that IP."""
+    if not rows:
+        return set()
+    keys = {(row["event_id"], row["candidate_id"], row["ip_address"]) for row in rows}
+    result = await db.execute(
+        select(Vote.event_id, Vote.candidate_id, Vote.ip_address).where(
+            tuple_(Vote.event_id, Vote.candidate_id, Vote.ip_address).in_(list(keys))
+        ).distinct()
+    )
+    return {tuple(row) for row in result}
+
+
+class VoteWriteBehind:
+    """Group-commit pipeline for vote inserts.
+
+    Submitters enqueue their rows and await a future. A single background
+    flusher drains the queue every ``VOTE_BATCH_MAX_WAIT_MS`` or once
+    ``VOTE_BATCH_MAX_SIZE`` submissions are waiting, writes the whole batch in
+    one transaction and only then resolves the futures, so a confirmation is
+    never sent for a vote that is not durable.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self.max_batch_size = settings.VOTE_BATCH_MAX_SIZE
+        self.max_wait_sec = settings.VOTE_BATCH_MAX_WAIT_MS / 1000
+
+        # Metrics
+        self.total_batches = 0
+        self.total_submissions = 0
+        self.total_votes = 0
+        self.total_duplicates = 0
+        self.total_failures = 0
+        self.last_batch_size = 0
+        self.max_batch_seen = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._flush_ms_sum = 0.0
+        self.last_wait_ms = 0.0
+
+    def _ensure_started(self):
+        if self._flusher_task is None or self._flusher_task.done():
+            self._queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    def start(self):
+        """Start the background flusher on the running event loop."""
+        self._ensure_started()
+
+    async def stop(self):
+        """Flush everything still queued and stop the flusher."""
+        task = self._flusher_task
+        if not task:
+            return
+        await self._queue.join()
+        self._flusher_task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, rows: List[dict]) -> List[dict]:
+        """Queue vote rows and wait until they are committed.
+
+        Returns the rows that were actually inserted. An empty list means the
+        cast vote (``rows[0]``) was a duplicate, in which case its auto-votes
+        are not written either.
+        """
+        self._ensure_started()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(VoteSubmission(rows, future))
+        return await future
+
+    async def _flush_loop(self):
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+
+            # Collect more submissions until the batch is full or the window closes
+            deadline = time.perf_counter() + self.max_wait_sec
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            started = time.perf_counter()
+            # Held until the batch is recorded so reconcile can't adopt it early
+            event_ids = {s.rows[0]["event_id"] for s in batch}
+            tally_engine.begin_write(event_ids)
+            try:
+                try:
+                    stamps = await self._write_batch(batch)
+                except Exception as e:
+                    logger.error(f"Vote batch of {len(batch)} failed: {e}")
+                    await self._write_individually(batch, e)
+                else:
+                    self._record(batch, stamps)
+
+                # Failed submissions already hold their exception
+                for submission in batch:
+                    if not submission.future.done():
+                        submission.future.set_result(submission.inserted)
+            finally:
+                tally_engine.end_write(event_ids)
+                for _ in batch:
+                    self._queue.task_done()
+
+            flush_ms = (time.perf_counter() - started) * 1000
+            self.total_batches += 1
+            self.total_submissions += len(batch)
+            self.total_votes += sum(len(s.inserted) for s in batch)
+            self.total_duplicates += sum(1 for s in batch if not s.inserted)
+            self.last_batch_size = len(batch)
+            self.max_batch_seen = max(self.max_batch_seen, len(batch))
+            self.last_flush_ms = flush_ms
+            self.max_flush_ms = max(self.max_flush_ms, flush_ms)
+            self._flush_ms_sum += flush_ms
+            self.last_wait_ms = (started - first.enqueued_at) * 1000
+
+    async def _write_individually(self, batch: List[VoteSubmission], error: Exception):
+        """Retry a failed batch one submission at a time so only the faulty ones fail."""
+        if len(batch) == 1:
+            self._fail(batch[0], error)
+            return
+
+        for submission in batch:
+            try:
+                stamps = await self._write_batch([submission])
+            except Exception as e:
+                logger.error(f"Vote submission failed: {e}")
+                self._fail(submission, e)
+            else:
+                self._record([submission], stamps)
+
+    def _record(self, written: List[VoteSubmission], stamps: List[TallyStamp]):
+        """Apply one committed write to the in-memory tallies."""
+        tally_engine.record_many([
+            (row["event_id"], row["candidate_id"], row["vote_type"], 1)
+            for submission in written
+            for row in submission.inserted
+        ], stamps)
+
+    def _fail(self, submission: VoteSubmission, error: Exception):
+        self.total_failures += 1
+        submission.inserted = []
+        if not submission.future.done():
+            submission.future.set_exception(error)
+
+    async def _write_batch(self, batch: List[VoteSubmission]) -> List[TallyStamp]:
+        """Write submissions in one transaction; return the summary row versions it produced."""
+        async with self._session_factory() as db:
+            try:
+                # A vote without a device id is a duplicate of any earlier
+                # vote from the same IP, whatever device that one came from
+                cast_rows = [s.rows[0] for s in batch]
+                taken = await ips_already_voted(db, [row for row in cast_rows if not row.get("device_id")])
+                cast_rows = [
+                    row for row in cast_rows
+                    if (row["event_id"], row["candidate_id"], row["ip_address"]) not in taken
+                ]
+                # Cast votes first: the unique voter key decides duplicates
+                written = await insert_ignoring_duplicates(db, cast_rows)
+                accepted = []
+                for submission in batch:
+                    submission.inserted = []
+                    key = voter_unique_key(submission.rows[0])
+                    # Same voter twice in one batch: only the first one wins
+                    if key in written:
+                        written.discard(key)
+                        submission.inserted.append(submission.rows[0])
+                        accepted.append(submission)
+
+                # Auto-votes only for accepted cast votes; existing ones are skipped
+                auto_rows = [row for s in accepted for row in s.rows[1:]]
+                written = await insert_ignoring_duplicates(db, auto_rows)
+                for submission in accepted:
+                    for row in submission.rows[1:]:
+                        key = voter_unique_key(row)
+                        if key in written:
+                            written.discard(key)
+                            submission.inserted.append(row)
+
+                # Participant and unique-voter counters grow by increments only
+                inserted = [row for s in accepted for row in s.inserted]
+                await register_inserted_votes(db, inserted)
+                # Results summary rows commit (or roll back) with the votes
+                stamps = await increment_tallies(db, inserted)
+                # A vote accepted just before its event closed must not leave
+                # the frozen results stale
+                reopened = await drop_closed_results(db, {row["event_id"] for row in inserted})
+
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        for event_id in reopened:
+            logger.warning(f"Votes landed on closed event {event_id}, its results will be frozen again")
+            event_cache.invalidate(event_id)
+        return stamps
+
+    def get_stats(self) -> dict:
+        """Get pipeline statistics for monitoring."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_sec * 1000,
+            "total_batches": self.total_batches,
+            "total_submissions": self.total_submissions,
+            "total_votes": self.total_votes,
+            "total_duplicates": self.total_duplicates,
+            "total_failures": self.total_failures,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_seen": self.max_batch_seen,
+            "avg_batch_size": round(self.total_submissions / self.total_batches, 2) if self.total_batches else 0,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+            "avg_flush_ms": round(self._flush_ms_sum / self.total_batches, 2) if self.total_batches else 0,
+            "last_queue_wait_ms": round(self.last_wait_ms, 2),
+        }
+
+
+vote_pipeline = VoteWriteBehind(AsyncSessionLocal)
@@ -0,0 +1,75 @@
+from typing import Dict, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func
+
+from ..core.database import dialect_insert
+from ..models.event import Event, EventCandidate
+from ..models.vote import Vote
+from ..models.voter import EventVoter
+
+
+async def register_inserted_votes(db: AsyncSession, rows: List[dict]):
+    """Bump participant_count and unique_voters for freshly inserted vote rows.
+
+    Each inserted row is a new (event, candidate, voter_key), so it adds one
+    participant to its candidate. The event-wide count only grows when the
+    voter key is seen for the first time in ``event_voters``.
+    """
+    if not rows:
+        return
+
+    per_candidate: Dict[Tuple[int, int], int] = {}
+    voters = set()
+    for row in rows:
+        key = (row["event_id"], row["candidate_id"])
+        per_candidate[key] = per_candidate.get(key, 0) + 1
+        voters.add((row["event_id"], row["voter_key"]))
+
+    for (event_id, candidate_id), count in per_candidate.items():
+        await db.execute(
+            update(EventCandidate).where(
+                EventCandidate.event_id == event_id,
+                EventCandidate.candidate_id == candidate_id
+            ).values(participant_count=func.coalesce(EventCandidate.participant_count, 0) + count)
+        )
+
+    stmt = dialect_insert(EventVoter).on_conflict_do_nothing(
+        index_elements=["event_id", "voter_key"]
+    ).returning(EventVoter.event_id)
+    result = await db.execute(
+        stmt,
+        [{"event_id": event_id, "voter_key": voter_key} for event_id, voter_key in sorted(voters)]
+    )
+
+    new_voters: Dict[int, int] = {}
+    for (event_id,) in result:
+        new_voters[event_id] = new_voters.get(event_id, 0) + 1
+
+    for event_id, count in new_voters.items():
+        await db.execute(
+            update(Event).where(Event.id == event_id).values(
+                unique_voters=func.coalesce(Event.unique_voters, 0) + count
+            )
+        )
+
+
+def rebuild_event_voters(db: Session, event_id: int):
+    """Rebuild the voter registry of an event from its remaining votes.
+
+    Used after votes were cleared for some candidates; the caller commits.
+    """
+    db.execute(delete(EventVoter).where(EventVoter.event_id == event_id))
+    remaining = select(Vote.event_id, Vote.voter_key).where(
+        Vote.event_id == event_id,
+        Vote.voter_key.isnot(None)
+    ).distinct()
+    db.execute(EventVoter.__table__.insert().from_select(["event_id", "voter_key"], remaining))
+    count = db.query(func.count(EventVoter.id)).filter(EventVoter.event_id == event_id).scalar() or 0
+    db.execute(update(Event).where(Event.id == event_id).values(unique_voters=count))
+
+
+def clear_event_voters(db: Session, event_id: int):
+    """Empty the voter registry of an event; the caller commits."""
+    db.execute(delete(EventVoter).where(EventVoter.event_id == event_id))
+    db.execute(update(Event).where(Event.id == event_id).values(unique_voters=0))
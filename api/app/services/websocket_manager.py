@@ -1,24 +1,180 @@
-from typing import Dict, List, Optional, Callable, Awaitable
+from typing import Deque, Dict, List, Optional, Callable, Awaitable, Tuple
+from collections import deque
+from datetime import datetime, timedelta
+import heapq
+import itertools
 from fastapi import WebSocket
-import json
 import asyncio
 import logging
 import os
+import time
+
+from ..core.config import settings
+from ..core.serialization import dumps_text
+from .admission import admission
+from .broadcast_bus import broadcast_bus
+from .clock import SystemClock
+from .display_state import display_tracker
+from .event_cache import event_cache
+from .replay_buffer import replay_buffer
 
 logger = logging.getLogger(__name__)
 
+# Builds the message to broadcast at flush time; returning None skips it
+MessageProducer = Callable[[], Awaitable[Optional[dict]]]
+
+# Base retry-after hint for clients turned away by the hard connection limits
+LIMIT_RETRY_AFTER_SEC = 10.0
+
+# Sent to connections that have been quiet for a heartbeat interval
+PING_TEXT = dumps_text({"type": "ping"})
+
+
+class ClientConnection:
+    """An accepted WebSocket with its own bounded outbound queue.
+
+    Messages are queued and written by a per-connection writer task, so a
+    slow client only delays itself. A queued state message (``state_key``)
+    is replaced by a newer one with the same key, and when the queue is full
+    the oldest state message is dropped. A client whose queue is full of
+    messages that cannot be dropped, or whose send times out, is evicted.
+    """
+
+    # Process-wide counters, so stats never walk every connection
+    total_dropped = 0
+    max_queue_depth = 0
+
+    def __init__(
+        self,
+        conn_id: int,
+        websocket: WebSocket,
+        event_link: str,
+        kind: str,
+        on_evict: Callable[["ClientConnection", str], None],
+    ):
+        self.conn_id = conn_id
+        self.websocket = websocket
+        self.event_link = event_link
+        self.kind = kind
+        self._on_evict = on_evict
+        # (state_key, serialized message)
+        self._queue: Deque[Tuple[Optional[str], str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.dropped = 0
+        self.last_activity = time.monotonic()
+
+    def start(self):
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    def stop(self):
+        """Stop the writer and discard anything still queued."""
+        self.closed = True
+        self._queue.clear()
+        task = self._writer_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    def enqueue(self, text: str, state_key: Optional[str] = None) -> bool:
+        if self.closed:
+            return False
+
+        if state_key is not None:
+            # A newer state message supersedes the queued one
+            for index, (key, _) in enumerate(self._queue):
+                if key == state_key:
+                    del self._queue[index]
+                    self.dropped += 1
+                    ClientConnection.total_dropped += 1
+                    break
+
+        if len(self._queue) >= settings.WS_SEND_QUEUE_SIZE and not self._drop_oldest_state():
+            self.evict("send queue overflow")
+            return False
+
+        self._queue.append((state_key, text))
+        if len(self._queue) > ClientConnection.max_queue_depth:
+            ClientConnection.max_queue_depth = len(self._queue)
+        self._wakeup.set()
+        return True
+
+    def _drop_oldest_state(self) -> bool:
+        for index, (key, _) in enumerate(self._queue):
+            if key is not None:
+                del self._queue[index]
+                self.dropped += 1
+                ClientConnection.total_dropped += 1
+                return True
+        return False
+
+    def evict(self, reason: str):
+        if self.closed:
+            return
+        self.stop()
+        self._on_evict(self, reason)
+
+    async def _write_loop(self):
+        while not self.closed:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, text = self._queue.popleft()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=settings.WS_SEND_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                self.evict("send timed out")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.evict("send failed")
+
 
 class ConnectionManager:
     def __init__(self):
-        # event_link -> list of websockets
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # event_link -> {conn_id: connection}; adds, removes and lookups are O(1)
+        self.active_connections: Dict[str, Dict[int, ClientConnection]] = {}
         # display connections
-        self.display_connections: Dict[str, List[WebSocket]] = {}
+        self.display_connections: Dict[str, Dict[int, ClientConnection]] = {}
+        # id(websocket) -> connection, for per-client sends and disconnects
+        self._by_socket: Dict[int, ClientConnection] = {}
+        self._conn_ids = itertools.count(1)
+        # Maintained on every add/remove so admission checks never sum over events
+        self._totals: Dict[str, int] = {"vote": 0, "display": 0}
         # Connection limits from environment variables
         self.max_connections_per_event = int(os.getenv("MAX_CONNECTIONS_PER_EVENT", "500"))
         self.max_total_connections = int(os.getenv("MAX_TOTAL_CONNECTIONS", "2000"))
-        # Timer tasks: event_link -> asyncio.Task
-        self._timer_tasks: Dict[str, asyncio.Task] = {}
+        # Voting timers: a single scheduler task over a heap of
+        # (deadline, seq, event_link). Replaced or cancelled timers stay in the
+        # heap and are skipped when their seq no longer matches ``_timers``.
+        self.clock = SystemClock()
+        self._timer_heap: List[Tuple[datetime, int, str]] = []
+        self._timers: Dict[str, Tuple[int, Callable[[], Awaitable[None]]]] = {}
+        self._timer_seq = itertools.count()
+        self._timer_wakeup = asyncio.Event()
+        self._timer_task: Optional[asyncio.Task] = None
+        self.timer_tick = timedelta(milliseconds=settings.TIMER_TICK_MS)
+        self.timers_fired = 0
+        self.timer_batches = 0
+        # Coalesced broadcasts: event_link -> {key: (target, producer)}
+        self._pending_broadcasts: Dict[str, Dict[str, Tuple[str, MessageProducer]]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._last_flush_at: Dict[str, float] = {}
+        self.broadcast_interval_sec = 1 / settings.BROADCAST_TICK_HZ if settings.BROADCAST_TICK_HZ > 0 else 0
+        self.coalesced_requests = 0
+        self.coalesced_flushes = 0
+        self.evicted_connections = 0
+        # Heartbeats: connections are split into slices by conn_id and the
+        # sweeper visits one slice per tick, so each is checked once per
+        # WS_HEARTBEAT_INTERVAL_SEC without a task per connection
+        self._heartbeat_slices: List[Dict[int, ClientConnection]] = [
+            {} for _ in range(max(settings.WS_HEARTBEAT_SLICES, 1))
+        ]
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self.pings_sent = 0
+        self.idle_evictions = 0
 
     def schedule_timer_expiry(
         self,
@@ -26,39 +182,182 @@ class ConnectionManager:
         duration_sec: float,
         on_expire: Callable[[], Awaitable[None]],
     ):
-        """Schedule a background task that fires when the voting timer expires."""
-        # Cancel any existing timer for this event
-        self.cancel_timer(event_link)
-
-        async def _wait_and_fire():
-            try:
-                await asyncio.sleep(duration_sec)
-                await on_expire()
-            except asyncio.CancelledError:
-                logger.info(f"Timer cancelled for {event_link}")
-            except Exception as e:
-                logger.error(f"Timer expiry error for {event_link}: {e}")
-            finally:
-                self._timer_tasks.pop(event_link, None)
-
-        task = asyncio.create_task(_wait_and_fire())
-        self._timer_tasks[event_link] = task
+        """Schedule ``on_expire`` to run when the event's voting timer expires.
+
+        Replaces any existing timer for this event.
+        """
+        deadline = self.clock.now() + timedelta(seconds=duration_sec)
+        seq = next(self._timer_seq)
+        self._timers[event_link] = (seq, on_expire)
+        heapq.heappush(self._timer_heap, (deadline, seq, event_link))
+        self._compact_timers()
+
+        self._ensure_timer_scheduler()
+        if self._timer_heap[0][1] == seq:
+            # New earliest deadline: the scheduler has to re-arm its sleep
+            self._timer_wakeup.set()
         logger.info(f"Timer scheduled for {event_link}: {duration_sec}s")
 
     def cancel_timer(self, event_link: str):
         """Cancel a running timer for an event."""
-        task = self._timer_tasks.pop(event_link, None)
-        if task and not task.done():
-            task.cancel()
+        if self._timers.pop(event_link, None):
+            self._compact_timers()
             logger.info(f"Timer cancelled for {event_link}")
 
+    def _compact_timers(self):
+        # Keep stale heap entries from piling up under restart churn
+        if len(self._timer_heap) > 2 * len(self._timers) + 16:
+            self._timer_heap = [
+                entry for entry in self._timer_heap
+                if self._timers.get(entry[2], (None,))[0] == entry[1]
+            ]
+            heapq.heapify(self._timer_heap)
+
+    def _ensure_timer_scheduler(self):
+        task = self._timer_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._timer_wakeup = asyncio.Event()
+            self._timer_task = asyncio.create_task(self._run_timers())
+
+    async def _run_timers(self):
+        """Sleep until the timers due within one tick have all expired, then fire them."""
+        while True:
+            self._timer_wakeup.clear()
+            heap = self._timer_heap
+            while heap and self._timers.get(heap[0][2], (None,))[0] != heap[0][1]:
+                heapq.heappop(heap)
+
+            if not heap:
+                await self._timer_wakeup.wait()
+                continue
+
+            # Wait for the last deadline within a tick of the earliest one, so
+            # timers due close together fire as one batch but never early
+            window_end = heap[0][0] + self.timer_tick
+            batch_end = max(
+                deadline for deadline, seq, event_link in heap
+                if deadline <= window_end and self._timers.get(event_link, (None,))[0] == seq
+            )
+            now = self.clock.now()
+            delay = (batch_end - now).total_seconds()
+            if delay > 0:
+                await self._sleep_until_due(delay)
+                continue
+
+            due = []
+            while heap and heap[0][0] <= now:
+                _, seq, event_link = heapq.heappop(heap)
+                entry = self._timers.get(event_link)
+                if entry and entry[0] == seq:
+                    del self._timers[event_link]
+                    due.append((event_link, entry[1]))
+
+            if due:
+                self.timer_batches += 1
+                asyncio.create_task(self._fire_timers(due))
+
+    async def _sleep_until_due(self, delay: float):
+        sleeper = asyncio.ensure_future(self.clock.sleep(delay))
+        waiter = asyncio.ensure_future(self._timer_wakeup.wait())
+        try:
+            await asyncio.wait({sleeper, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+            waiter.cancel()
+
+    async def _fire_timers(self, due: List[Tuple[str, Callable[[], Awaitable[None]]]]):
+        results = await asyncio.gather(*(on_expire() for _, on_expire in due), return_exceptions=True)
+        for (event_link, _), result in zip(due, results):
+            self.timers_fired += 1
+            if isinstance(result, Exception):
+                logger.error(f"Timer expiry error for {event_link}: {result}")
+
+    def get_timer_stats(self) -> dict:
+        """Get voting timer statistics for monitoring."""
+        return {
+            "pending_timers": len(self._timers),
+            "timer_heap_size": len(self._timer_heap),
+            "timers_fired": self.timers_fired,
+            "timer_batches": self.timer_batches,
+        }
+
+    def schedule_vote_broadcast(self, event_link: str, key: str, producer: MessageProducer):
+        """Coalesce a broadcast to vote clients; see ``_schedule_broadcast``."""
+        self._schedule_broadcast(event_link, key, "vote", producer)
+
+    def schedule_display_broadcast(self, event_link: str, key: str, producer: MessageProducer):
+        """Coalesce a broadcast to display screens; see ``_schedule_broadcast``."""
+        self._schedule_broadcast(event_link, key, "display", producer)
+
+    def _schedule_broadcast(self, event_link: str, key: str, target: str, producer: MessageProducer):
+        """Mark ``key`` dirty for an event and flush it on the next tick.
+
+        Per-vote state (tallies, current candidate, display payload) goes
+        through here: any number of votes within one tick produce a single
+        message per key, built from the latest state when the tick fires.
+        Admin transitions keep calling ``broadcast_vote``/``broadcast_display``
+        directly so they are never delayed.
+        """
+        self.coalesced_requests += 1
+        self._pending_broadcasts.setdefault(event_link, {})[key] = (target, producer)
+
+        task = self._flush_tasks.get(event_link)
+        if task is None or task.done():
+            self._flush_tasks[event_link] = asyncio.create_task(self._flush_broadcasts(event_link))
+
+    async def _flush_broadcasts(self, event_link: str):
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending_broadcasts.get(event_link):
+                # First change after a quiet period goes out right away, then
+                # at most one flush per tick
+                delay = self._last_flush_at.get(event_link, 0) + self.broadcast_interval_sec - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                pending = self._pending_broadcasts.pop(event_link, {})
+                self._last_flush_at[event_link] = loop.time()
+
+                for key, (target, producer) in pending.items():
+                    try:
+                        message = await producer()
+                    except Exception as e:
+                        logger.error(f"Failed to build {key} broadcast for {event_link}: {e}")
+                        continue
+                    if message is None:
+                        continue
+                    # Every worker runs its own flusher, so only fan out locally
+                    if target == "vote":
+                        self._fanout_vote(event_link, message, state_key=key)
+                    else:
+                        self._fanout_display(event_link, message)
+                    self.coalesced_flushes += 1
+        finally:
+            self._flush_tasks.pop(event_link, None)
+
+    async def send_personal_message(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single client, behind anything already queued for it."""
+        conn = self._by_socket.get(id(websocket))
+        if conn:
+            conn.enqueue(dumps_text(message))
+        else:
+            await websocket.send_text(dumps_text(message))
+
+    async def send_personal_text(self, websocket: WebSocket, text: str):
+        """Like ``send_personal_message`` for an already serialized message."""
+        conn = self._by_socket.get(id(websocket))
+        if conn:
+            conn.enqueue(text)
+        else:
+            await websocket.send_text(text)
+
     def get_total_vote_connections(self) -> int:
         """Get total number of active vote connections."""
-        return sum(len(conns) for conns in self.active_connections.values())
+        return self._totals["vote"]
 
     def get_total_display_connections(self) -> int:
         """Get total number of active display connections."""
-        return sum(len(conns) for conns in self.display_connections.values())
+        return self._totals["display"]
 
     def get_connection_stats(self) -> dict:
         """Get connection statistics for monitoring."""
@@ -67,140 +366,260 @@ class ConnectionManager:
             "total_display_connections": self.get_total_display_connections(),
             "events_with_vote_connections": len(self.active_connections),
             "events_with_display_connections": len(self.display_connections),
+            "broadcast_tick_hz": settings.BROADCAST_TICK_HZ,
+            "coalesced_requests": self.coalesced_requests,
+            "coalesced_flushes": self.coalesced_flushes,
+            "pending_broadcasts": sum(len(p) for p in self._pending_broadcasts.values()),
+            "evicted_connections": self.evicted_connections,
+            "idle_evictions": self.idle_evictions,
+            "pings_sent": self.pings_sent,
+            "dropped_messages": ClientConnection.total_dropped,
+            "max_send_queue_depth": ClientConnection.max_queue_depth,
+            **self.get_timer_stats(),
         }
 
-    async def connect_vote(self, websocket: WebSocket, event_link: str):
+    def _registry(self, kind: str) -> Dict[str, Dict[int, ClientConnection]]:
+        return self.active_connections if kind == "vote" else self.display_connections
+
+    def _add_connection(self, websocket: WebSocket, event_link: str, kind: str) -> ClientConnection:
+        conn = ClientConnection(next(self._conn_ids), websocket, event_link, kind, self._evict)
+        self._registry(kind).setdefault(event_link, {})[conn.conn_id] = conn
+        self._totals[kind] += 1
+        self._by_socket[id(websocket)] = conn
+        self._heartbeat_slices[conn.conn_id % len(self._heartbeat_slices)][conn.conn_id] = conn
+        conn.start()
+        self._ensure_sweeper()
+        return conn
+
+    def _remove_connection(self, conn: ClientConnection) -> bool:
+        self._by_socket.pop(id(conn.websocket), None)
+        self._heartbeat_slices[conn.conn_id % len(self._heartbeat_slices)].pop(conn.conn_id, None)
+        conn.stop()
+        registry = self._registry(conn.kind)
+        connections = registry.get(conn.event_link)
+        if connections is None or connections.pop(conn.conn_id, None) is None:
+            return False
+        self._totals[conn.kind] -= 1
+
+        # Clean up empty event lists
+        if not connections:
+            del registry[conn.event_link]
+        return True
+
+    def _evict(self, conn: ClientConnection, reason: str):
+        """Drop a client that cannot keep up; its endpoint loop ends when the socket closes."""
+        if not self._remove_connection(conn):
+            return
+        self.evicted_connections += 1
+        logger.warning(f"Evicted slow connection from {conn.event_link}: {reason}")
+        self._close_later(conn, 1013, "Connection too slow")
+
+    def _close_later(self, conn: ClientConnection, code: int, reason: str):
+        async def _close():
+            try:
+                await asyncio.wait_for(conn.websocket.close(code=code, reason=reason), timeout=1.0)
+            except Exception:
+                pass
+
+        asyncio.create_task(_close())
+
+    def touch(self, websocket: WebSocket):
+        """Record that a client sent something, so the sweeper keeps it."""
+        conn = self._by_socket.get(id(websocket))
+        if conn:
+            conn.last_activity = time.monotonic()
+
+    def _ensure_sweeper(self):
+        if settings.WS_HEARTBEAT_INTERVAL_SEC <= 0:
+            return
+        task = self._sweeper_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._sweeper_task = asyncio.create_task(self._sweep_heartbeats())
+
+    async def _sweep_heartbeats(self):
+        """Ping connections that went quiet and evict the ones that stopped answering."""
+        slices = self._heartbeat_slices
+        index = 0
+        while True:
+            await asyncio.sleep(settings.WS_HEARTBEAT_INTERVAL_SEC / len(slices))
+            now = time.monotonic()
+            for conn in list(slices[index].values()):
+                idle = now - conn.last_activity
+                if idle >= settings.WS_IDLE_TIMEOUT_SEC:
+                    if self._remove_connection(conn):
+                        self.idle_evictions += 1
+                        logger.info(f"Evicted idle connection from {conn.event_link} after {idle:.0f}s")
+                        self._close_later(conn, 1001, "Idle timeout")
+                elif idle >= settings.WS_HEARTBEAT_INTERVAL_SEC:
+                    conn.enqueue(PING_TEXT, "ping")
+                    self.pings_sent += 1
+            index = (index + 1) % len(slices)
+
+    async def admit(self, websocket: WebSocket) -> bool:
+        """Wait for an admission slot before doing any work for a new socket.
+
+        Returns False if the socket was rejected (and closed) instead.
+        """
+        retry_after = await admission.admit()
+        if retry_after is None:
+            return True
+        await self._reject(websocket, "Server busy", retry_after)
+        return False
+
+    async def _reject(self, websocket: WebSocket, reason: str, retry_after: float):
+        # Closing before the handshake is answered becomes a bare HTTP 403, so
+        # accept first; clients read the hint from the frame (or the close
+        # reason) and back off accordingly
+        try:
+            await websocket.accept()
+            await websocket.send_text(dumps_text({
+                "type": "server_busy",
+                "reason": reason,
+                "retry_after": round(retry_after, 1),
+            }))
+            await websocket.close(code=1013, reason=f"{reason}; retry_after={retry_after:.1f}")
+        except Exception:
+            # The client gave up in the meantime
+            pass
+
+    async def connect_vote(self, websocket: WebSocket, event_link: str) -> Optional[ClientConnection]:
+        """Accept a vote client; returns None if it was rejected by the connection limits."""
         # Check connection limits
         total_connections = self.get_total_vote_connections() + self.get_total_display_connections()
         if total_connections >= self.max_total_connections:
             logger.warning(f"Max total connections reached: {total_connections}")
-            await websocket.close(code=1013, reason="Server overloaded")
-            return
+            await self._reject(websocket, "Server overloaded", admission.jittered(LIMIT_RETRY_AFTER_SEC))
+            return None
 
         if event_link in self.active_connections:
             if len(self.active_connections[event_link]) >= self.max_connections_per_event:
                 logger.warning(f"Max connections per event reached for {event_link}")
-                await websocket.close(code=1013, reason="Event connection limit reached")
-                return
+                await self._reject(websocket, "Event connection limit reached", admission.jittered(LIMIT_RETRY_AFTER_SEC))
+                return None
 
         await websocket.accept()
-        if event_link not in self.active_connections:
-            self.active_connections[event_link] = []
-        self.active_connections[event_link].append(websocket)
+        conn = self._add_connection(websocket, event_link, "vote")
 
         logger.info(f"Vote connection added for {event_link}. Total: {len(self.active_connections[event_link])}")
+        return conn
+
+    def start_vote_session(self, websocket: WebSocket, event_link: str, stream_id: Optional[str] = None, seq: Optional[int] = None) -> bool:
+        """Resume a reconnecting vote client from the replay buffer.
+
+        Sends the ``session`` position and the messages it missed; must run
+        right after ``connect_vote``, before anything else is broadcast.
+        Returns False if the client can't resume and needs full state (which
+        carries its own session position).
+        """
+        conn = self._by_socket.get(id(websocket))
+        if not conn or stream_id is None or seq is None:
+            return False
+
+        missed = replay_buffer.since(event_link, stream_id, seq)
+        if missed is None:
+            return False
+
+        conn.enqueue(dumps_text({
+            "type": "session",
+            "stream": replay_buffer.stream_id,
+            "seq": replay_buffer.current_seq(event_link),
+            "resumed": True,
+        }))
+        for text in missed:
+            conn.enqueue(text)
+        return True
+
+    def start_fresh_vote_session(self, websocket: WebSocket, event_link: str, welcome: str, seq: int) -> bool:
+        """Send a new vote client the ``welcome`` built (at ``seq``) before ``connect_vote``.
+
+        Whatever was broadcast while the client was being registered follows
+        the welcome, so it never arrives after newer messages. Must run right
+        after ``connect_vote``; returns False if those messages already fell
+        out of the replay buffer.
+        """
+        conn = self._by_socket.get(id(websocket))
+        if not conn or not replay_buffer.can_resume(event_link, replay_buffer.stream_id, seq):
+            return False
+
+        conn.enqueue(welcome)
+        for text in replay_buffer.after(event_link, seq):
+            conn.enqueue(text)
+        return True
 
     def disconnect_vote(self, websocket: WebSocket, event_link: str):
-        if event_link in self.active_connections:
-            if websocket in self.active_connections[event_link]:
-                self.active_connections[event_link].remove(websocket)
-                logger.info(f"Vote connection removed for {event_link}. Remaining: {len(self.active_connections[event_link])}")
-
-            # Clean up empty event lists
-            if not self.active_connections[event_link]:
-                del self.active_connections[event_link]
-
-    async def broadcast_vote(self, event_link: str, message: dict):
-        if event_link not in self.active_connections:
+        conn = self._by_socket.get(id(websocket))
+        if conn and self._remove_connection(conn):
+            logger.info(f"Vote connection removed for {event_link}. Remaining: {len(self.active_connections.get(event_link, {}))}")
+
+    async def broadcast_vote(self, event_link: str, message: dict, state_key: Optional[str] = None):
+        """Queue a message for every vote client of an event, on every worker."""
+        self._fanout_vote(event_link, message, state_key)
+        broadcast_bus.publish("ws", {"target": "vote", "link": event_link, "message": message, "state_key": state_key})
+
+    def _fanout_vote(self, event_link: str, message: dict, state_key: Optional[str] = None):
+        """Queue a message for this worker's vote clients; never waits on a client."""
+        # Numbered and kept for resuming clients even while none are connected;
+        # serialized once instead of per-connection
+        message_text = replay_buffer.append(event_link, message, state_key)
+        connections = self.active_connections.get(event_link)
+        if not connections:
             return
 
-        dead_connections = []
-        connections = self.active_connections[event_link].copy()
-
-        # Serialize message once instead of per-connection
-        message_text = json.dumps(message)
-
-        # Send in batches to avoid blocking event loop
-        batch_size = 50
-        for i in range(0, len(connections), batch_size):
-            batch = connections[i:i + batch_size]
+        for conn in list(connections.values()):
+            conn.enqueue(message_text, state_key)
 
-            async def send_one(conn: WebSocket):
-                try:
-                    await asyncio.wait_for(conn.send_text(message_text), timeout=5.0)
-                    return None
-                except Exception:
-                    return conn
-
-            results = await asyncio.gather(*[send_one(c) for c in batch], return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, WebSocket):
-                    dead_connections.append(result)
-
-            # Yield control to event loop between batches
-            if i + batch_size < len(connections):
-                await asyncio.sleep(0)
-
-        # Remove dead connections
-        for dead in dead_connections:
-            if dead in self.active_connections.get(event_link, []):
-                self.active_connections[event_link].remove(dead)
-
-        if dead_connections:
-            logger.info(f"Removed {len(dead_connections)} dead vote connections from {event_link}")
-
-    async def connect_display(self, websocket: WebSocket, event_link: str):
+    async def connect_display(self, websocket: WebSocket, event_link: str) -> Optional[ClientConnection]:
+        """Accept a display screen; returns None if it was rejected by the connection limits."""
         # Check connection limits
         total_connections = self.get_total_vote_connections() + self.get_total_display_connections()
         if total_connections >= self.max_total_connections:
             logger.warning(f"Max total connections reached: {total_connections}")
-            await websocket.close(code=1013, reason="Server overloaded")
-            return
+            await self._reject(websocket, "Server overloaded", admission.jittered(LIMIT_RETRY_AFTER_SEC))
+            return None
 
         await websocket.accept()
-        if event_link not in self.display_connections:
-            self.display_connections[event_link] = []
-        self.display_connections[event_link].append(websocket)
+        conn = self._add_connection(websocket, event_link, "display")
 
         logger.info(f"Display connection added for {event_link}. Total: {len(self.display_connections[event_link])}")
+        return conn
 
     def disconnect_display(self, websocket: WebSocket, event_link: str):
-        if event_link in self.display_connections:
-            if websocket in self.display_connections[event_link]:
-                self.display_connections[event_link].remove(websocket)
-                logger.info(f"Display connection removed for {event_link}. Remaining: {len(self.display_connections[event_link])}")
-
-            # Clean up empty event lists
-            if not self.display_connections[event_link]:
-                del self.display_connections[event_link]
+        conn = self._by_socket.get(id(websocket))
+        if conn and self._remove_connection(conn):
+            logger.info(f"Display connection removed for {event_link}. Remaining: {len(self.display_connections.get(event_link, {}))}")
 
     async def broadcast_display(self, event_link: str, message: dict):
-        if event_link not in self.display_connections:
+        """Queue a message for every display of an event, on every worker."""
+        self._fanout_display(event_link, message)
+        broadcast_bus.publish("ws", {"target": "display", "link": event_link, "message": message})
+
+    def _fanout_display(self, event_link: str, message: dict):
+        """Queue a message for this worker's displays; never waits on a client."""
+        if message.get("type") == "display_update":
+            # Display sequence numbers are per worker, so full snapshots are
+            # tagged here, at local fan-out
+            message = display_tracker.full(event_link, message, event_cache.version(message.get("event_id")))
+
+        connections = self.display_connections.get(event_link)
+        if not connections:
             return
 
-        dead_connections = []
-        connections = self.display_connections[event_link].copy()
-
-        message_text = json.dumps(message)
-
-        batch_size = 50
-        for i in range(0, len(connections), batch_size):
-            batch = connections[i:i + batch_size]
-
-            async def send_one(conn: WebSocket):
-                try:
-                    await asyncio.wait_for(conn.send_text(message_text), timeout=5.0)
-                    return None
-                except Exception:
-                    return conn
-
-            results = await asyncio.gather(*[send_one(c) for c in batch], return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, WebSocket):
-                    dead_connections.append(result)
+        # A newer full snapshot supersedes a queued one; patches are sequenced
+        # and never dropped silently
+        state_key = "display_update" if message.get("type") == "display_update" else None
 
-            if i + batch_size < len(connections):
-                await asyncio.sleep(0)
+        message_text = dumps_text(message)
+        for conn in list(connections.values()):
+            conn.enqueue(message_text, state_key)
 
-        # Remove dead connections
-        for dead in dead_connections:
-            if dead in self.display_connections.get(event_link, []):
-                self.display_connections[event_link].remove(dead)
 
-        if dead_connections:
-            logger.info(f"Removed {len(dead_connections)} dead display connections from {event_link}")
+    def apply_remote(self, payload: dict):
+        """Fan out a broadcast published by another worker."""
+        if payload["target"] == "vote":
+            self._fanout_vote(payload["link"], payload["message"], payload.get("state_key"))
+        else:
+            self._fanout_display(payload["link"], payload["message"])
 
 
 manager = ConnectionManager()
+broadcast_bus.subscribe("ws", manager.apply_remote)
@@ -0,0 +1,66 @@
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from datetime import datetime
+import asyncio
+
+# Builds (serialized message, time it stops being valid or None)
+WelcomeBuilder = Callable[[], Awaitable[Tuple[str, Optional[datetime]]]]
+
+
+class WelcomeCache:
+    """Pre-serialized initial messages for newly connected sockets.
+
+    One entry per (kind, event): the text sent to every client that connects
+    while the event is in the same state. The caller derives ``key`` from
+    whatever the message depends on (structure version, tally generation,
+    broadcast seq); a running timer also expires the entry once it runs out.
+    Concurrent misses for the same key share one build, so a connect burst
+    costs at most one set of queries.
+    """
+
+    def __init__(self):
+        # (kind, event_id) -> (key, valid_until, text)
+        self._entries: Dict[Tuple[str, int], Tuple[tuple, Optional[datetime], str]] = {}
+        self._building: Dict[Tuple[str, int, tuple], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, kind: str, event_id: int, key: tuple, now: datetime, build: WelcomeBuilder) -> str:
+        entry = self._entries.get((kind, event_id))
+        if entry and entry[0] == key and (entry[1] is None or now < entry[1]):
+            self.hits += 1
+            return entry[2]
+
+        pending = self._building.get((kind, event_id, key))
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._building[(kind, event_id, key)] = future
+        try:
+            text, valid_until = await build()
+            self._entries[(kind, event_id)] = (key, valid_until, text)
+            future.set_result(text)
+            return text
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about an exception nobody was waiting for
+            future.exception()
+            raise
+        finally:
+            del self._building[(kind, event_id, key)]
+
+    def get_stats(self) -> dict:
+        """Get welcome snapshot statistics for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+welcome_cache = WelcomeCache()
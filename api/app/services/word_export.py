@@ -4,7 +4,11 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from io import BytesIO
-from typing import List
+from typing import IO, List, Optional
+from xml.sax.saxutils import escape as xml_escape
+import os
+import re
+import zipfile
 
 
 def set_cell_border(cell, **kwargs):
@@ -27,6 +31,32 @@ def set_cell_border(cell, **kwargs):
     tcPr.append(tcBorders)
 
 
+def row_texts(result: dict) -> List[str]:
+    """Cell texts of one results row, in column order."""
+    yes_votes = result.get('yes_votes', 0)
+    no_votes = result.get('no_votes', 0)
+    neutral_votes = result.get('neutral_votes', 0)
+
+    return [
+        # T/r (row number)
+        str(result.get('row_number', '')),
+        # Lavozim (position)
+        result.get('which_position', ''),
+        # Nomzodlar (candidate name)
+        result.get('full_name', ''),
+        # Ovoz berishda qatnashganlar soni (yes + no + neutral for this candidate)
+        str(yes_votes + no_votes + neutral_votes),
+        # Rozi (yes votes with percentage)
+        f"{yes_votes}\n({result.get('yes_percent', 0)}%)",
+        # Qarshi (no votes with percentage)
+        f"{no_votes}\n({result.get('no_percent', 0)}%)",
+        # Betaraf (neutral votes with percentage)
+        f"{neutral_votes}\n({result.get('neutral_percent', 0)}%)",
+        # Natija (result)
+        result.get('result', ''),
+    ]
+
+
 def generate_results_word(event_name: str, results: List[dict], total_participants: int) -> BytesIO:
     """Generate Word document with voting results"""
     doc = Document()
@@ -96,36 +126,8 @@ def generate_results_word(event_name: str, results: List[dict], total_participan
         row = table.add_row()
         cells = row.cells
 
-        # T/r (row number)
-        cells[0].text = str(result.get('row_number', ''))
-
-        # Lavozim (position)
-        cells[1].text = result.get('which_position', '')
-
-        # Nomzodlar (candidate name)
-        cells[2].text = result.get('full_name', '')
-
-        # Ovoz berishda qatnashganlar soni (yes + no + neutral for this candidate)
-        yes_votes = result.get('yes_votes', 0)
-        no_votes = result.get('no_votes', 0)
-        neutral_votes = result.get('neutral_votes', 0)
-        candidate_participants = yes_votes + no_votes + neutral_votes
-        cells[3].text = str(candidate_participants)
-
-        # Rozi (yes votes with percentage)
-        yes_percent = result.get('yes_percent', 0)
-        cells[4].text = f"{yes_votes}\n({yes_percent}%)"
-
-        # Qarshi (no votes with percentage)
-        no_percent = result.get('no_percent', 0)
-        cells[5].text = f"{no_votes}\n({no_percent}%)"
-
-        # Betaraf (neutral votes with percentage)
-        neutral_percent = result.get('neutral_percent', 0)
-        cells[6].text = f"{neutral_votes}\n({neutral_percent}%)"
-
-        # Natija (result)
-        cells[7].text = result.get('result', '')
+        for i, text in enumerate(row_texts(result)):
+            cells[i].text = text
 
         # Format cells
         for i, cell in enumerate(cells):
@@ -151,3 +153,120 @@ def generate_results_word(event_name: str, results: List[dict], total_participan
     buffer.seek(0)
 
     return buffer
+
+
+
+# Characters lxml refuses in text nodes; python-docx raises on them as well
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_TITLE_MARKER = "@@EVENT_NAME@@"
+_TITLE_SUFFIX = " - Ovoz berish natijalari"
+_ROWS_PER_WRITE = 256
+
+
+def _run_content(text: str) -> str:
+    """WordprocessingML for a run's text, the way python-docx writes ``run.text``."""
+    if _INVALID_XML_CHARS.search(text):
+        raise ValueError("All strings must be XML compatible")
+
+    parts = []
+    for i, chunk in enumerate(re.split(r'([\t\r\n])', text)):
+        if i % 2:
+            parts.append('<w:tab/>' if chunk == '\t' else '<w:br/>')
+        elif chunk:
+            space = ' xml:space="preserve"' if len(chunk.strip()) < len(chunk) else ''
+            parts.append(f'<w:t{space}>{xml_escape(chunk)}</w:t>')
+    return ''.join(parts)
+
+
+class _ResultsTemplate:
+    """Parts of a python-docx results document, split around the data rows.
+
+    Built once per process from ``generate_results_word`` with one sample
+    row, so page setup, styles, header row, widths, borders and shading
+    are exactly what the python-docx generator produces.
+    """
+
+    def __init__(self):
+        sample = {
+            'row_number': 1, 'which_position': 'x', 'full_name': 'x',
+            'yes_votes': 0, 'no_votes': 0, 'neutral_votes': 0, 'result': 'x',
+        }
+        with zipfile.ZipFile(generate_results_word(_TITLE_MARKER, [sample], 0)) as zf:
+            self.parts = [(info, zf.read(info.filename)) for info in zf.infolist()]
+
+        document = next(data for info, data in self.parts if info.filename == 'word/document.xml').decode('utf-8')
+        header_end = document.index('</w:tr>') + len('</w:tr>')
+        row_end = document.index('</w:tr>', header_end) + len('</w:tr>')
+        head, row, self.tail = document[:header_end], document[header_end:row_end], document[row_end:]
+        self.head_before_title, self.head_after_title = head.split(_run_content(_TITLE_MARKER + _TITLE_SUFFIX))
+
+        # Split the row around each cell's run content; the pieces in between
+        # (closing the previous cell, opening the next one) are fixed
+        self.row_pieces = []
+        rest = row
+        while '</w:rPr>' in rest:
+            content_start = rest.index('</w:rPr>') + len('</w:rPr>')
+            self.row_pieces.append(rest[:content_start])
+            rest = rest[rest.index('</w:r>', content_start):]
+        self.row_pieces.append(rest)
+        if len(self.row_pieces) != 9:
+            raise ValueError("Unexpected results row layout")
+
+    def render_row(self, result: dict) -> str:
+        out = []
+        for piece, text in zip(self.row_pieces, row_texts(result)):
+            out.append(piece)
+            out.append(_run_content(text))
+        out.append(self.row_pieces[-1])
+        return ''.join(out)
+
+
+_template: Optional[_ResultsTemplate] = None
+
+
+def _get_template() -> _ResultsTemplate:
+    global _template
+    if _template is None:
+        _template = _ResultsTemplate()
+    return _template
+
+
+def stream_results_word(out: IO[bytes], event_name: str, results: List[dict], total_participants: int):
+    """Write the results document to ``out`` without building it in python-docx.
+
+    Same document as ``generate_results_word``: the skeleton comes from it,
+    and data rows are written as WordprocessingML strings straight into the
+    zip stream, a batch at a time.
+    """
+    template = _get_template()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for info, data in template.parts:
+            entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+            entry.compress_type = info.compress_type
+            if info.filename != 'word/document.xml':
+                zf.writestr(entry, data)
+                continue
+
+            with zf.open(entry, 'w') as document:
+                document.write(template.head_before_title.encode('utf-8'))
+                document.write(_run_content(event_name + _TITLE_SUFFIX).encode('utf-8'))
+                document.write(template.head_after_title.encode('utf-8'))
+                for start in range(0, len(results), _ROWS_PER_WRITE):
+                    batch = results[start:start + _ROWS_PER_WRITE]
+                    document.write(''.join(template.render_row(result) for result in batch).encode('utf-8'))
+                document.write(template.tail.encode('utf-8'))
+
+
+def render_results_word(event_name: str, results: List[dict], total_participants: int) -> bytes:
+    """Word document as bytes; runs in the export process pool."""
+    buffer = BytesIO()
+    stream_results_word(buffer, event_name, results, total_participants)
+    return buffer.getvalue()
+
+
+def write_results_word(path: str, event_name: str, results: List[dict], total_participants: int):
+    """Render the Word document to ``path``; runs in the export process pool."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        stream_results_word(f, event_name, results, total_participants)
+    os.replace(tmp_path, path)
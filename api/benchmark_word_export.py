@@ -0,0 +1,85 @@
+"""
+Benchmark the results Word export: python-docx vs. the template-based writer.
+
+Usage:
+    python benchmark_word_export.py
+    python benchmark_word_export.py 50 500 5000 --repeat 5
+
+Both generators get the same synthetic results, and every part of the two
+.docx files is compared. python-docx needs tens of minutes for 5000 rows.
+"""
+import io
+import random
+import sys
+import time
+import zipfile
+
+from app.services.word_export import generate_results_word, render_results_word
+
+
+def make_results(count: int) -> list:
+    rnd = random.Random(count)
+    results = []
+    for i in range(count):
+        yes_votes, no_votes, neutral_votes = rnd.randint(0, 400), rnd.randint(0, 400), rnd.randint(0, 50)
+        total = yes_votes + no_votes + neutral_votes
+        yes_percent = round(yes_votes / total * 100, 1) if total else 0
+        results.append({
+            "row_number": i + 1,
+            "which_position": rnd.choice(["Professor", "Dotsent", "Kafedra mudiri", ""]),
+            "full_name": f"Nomzod {i + 1}",
+            "yes_votes": yes_votes,
+            "yes_percent": yes_percent,
+            "no_votes": no_votes,
+            "no_percent": round(no_votes / total * 100, 1) if total else 0,
+            "neutral_votes": neutral_votes,
+            "neutral_percent": round(neutral_votes / total * 100, 1) if total else 0,
+            "result": "O'tdi" if yes_percent > 50 else "O'tmadi",
+        })
+    return results
+
+
+def best_of(repeat: int, fn, *args):
+    """Fastest of ``repeat`` runs, plus the last run's output."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = fn(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), output
+
+
+def same_document(reference: bytes, candidate: bytes) -> bool:
+    with zipfile.ZipFile(io.BytesIO(reference)) as a, zipfile.ZipFile(io.BytesIO(candidate)) as b:
+        return a.namelist() == b.namelist() and all(a.read(name) == b.read(name) for name in a.namelist())
+
+
+def run(sizes: list, repeat: int):
+    # Build the template outside the timings, as a long-running worker would
+    render_results_word("Warm-up", make_results(1), 1)
+
+    print(f"{'rows':>6} {'python-docx':>13} {'template':>10} {'speedup':>8} {'size KB':>8}  identical")
+    for count in sizes:
+        results = make_results(count)
+        # python-docx gets slower per row as the table grows (every row.cells
+        # walks the whole table), so large sizes are timed once
+        docx_sec, reference = best_of(repeat if count <= 500 else 1, generate_results_word, "Benchmark", results, count)
+        template_sec, candidate = best_of(repeat, render_results_word, "Benchmark", results, count)
+        reference = reference.getvalue()
+        print(
+            f"{count:>6} {docx_sec * 1000:>11.1f}ms {template_sec * 1000:>8.1f}ms "
+            f"{docx_sec / template_sec:>7.1f}x {len(candidate) / 1024:>8.0f}  "
+            f"{'yes' if same_document(reference, candidate) else 'NO'}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeat = 3
+    if "--repeat" in args:
+        index = args.index("--repeat")
+        repeat = int(args[index + 1])
+        del args[index:index + 2]
+    sizes = [int(arg) for arg in args] or [50, 500, 5000]
+    run(sizes, repeat)
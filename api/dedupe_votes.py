@@ -0,0 +1,52 @@
+"""
+Remove duplicate votes so the unique voter index can be created.
+
+Votes cast before the (event, candidate, voter_key) unique index existed may
+contain several rows for the same voter. The API refuses to start until they
+are gone. Only the first vote of each voter is kept; the others are copied to
+votes_removed_duplicates before they are deleted.
+
+Usage:
+    python dedupe_votes.py            # list the duplicates per event
+    python dedupe_votes.py --apply    # copy them aside and delete them
+"""
+import sys
+from sqlalchemy import inspect, text
+
+from app.core.config import settings
+from app.core.database import DUPLICATE_VOTES, engine, is_sqlite
+
+
+def dedupe(apply: bool = False):
+    with engine.begin() as connection:
+        if is_sqlite:
+            # The sqlite driver runs in autocommit mode; copy and delete together
+            connection.exec_driver_sql("BEGIN")
+        duplicates = connection.execute(text(
+            f"SELECT event_id, COUNT(*) FROM ({DUPLICATE_VOTES}) d GROUP BY event_id ORDER BY event_id"
+        )).all()
+        if not duplicates:
+            print("No duplicate votes found")
+            return
+
+        for event_id, count in duplicates:
+            print(f"  Event {event_id}: {count} duplicate votes")
+        if not apply:
+            print("\nDry run, nothing changed. Re-run with --apply to remove them.")
+            return
+
+        if inspect(connection).has_table("votes_removed_duplicates"):
+            connection.execute(text(f"INSERT INTO votes_removed_duplicates {DUPLICATE_VOTES}"))
+        else:
+            connection.execute(text(f"CREATE TABLE votes_removed_duplicates AS {DUPLICATE_VOTES}"))
+        removed = connection.execute(text(
+            "DELETE FROM votes WHERE id NOT IN ("
+            "SELECT MIN(id) FROM votes GROUP BY event_id, candidate_id, voter_key)"
+        )).rowcount
+        print(f"\nRemoved {removed} votes (copied to votes_removed_duplicates)")
+        print("Restart the API to create the unique index.")
+
+
+if __name__ == "__main__":
+    print(f"Database: {settings.DATABASE_URL}")
+    dedupe(apply="--apply" in sys.argv)
@@ -39,7 +39,10 @@ def migrate(sqlite_path: str, force: bool = False):
         "events",
         "event_candidates",
         "votes",
+        "event_voters",
         "display_states",
+        "timer_leases",
+        "event_candidate_tallies",
     ]
 
     # Reverse order for deletion (respect foreign keys)
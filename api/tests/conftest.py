@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+
+# Settings and engines are created at import time, so point them at a
+# throwaway database before any app module is imported
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ.setdefault("BROADCAST_BUS_URL", "")
+os.environ.setdefault("WEB_CONCURRENCY", "1")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
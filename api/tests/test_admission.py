@@ -0,0 +1,141 @@
+"""WebSocket admission pacing and the busy rejection clients back off from."""
+import asyncio
+import json
+import sqlite3
+
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from app.services import admission as admission_module
+from app.services import websocket_manager as websocket_manager_module
+from app.services.admission import AdmissionController
+from app.services.websocket_manager import ConnectionManager
+
+
+class FrozenTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class RecordingWebSocket:
+    """Stands in for a client socket and records what the server did with it."""
+
+    client = None
+
+    def __init__(self):
+        self.calls = []
+
+    async def accept(self):
+        self.calls.append(("accept",))
+
+    async def send_text(self, text: str):
+        self.calls.append(("send", json.loads(text)))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.calls.append(("close", code))
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    frozen = FrozenTime()
+    # Only the admission module's clock; the event loop keeps the real one
+    monkeypatch.setattr(admission_module, "time", frozen)
+    return frozen
+
+
+def make_controller(rate: float = 8.0, burst: int = 3, pool=None) -> AdmissionController:
+    # No queueing: anything that would have to wait is rejected. Rates are
+    # powers of two so the frozen clock steps add up exactly
+    return AdmissionController(rate=rate, burst=burst, queue_size=1, max_wait_sec=0.0,
+                               target_lag_ms=50.0, pool=pool)
+
+
+def admit(controller: AdmissionController):
+    return asyncio.run(controller.admit())
+
+
+def test_burst_then_configured_rate(frozen_time):
+    controller = make_controller(rate=8.0, burst=3)
+    assert [admit(controller) for _ in range(3)] == [None, None, None]
+
+    retry_after = admit(controller)
+    assert retry_after is not None and retry_after >= 1.0
+    assert controller.rejected == 1
+
+    # One slot frees up every 1/rate seconds
+    frozen_time.now += 0.125
+    assert admit(controller) is None
+    assert admit(controller) is not None
+
+
+def test_loop_lag_scales_the_rate_down(frozen_time):
+    controller = make_controller(rate=8.0, burst=1)
+    controller.loop_lag_ms = 100.0
+    controller._update_load_factor()
+    assert controller.load_factor == pytest.approx(0.5)
+    assert controller.rate == pytest.approx(4.0)
+
+    # Slots are now 1/4 s apart instead of 1/8 s
+    assert admit(controller) is None
+    frozen_time.now += 0.125
+    assert admit(controller) is not None
+    frozen_time.now += 0.125
+    assert admit(controller) is None
+
+    controller.loop_lag_ms = 10.0
+    controller._update_load_factor()
+    assert controller.rate == pytest.approx(8.0)
+
+
+def test_db_pool_usage_scales_the_rate_down():
+    pool = QueuePool(lambda: sqlite3.connect(":memory:"), pool_size=4, max_overflow=1)
+    controller = make_controller(rate=8.0, pool=pool)
+    connections = [pool.connect() for _ in range(4)]
+    try:
+        controller.pool_usage = controller._measure_pool_usage()
+        controller._update_load_factor()
+        assert controller.pool_usage == pytest.approx(0.8)
+        assert controller.load_factor == 1.0
+
+        connections.append(pool.connect())
+        controller.pool_usage = controller._measure_pool_usage()
+        controller._update_load_factor()
+        assert controller.pool_usage == pytest.approx(1.0)
+        # Never throttled to zero
+        assert controller.load_factor == pytest.approx(0.1)
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def test_rejected_socket_gets_server_busy_then_1013(frozen_time, monkeypatch):
+    controller = make_controller(rate=8.0, burst=1)
+    monkeypatch.setattr(websocket_manager_module, "admission", controller)
+    manager = ConnectionManager()
+
+    async def scenario():
+        assert await manager.admit(RecordingWebSocket())
+        rejected = RecordingWebSocket()
+        assert not await manager.admit(rejected)
+        return rejected
+
+    rejected = asyncio.run(scenario())
+    assert [call[0] for call in rejected.calls] == ["accept", "send", "close"]
+    busy = rejected.calls[1][1]
+    assert busy["type"] == "server_busy"
+    assert busy["retry_after"] >= 1.0
+    assert rejected.calls[2] == ("close", 1013)
+
+
+def test_connection_limit_rejects_with_server_busy_then_1013():
+    manager = ConnectionManager()
+    manager.max_total_connections = 0
+    websocket = RecordingWebSocket()
+
+    assert asyncio.run(manager.connect_vote(websocket, "limit-test")) is None
+    assert [call[0] for call in websocket.calls] == ["accept", "send", "close"]
+    assert websocket.calls[1][1]["type"] == "server_busy"
+    assert websocket.calls[2] == ("close", 1013)
@@ -0,0 +1,88 @@
+"""ETags of polled endpoints: checked before building and equal on every worker."""
+import itertools
+
+import pytest
+from starlette.requests import Request
+
+from app.core.database import Base, SessionLocal, engine
+from app.models.candidate import Candidate
+from app.models.event import Event, EventCandidate
+from app.services.event_cache import EventStructureCache
+from app.services.http_cache import ConditionalResponseCache
+
+_links = itertools.count()
+
+
+def get_request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def event_id(db):
+    candidate = Candidate(full_name="Cache Candidate")
+    event = Event(name="Cache test", link=f"cache-test-{next(_links)}")
+    db.add_all([candidate, event])
+    db.flush()
+    db.add(EventCandidate(event_id=event.id, candidate_id=candidate.id, order=0))
+    db.commit()
+    return event.id
+
+
+def test_matching_etag_gets_304_without_building():
+    cache = ConditionalResponseCache()
+    built = []
+
+    def build():
+        built.append(1)
+        return {"value": 1}
+
+    first = cache.respond(get_request(), ("state", 1), build)
+    assert first.status_code == 200
+    again = cache.respond(get_request(first.headers["etag"]), ("state", 1), build)
+    assert again.status_code == 304
+    assert built == [1]
+
+    changed = cache.respond(get_request(first.headers["etag"]), ("state", 2), build)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+
+
+def test_etag_is_the_same_on_every_worker(db, event_id):
+    # Each worker has its own event cache, with its own version counters
+    worker_a, worker_b = EventStructureCache(), EventStructureCache()
+    worker_b.invalidate(event_id)
+    snapshot_a, snapshot_b = worker_a.get(db, event_id), worker_b.get(db, event_id)
+    assert snapshot_a.version != snapshot_b.version
+    assert snapshot_a.fingerprint == snapshot_b.fingerprint
+
+    state = ("event", event_id, snapshot_a.fingerprint)
+    etag = ConditionalResponseCache().respond(get_request(), state, dict).headers["etag"]
+    other = ConditionalResponseCache().respond(get_request(etag), state, dict)
+    assert other.status_code == 304
+
+
+def test_fingerprint_follows_the_event_data(db, event_id):
+    cache = EventStructureCache()
+    before = cache.get(db, event_id).fingerprint
+
+    # Vote counters don't change what the snapshot describes
+    db.get(Event, event_id).unique_voters = 5
+    db.commit()
+    cache.invalidate(event_id)
+    assert cache.get(db, event_id).fingerprint == before
+
+    db.get(Event, event_id).name = "Renamed"
+    db.commit()
+    cache.invalidate(event_id)
+    assert cache.get(db, event_id).fingerprint != before
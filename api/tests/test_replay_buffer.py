@@ -0,0 +1,53 @@
+"""Resuming reconnecting vote clients from the replay buffer."""
+import json
+
+from app.services.replay_buffer import ReplayBuffer
+
+LINK = "replay-test"
+
+
+def filled(size: int, count: int) -> ReplayBuffer:
+    buffer = ReplayBuffer(size)
+    for index in range(count):
+        buffer.append(LINK, {"type": "vote_update", "index": index})
+    return buffer
+
+
+def seqs(texts) -> list:
+    return [json.loads(text)["seq"] for text in texts]
+
+
+def test_resume_returns_exactly_the_missed_messages():
+    buffer = filled(size=8, count=5)
+    assert seqs(buffer.since(LINK, buffer.stream_id, 2)) == [3, 4, 5]
+    assert buffer.since(LINK, buffer.stream_id, 5) == []
+    assert buffer.replayed_messages == 3
+
+
+def test_only_the_latest_message_of_a_state_key_is_replayed():
+    buffer = filled(size=8, count=2)
+    buffer.append(LINK, {"type": "tally"}, state_key="tally")
+    buffer.append(LINK, {"type": "vote_update"})
+    buffer.append(LINK, {"type": "tally"}, state_key="tally")
+    assert seqs(buffer.since(LINK, buffer.stream_id, 1)) == [2, 4, 5]
+
+
+def test_other_stream_needs_a_full_resync():
+    buffer = filled(size=8, count=5)
+    # Numbering from another worker or an earlier process
+    assert buffer.since(LINK, ReplayBuffer(8).stream_id, 2) is None
+    assert buffer.since(LINK, buffer.stream_id, None) is None
+    assert buffer.resume_misses == 2
+
+
+def test_rolled_over_buffer_needs_a_full_resync():
+    buffer = filled(size=3, count=6)
+    # Seq 3 fell out of the ring, so a client that saw only seq 2 can't resume
+    assert buffer.since(LINK, buffer.stream_id, 2) is None
+    assert seqs(buffer.since(LINK, buffer.stream_id, 3)) == [4, 5, 6]
+
+
+def test_seq_from_the_future_needs_a_full_resync():
+    # E.g. the process restarted and the numbering started over
+    buffer = filled(size=8, count=2)
+    assert buffer.since(LINK, buffer.stream_id, 7) is None
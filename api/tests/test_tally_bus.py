@@ -0,0 +1,161 @@
+"""Tally counters of two workers kept in step over a (fake) Redis bus."""
+import asyncio
+import itertools
+
+import pytest
+from sqlalchemy import delete, insert
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.core.database import AsyncSessionLocal, Base, SessionLocal, engine
+from app.models.tally import EventCandidateTally
+from app.models.vote import Vote
+from app.services import tally_engine as tally_engine_module
+from app.services.broadcast_bus import RedisBus
+from app.services.tally_engine import TallyEngine
+from app.services.tally_summary import clear_tallies, increment_tallies, load_tallies
+
+EVENT_ID = 1
+CANDIDATE_ID = 7
+_nonces = itertools.count()
+
+
+def vote_rows(count: int, vote_type: str = "yes") -> list:
+    return [
+        {"event_id": EVENT_ID, "candidate_id": CANDIDATE_ID, "vote_type": vote_type}
+        for _ in range(count)
+    ]
+
+
+def record_args(rows: list) -> list:
+    return [(row["event_id"], row["candidate_id"], row["vote_type"], 1) for row in rows]
+
+
+def vote_values(row: dict) -> dict:
+    nonce = f"n{next(_nonces)}"
+    return {
+        **row, "event_candidate_id": 1, "ip_address": "127.0.0.1",
+        "nonce": nonce, "voter_key": nonce,
+    }
+
+
+async def write(rows: list) -> list:
+    """Insert the votes and their summary increment in one transaction, like the write-behind does."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Vote), [vote_values(row) for row in rows])
+        stamps = await increment_tallies(db, rows)
+        await db.commit()
+    return stamps
+
+
+def tally(worker: TallyEngine) -> dict:
+    db = SessionLocal()
+    try:
+        return worker.get(db, EVENT_ID, CANDIDATE_ID)
+    finally:
+        db.close()
+
+
+async def settle(bus: RedisBus, received: int):
+    for _ in range(200):
+        if bus.received >= received:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"bus received {bus.received} of {received} messages")
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        clear_tallies(db, EVENT_ID)
+        db.execute(delete(Vote).where(Vote.event_id == EVENT_ID))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_remote_record_already_in_seed_is_not_counted_twice(monkeypatch):
+    async def scenario():
+        server = fakeredis.FakeServer()
+        bus_a = RedisBus("redis://fake", "test", client=fakeredis.aioredis.FakeRedis(server=server))
+        bus_b = RedisBus("redis://fake", "test", client=fakeredis.aioredis.FakeRedis(server=server))
+        worker_a, worker_b = TallyEngine(), TallyEngine()
+        bus_a.subscribe("tally", worker_a.apply_remote)
+        bus_b.subscribe("tally", worker_b.apply_remote)
+        await bus_a.start()
+        await bus_b.start()
+        # Both counters live in this process; worker A publishes on its own bus
+        monkeypatch.setattr(tally_engine_module, "broadcast_bus", bus_a)
+        try:
+            tally(worker_a)
+
+            # Worker B loads the event after A's commit but before A's record arrives
+            first = vote_rows(3)
+            stamps = await write(first)
+            assert tally(worker_b)["yes"] == 3
+            worker_a.record_many(record_args(first), stamps)
+            await settle(bus_b, 1)
+            assert tally(worker_a)["yes"] == 3
+            assert tally(worker_b)["yes"] == 3
+
+            # Later batches are applied as usual
+            second = vote_rows(2, "no")
+            worker_a.record_many(record_args(second), await write(second))
+            await settle(bus_b, 2)
+            assert tally(worker_b) == {"yes": 3, "no": 2, "neutral": 0, "total": 5}
+        finally:
+            await bus_a.stop()
+            await bus_b.stop()
+
+    asyncio.run(scenario())
+
+
+def test_out_of_order_increments_are_all_applied():
+    async def scenario():
+        worker = TallyEngine()
+        tally(worker)
+        first, second = vote_rows(1), vote_rows(4)
+        first_stamps = await write(first)
+        second_stamps = await write(second)
+
+        # Two workers' records may reach the bus in the opposite order
+        worker.apply_remote({"op": "record", "votes": record_args(second), "stamps": second_stamps})
+        worker.apply_remote({"op": "record", "votes": record_args(first), "stamps": first_stamps})
+        # A replay changes nothing
+        worker.apply_remote({"op": "record", "votes": record_args(first), "stamps": first_stamps})
+        assert tally(worker)["yes"] == 5
+
+        # Reconcile agrees and keeps skipping what it adopted
+        db = SessionLocal()
+        try:
+            assert worker.reconcile(db, EVENT_ID) == {}
+        finally:
+            db.close()
+        worker.apply_remote({"op": "record", "votes": record_args(second), "stamps": second_stamps})
+        assert tally(worker)["yes"] == 5
+
+    asyncio.run(scenario())
+
+
+def test_reconcile_repairs_summary_drifted_from_votes():
+    worker = TallyEngine()
+    asyncio.run(write(vote_rows(3)))
+    db = SessionLocal()
+    try:
+        # Summary rows that no longer match the votes table (e.g. a lost update)
+        db.execute(insert(EventCandidateTally), [{
+            "event_id": EVENT_ID, "candidate_id": CANDIDATE_ID, "shard": 5,
+            "yes_votes": 0, "no_votes": 2, "neutral_votes": 0, "version": 1,
+        }])
+        db.commit()
+        assert worker.get(db, EVENT_ID, CANDIDATE_ID)["total"] == 5
+
+        worker.reconcile(db, EVENT_ID)
+        assert worker.get_stats()["total_summary_repairs"] == 1
+        assert load_tallies(db, EVENT_ID) == {CANDIDATE_ID: (3, 0, 0)}
+        assert worker.get(db, EVENT_ID, CANDIDATE_ID) == {"yes": 3, "no": 0, "neutral": 0, "total": 3}
+        assert worker.reconcile(db, EVENT_ID) == {}
+    finally:
+        db.close()
@@ -0,0 +1,200 @@
+"""Voting timer expiry on a virtual clock, including the cross-worker lease."""
+import asyncio
+import itertools
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import AsyncSessionLocal, Base, SessionLocal, engine
+from app.models.event import Event, EventCandidate, EventStatus
+from app.models.timer import TimerLease
+from app.routes import websocket as websocket_routes
+from app.services.clock import VirtualClock
+from app.services.timer_service import TimerService
+from app.services.websocket_manager import manager
+
+DURATION_SEC = 10
+_links = itertools.count()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = VirtualClock()
+    monkeypatch.setattr(manager, "clock", clock)
+    return clock
+
+
+@pytest.fixture
+def broadcasts(monkeypatch):
+    sent = []
+
+    async def broadcast_vote(event_link, message):
+        sent.append((event_link, message["type"]))
+
+    async def broadcast_display(event_link, message):
+        pass
+
+    monkeypatch.setattr(manager, "broadcast_vote", broadcast_vote)
+    monkeypatch.setattr(manager, "broadcast_display", broadcast_display)
+    monkeypatch.setattr(websocket_routes, "load_display_update_payload", lambda db, event_id: {})
+    return sent
+
+
+@pytest.fixture
+def running_timer(clock):
+    """An active event whose first candidate's timer started at ``clock.now()``."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        event = Event(name="Timer test", link=f"timer-test-{next(_links)}", status=EventStatus.active,
+                      duration_sec=DURATION_SEC, current_candidate_index=0)
+        db.add(event)
+        db.flush()
+        event_candidate = EventCandidate(event_id=event.id, candidate_id=1, order=0,
+                                         timer_started_at=clock.now().replace(tzinfo=None),
+                                         timer_duration_sec=DURATION_SEC)
+        db.add(event_candidate)
+        db.commit()
+        timer = (event.id, event.link, event_candidate.id, clock.now())
+    finally:
+        db.close()
+    yield timer
+    manager.cancel_timer(timer[1])
+
+
+async def settle():
+    """Let the scheduler and any expiry (which goes through the DB) finish."""
+    for _ in range(10):
+        await asyncio.sleep(0.02)
+
+
+async def restart_timer(event_candidate_id: int, started_at):
+    async with AsyncSessionLocal() as db:
+        event_candidate = await db.get(EventCandidate, event_candidate_id)
+        event_candidate.timer_started_at = started_at.replace(tzinfo=None)
+        await db.commit()
+
+
+def test_armed_timer_fires_once_when_due(clock, broadcasts, running_timer):
+    event_id, link, event_candidate_id, started_at = running_timer
+    service = TimerService(AsyncSessionLocal)
+
+    async def scenario():
+        service.arm(event_id, link, event_candidate_id, started_at, DURATION_SEC)
+        clock.advance(DURATION_SEC - 1)
+        await settle()
+        assert broadcasts == []
+
+        clock.advance(1)
+        await settle()
+        clock.advance(DURATION_SEC)
+        await settle()
+
+    asyncio.run(scenario())
+    assert broadcasts == [(link, "timer_expired")]
+    assert service.fired == 1
+
+
+def test_rearmed_timer_does_not_fire_the_stale_expiry(clock, broadcasts, running_timer):
+    event_id, link, event_candidate_id, started_at = running_timer
+    service = TimerService(AsyncSessionLocal)
+    fired_before = manager.timers_fired
+
+    async def scenario():
+        service.arm(event_id, link, event_candidate_id, started_at, DURATION_SEC)
+        clock.advance(5)
+        await settle()
+
+        # The admin restarts the timer half way through
+        restarted_at = clock.now()
+        await restart_timer(event_candidate_id, restarted_at)
+        service.arm(event_id, link, event_candidate_id, restarted_at, DURATION_SEC)
+        clock.advance(DURATION_SEC - 5)
+        await settle()
+        # The old deadline passed without its expiry even being run
+        assert manager.timers_fired == fired_before
+        assert broadcasts == []
+
+        clock.advance(5)
+        await settle()
+
+    asyncio.run(scenario())
+    assert broadcasts == [(link, "timer_expired")]
+    assert service.fired == 1
+    assert manager.timers_fired == fired_before + 1
+
+
+def test_cancelled_timer_does_not_fire(clock, broadcasts, running_timer):
+    event_id, link, event_candidate_id, started_at = running_timer
+    service = TimerService(AsyncSessionLocal)
+    fired_before = manager.timers_fired
+
+    async def scenario():
+        service.arm(event_id, link, event_candidate_id, started_at, DURATION_SEC)
+        clock.advance(5)
+        await settle()
+        service.cancel(link)
+        clock.advance(DURATION_SEC * 2)
+        await settle()
+
+    asyncio.run(scenario())
+    assert broadcasts == []
+    assert service.fired == 0
+    assert manager.timers_fired == fired_before
+    assert manager.get_timer_stats()["pending_timers"] == 0
+
+
+def test_only_one_worker_claims_the_expiry(clock, broadcasts, running_timer):
+    event_id, link, event_candidate_id, started_at = running_timer
+    workers = [TimerService(AsyncSessionLocal), TimerService(AsyncSessionLocal)]
+    clock.advance(DURATION_SEC)
+
+    async def scenario():
+        # Every worker arms every timer, so all of them run the expiry
+        await asyncio.gather(*(
+            worker._expire(event_id, link, event_candidate_id, started_at) for worker in workers
+        ))
+
+    asyncio.run(scenario())
+    assert broadcasts == [(link, "timer_expired")]
+    assert sorted(worker.fired for worker in workers) == [0, 1]
+    assert sorted(worker.lost_claims for worker in workers) == [0, 1]
+    db = SessionLocal()
+    try:
+        leases = db.scalar(
+            select(func.count(TimerLease.id)).where(TimerLease.event_candidate_id == event_candidate_id)
+        )
+    finally:
+        db.close()
+    assert leases == 1
+
+
+def test_timers_never_fire_before_their_deadline(clock):
+    fired = []
+
+    def expiry(name):
+        async def on_expire():
+            fired.append((name, clock.now()))
+        return on_expire
+
+    async def scenario():
+        started = clock.now()
+        manager.schedule_timer_expiry("tick-a", 1.0, expiry("a"))
+        manager.schedule_timer_expiry("tick-b", 1.03, expiry("b"))
+        clock.advance(0.99)
+        await settle()
+        assert fired == []
+
+        # Both fall in one tick: "a" waits for "b" instead of "b" firing early
+        clock.advance(0.01)
+        await settle()
+        assert fired == []
+        clock.advance(0.03)
+        await settle()
+        return started
+
+    batches_before = manager.timer_batches
+    started = asyncio.run(scenario())
+    assert sorted(name for name, _ in fired) == ["a", "b"]
+    assert all((at - started).total_seconds() >= 1.03 for _, at in fired)
+    assert manager.timer_batches == batches_before + 1
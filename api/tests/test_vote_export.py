@@ -0,0 +1,83 @@
+"""Raw vote export: CSV/NDJSON/gzip output and keyset paging."""
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy import delete, insert
+
+from app.core.database import Base, SessionLocal, engine
+from app.models.candidate import Candidate
+from app.models.vote import Vote
+from app.services.vote_export import EXPORT_COLUMNS, iter_vote_pages, stream_votes
+
+EVENT_ID = 21
+VOTES = 5
+
+
+@pytest.fixture(autouse=True)
+def votes():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(delete(Vote).where(Vote.event_id == EVENT_ID))
+        candidate = Candidate(full_name='=HYPERLINK("http://evil","x")')
+        db.add(candidate)
+        db.flush()
+        db.execute(insert(Vote), [
+            {
+                "event_id": EVENT_ID, "event_candidate_id": 1, "candidate_id": candidate.id,
+                "ip_address": "10.0.0.1", "device_id": "+dev" if index == 0 else f"dev{index}",
+                "voter_key": f"10.0.0.1_{index}", "nonce": "@nonce" if index == 0 else f"-{index}",
+                "vote_type": "yes",
+            }
+            for index in range(VOTES)
+        ])
+        db.commit()
+        yield candidate.full_name
+    finally:
+        db.close()
+
+
+def export(export_format: str, compressed: bool = False) -> bytes:
+    return b"".join(stream_votes(EVENT_ID, export_format, gzip=compressed, page_size=2))
+
+
+def test_keyset_pages_cover_every_vote_once():
+    pages = list(iter_vote_pages(EVENT_ID, page_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    ids = [row.id for page in pages for row in page]
+    assert ids == sorted(ids) and len(set(ids)) == VOTES
+
+
+def test_csv_escapes_formula_cells(votes):
+    rows = list(csv.reader(io.StringIO(export("csv").decode("utf-8"))))
+    assert rows[0] == EXPORT_COLUMNS
+    assert len(rows) == VOTES + 1
+
+    first = dict(zip(EXPORT_COLUMNS, rows[1]))
+    assert first["candidate_name"] == "'" + votes
+    assert first["device_id"] == "'+dev"
+    assert first["nonce"] == "'@nonce"
+    assert [row[EXPORT_COLUMNS.index("nonce")] for row in rows[2:]] == ["'-1", "'-2", "'-3", "'-4"]
+    assert first["ip_address"] == "10.0.0.1"
+
+
+def test_ndjson_keeps_raw_values(votes):
+    lines = export("ndjson").splitlines()
+    assert len(lines) == VOTES
+    first = json.loads(lines[0])
+    assert list(first) == EXPORT_COLUMNS
+    assert first["candidate_name"] == votes
+    assert first["device_id"] == "+dev"
+
+
+@pytest.mark.parametrize("export_format", ["csv", "ndjson"])
+def test_gzip_wraps_the_same_bytes(export_format):
+    assert gzip.decompress(export(export_format, compressed=True)) == export(export_format)
+
+
+def test_event_without_votes_exports_the_header_only():
+    body = b"".join(stream_votes(EVENT_ID + 1, "csv", page_size=2)).decode("utf-8")
+    assert body == ",".join(EXPORT_COLUMNS) + "\r\n"
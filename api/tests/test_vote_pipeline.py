@@ -0,0 +1,176 @@
+"""Group commit, duplicate handling and failure isolation of the vote write-behind."""
+import asyncio
+import itertools
+import time
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import AsyncSessionLocal, Base, SessionLocal, engine
+from app.models.vote import Vote, make_voter_key
+from app.services.tally_summary import clear_tallies
+from app.services.vote_pipeline import VoteWriteBehind
+
+EVENT_ID = 11
+_nonces = itertools.count()
+
+
+def vote_row(voter: str, candidate_id: int = 1, vote_type="yes", ip_address: str = "10.0.0.1") -> dict:
+    return {
+        "event_id": EVENT_ID, "event_candidate_id": candidate_id, "candidate_id": candidate_id,
+        "ip_address": ip_address, "device_id": voter or None, "voter_key": make_voter_key(ip_address, voter),
+        "nonce": f"n{next(_nonces)}", "vote_type": vote_type,
+    }
+
+
+def stored_votes() -> list:
+    db = SessionLocal()
+    try:
+        return db.execute(
+            select(Vote.candidate_id, Vote.voter_key, Vote.vote_type)
+            .where(Vote.event_id == EVENT_ID)
+            .order_by(Vote.candidate_id, Vote.voter_key)
+        ).all()
+    finally:
+        db.close()
+
+
+def run(pipeline: VoteWriteBehind, scenario):
+    async def wrapper():
+        pipeline.start()
+        try:
+            return await asyncio.wait_for(scenario(), timeout=5)
+        finally:
+            await pipeline.stop()
+
+    return asyncio.run(wrapper())
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(delete(Vote).where(Vote.event_id == EVENT_ID))
+        clear_tallies(db, EVENT_ID)
+        db.commit()
+    finally:
+        db.close()
+
+
+def make_pipeline(max_batch_size: int, max_wait_sec: float) -> VoteWriteBehind:
+    pipeline = VoteWriteBehind(AsyncSessionLocal)
+    pipeline.max_batch_size = max_batch_size
+    pipeline.max_wait_sec = max_wait_sec
+    return pipeline
+
+
+def test_full_batch_is_flushed_without_waiting():
+    pipeline = make_pipeline(max_batch_size=3, max_wait_sec=30)
+
+    async def scenario():
+        return await asyncio.gather(*(pipeline.submit([vote_row(f"d{i}")]) for i in range(3)))
+
+    results = run(pipeline, scenario)
+    assert [len(inserted) for inserted in results] == [1, 1, 1]
+    assert pipeline.total_batches == 1
+    assert pipeline.last_batch_size == 3
+
+
+def test_partial_batch_is_flushed_after_max_wait():
+    pipeline = make_pipeline(max_batch_size=100, max_wait_sec=0.05)
+
+    async def scenario():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(pipeline.submit([vote_row(f"d{i}")]) for i in range(2)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = run(pipeline, scenario)
+    assert [len(inserted) for inserted in results] == [1, 1]
+    assert pipeline.total_batches == 1
+    assert pipeline.last_batch_size == 2
+    assert elapsed >= 0.05
+
+
+def test_duplicate_voter_gets_empty_result_within_and_across_batches():
+    pipeline = make_pipeline(max_batch_size=10, max_wait_sec=0.02)
+
+    async def scenario():
+        same_batch = await asyncio.gather(
+            pipeline.submit([vote_row("a", vote_type="yes")]),
+            pipeline.submit([vote_row("a", vote_type="no")]),
+            pipeline.submit([vote_row("b")]),
+        )
+        next_batch = await pipeline.submit([vote_row("b", vote_type="no")])
+        return same_batch, next_batch
+
+    (first, second, other), next_batch = run(pipeline, scenario)
+    assert [row["vote_type"] for row in first] == ["yes"]
+    assert second == []
+    assert len(other) == 1
+    assert next_batch == []
+    assert pipeline.total_duplicates == 2
+    assert stored_votes() == [(1, "10.0.0.1_a", "yes"), (1, "10.0.0.1_b", "yes")]
+
+
+def test_auto_votes_are_written_only_for_accepted_cast_votes():
+    pipeline = make_pipeline(max_batch_size=10, max_wait_sec=0.02)
+
+    async def scenario():
+        accepted = await pipeline.submit([vote_row("a", 2), vote_row("a", 1, "neutral")])
+        # A second vote for candidate 2 is a duplicate, its auto-vote for candidate 3 is dropped
+        duplicate = await pipeline.submit([vote_row("a", 2, "no"), vote_row("a", 3, "neutral")])
+        # Auto-votes the voter already has are skipped, the rest are written
+        partial = await pipeline.submit([
+            vote_row("a", 4), vote_row("a", 1, "neutral"), vote_row("a", 3, "neutral"),
+        ])
+        return accepted, duplicate, partial
+
+    accepted, duplicate, partial = run(pipeline, scenario)
+    assert [row["candidate_id"] for row in accepted] == [2, 1]
+    assert duplicate == []
+    assert [row["candidate_id"] for row in partial] == [4, 3]
+    assert stored_votes() == [
+        (1, "10.0.0.1_a", "neutral"),
+        (2, "10.0.0.1_a", "yes"),
+        (3, "10.0.0.1_a", "neutral"),
+        (4, "10.0.0.1_a", "yes"),
+    ]
+
+
+def test_failing_batch_falls_back_to_individual_writes():
+    pipeline = make_pipeline(max_batch_size=3, max_wait_sec=30)
+
+    async def scenario():
+        return await asyncio.gather(
+            pipeline.submit([vote_row("a")]),
+            # vote_type is NOT NULL, so this row makes the whole batch fail
+            pipeline.submit([vote_row("b", vote_type=None)]),
+            pipeline.submit([vote_row("c")]),
+            return_exceptions=True,
+        )
+
+    first, broken, last = run(pipeline, scenario)
+    assert len(first) == 1
+    assert isinstance(broken, IntegrityError)
+    assert len(last) == 1
+    assert pipeline.total_failures == 1
+    assert [voter_key for _, voter_key, _ in stored_votes()] == ["10.0.0.1_a", "10.0.0.1_c"]
+
+
+def test_vote_without_device_is_a_duplicate_of_any_vote_from_its_ip():
+    pipeline = make_pipeline(max_batch_size=10, max_wait_sec=0.02)
+
+    async def scenario():
+        with_device = await pipeline.submit([vote_row("a")])
+        without_device = await pipeline.submit([vote_row("")])
+        other_candidate = await pipeline.submit([vote_row("", candidate_id=2)])
+        other_ip = await pipeline.submit([vote_row("", ip_address="10.0.0.2")])
+        return with_device, without_device, other_candidate, other_ip
+
+    with_device, without_device, other_candidate, other_ip = run(pipeline, scenario)
+    assert len(with_device) == 1
+    assert without_device == []
+    assert len(other_candidate) == 1
+    assert len(other_ip) == 1
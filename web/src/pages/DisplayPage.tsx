@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useParams } from 'react-router-dom';
 import { WS_BASE_URL } from '../utils/api';
 import { DisplayState, VoteResults, VoteTally } from '../types';
+import { ClockSync } from '../utils/clockSync';
 
 export default function DisplayPage() {
   const { link } = useParams<{ link: string }>();
@@ -10,6 +11,9 @@ export default function DisplayPage() {
   const wsRef = useRef<WebSocket | null>(null);
   const [isFullscreen, setIsFullscreen] = useState(false);
   const countdownTarget = useRef<number | null>(null);
+  // Countdown targets are server-clock timestamps (timer.ends_at_ts)
+  const clockSync = useRef(new ClockSync());
+  const lastSeqRef = useRef<number | null>(null);
   const audioContextRef = useRef<AudioContext | null>(null);
   const lastBeepSecond = useRef<number>(-1);
   const finalResults = (displayState?.final_results || []) as VoteTally[];
@@ -67,7 +71,7 @@ export default function DisplayPage() {
     }
 
     const remainingMs = timer.remaining_ms ?? 0;
-    const nowMs = Date.now();
+    const nowMs = clockSync.current.now();
     const endsAtMsFromTimer =
       typeof timer.ends_at_ts === 'number'
         ? timer.ends_at_ts
@@ -109,7 +113,7 @@ export default function DisplayPage() {
       if (!countdownTarget.current) {
         return;
       }
-      const remaining = countdownTarget.current - Date.now();
+      const remaining = countdownTarget.current - clockSync.current.now();
       if (remaining <= 0) {
         setRemainingSeconds(0);
         countdownTarget.current = null;
@@ -150,13 +154,32 @@ export default function DisplayPage() {
 
     ws.onopen = () => {
       console.log('Connected to display WebSocket');
-      ws.send('update');
+      // The server sends the current snapshot on connect
+      ws.send(clockSync.current.request());
     };
 
     ws.onmessage = (event) => {
       const data = JSON.parse(event.data);
       if (data.type === 'display_update') {
+        lastSeqRef.current = typeof data.seq === 'number' ? data.seq : null;
         setDisplayState(data);
+      } else if (data.type === 'display_patch') {
+        const lastSeq = lastSeqRef.current;
+        if (lastSeq !== null && data.seq <= lastSeq) {
+          // Already covered by a newer snapshot
+          return;
+        }
+        if (lastSeq === null || data.seq !== lastSeq + 1) {
+          // Missed a message - ask for a full snapshot
+          if (ws.readyState === WebSocket.OPEN) {
+            ws.send('update');
+          }
+          return;
+        }
+        lastSeqRef.current = data.seq;
+        setDisplayState((prev) => (prev ? { ...prev, ...data.changes, seq: data.seq } : prev));
+      } else if (data.type === 'time_sync') {
+        clockSync.current.handleReply(data);
       } else if (data.type === 'candidate_changed') {
         // Request fresh update when candidate changes
         if (ws.readyState === WebSocket.OPEN) {
@@ -171,14 +194,24 @@ export default function DisplayPage() {
 
     wsRef.current = ws;
 
-    // Keep alive and request updates
+    // Keep alive; the server only answers with a snapshot if the event changed
     const keepAlive = setInterval(() => {
       if (ws.readyState === WebSocket.OPEN) {
-        ws.send('update');
+        ws.send('sync');
       }
     }, 1000);
 
-    return () => clearInterval(keepAlive);
+    // Refresh the clock offset now and then
+    const timeSync = setInterval(() => {
+      if (ws.readyState === WebSocket.OPEN) {
+        ws.send(clockSync.current.request());
+      }
+    }, 30000);
+
+    return () => {
+      clearInterval(keepAlive);
+      clearInterval(timeSync);
+    };
   };
 
   const toggleFullscreen = () => {
@@ -54,7 +54,18 @@ export default function EventManage() {
 
   const timerRunning = currentCandidate?.timer?.running ?? false;
   const timerStarted = !!currentCandidate?.timer?.started_at;
-  const timerRemainingMs = currentCandidate?.timer?.remaining_ms ?? 0;
+  // Count down locally from the deadline; polled responses may be cached
+  const [nowMs, setNowMs] = useState(Date.now());
+  useEffect(() => {
+    if (!timerRunning) return;
+    const interval = setInterval(() => setNowMs(Date.now()), 500);
+    return () => clearInterval(interval);
+  }, [timerRunning]);
+  const timerEndsAt = currentCandidate?.timer?.ends_at_ts;
+  const timerRemainingMs =
+    typeof timerEndsAt === 'number'
+      ? Math.max(0, timerEndsAt - nowMs)
+      : currentCandidate?.timer?.remaining_ms ?? 0;
   const timerRemainingSec = Math.max(0, Math.ceil(timerRemainingMs / 1000));
   const timerButtonDisabled = startingTimer || !currentCandidate?.candidate || timerRunning || event?.status !== EventStatus.ACTIVE;
   const missingPositionCount = eventCandidates.reduce((count, ec) => {
@@ -4,6 +4,7 @@ import api, { WS_BASE_URL } from '../utils/api';
 import { Event, CurrentCandidate, EventStatus, VoteTally } from '../types';
 import { generateUUID } from '../utils/uuid';
 import { getDeviceId } from '../utils/deviceId';
+import { ClockSync } from '../utils/clockSync';
 
 export default function VotePage() {
   const { link } = useParams<{ link: string }>();
@@ -19,6 +20,12 @@ export default function VotePage() {
   const previousCandidateId = useRef<number | null>(null);
   const votedCandidates = useRef<Set<number>>(new Set());
   const countdownTarget = useRef<number | null>(null);
+  // Countdown targets are server-clock timestamps (timer.ends_at_ts)
+  const clockSync = useRef(new ClockSync());
+  // Position in the event's broadcast stream, presented on reconnect to
+  // get only the missed messages
+  const streamRef = useRef<string | null>(null);
+  const lastSeqRef = useRef<number | null>(null);
   const [countdownMs, setCountdownMs] = useState(0);
   const [results, setResults] = useState<VoteTally[]>([]);
   const [resultsLoading, setResultsLoading] = useState(false);
@@ -29,6 +36,8 @@ export default function VotePage() {
   // WebSocket connection management
   const [connectionStatus, setConnectionStatus] = useState<'connecting' | 'connected' | 'disconnected' | 'reconnecting'>('connecting');
   const reconnectAttempts = useRef(0);
+  // Backoff the server asked for when it turned the connection away
+  const retryAfterMsRef = useRef<number | null>(null);
   const maxReconnectAttempts = 50; // Allow many reconnects for long voting sessions
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const heartbeatIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
@@ -106,7 +115,7 @@ export default function VotePage() {
     }
 
     const remainingMs = typeof timer.remaining_ms === 'number' ? timer.remaining_ms : 0;
-    const nowMs = Date.now();
+    const nowMs = clockSync.current.now();
     const endsAtMsFromTimer =
       typeof timer.ends_at_ts === 'number'
         ? timer.ends_at_ts
@@ -122,7 +131,7 @@ export default function VotePage() {
         : null;
 
     countdownTarget.current = targetMs;
-    setCountdownMs(remainingMs);
+    setCountdownMs(targetMs ? targetMs - nowMs : remainingMs);
   }, [
     currentCandidate?.timer?.started_at,
     currentCandidate?.timer?.running,
@@ -141,7 +150,7 @@ export default function VotePage() {
       if (!countdownTarget.current) {
         return;
       }
-      const remaining = countdownTarget.current - Date.now();
+      const remaining = countdownTarget.current - clockSync.current.now();
       if (remaining <= 0) {
         setCountdownMs(0);
         countdownTarget.current = null;
@@ -236,7 +245,11 @@ export default function VotePage() {
 
     setConnectionStatus(reconnectAttempts.current > 0 ? 'reconnecting' : 'connecting');
 
-    const ws = new WebSocket(`${WS_BASE_URL}/ws/vote/${link}`);
+    const resume =
+      streamRef.current && lastSeqRef.current !== null
+        ? `?stream=${encodeURIComponent(streamRef.current)}&seq=${lastSeqRef.current}`
+        : '';
+    const ws = new WebSocket(`${WS_BASE_URL}/ws/vote/${link}${resume}`);
 
     // Set timeout for connection
     const connectionTimeout = setTimeout(() => {
@@ -253,7 +266,15 @@ export default function VotePage() {
       reconnectAttempts.current = 0;
       lastPongRef.current = Date.now();
 
-      // Start heartbeat - send ping every 25 seconds (before typical 30s timeout)
+      // Estimate the server clock offset before counting down
+      try {
+        ws.send(clockSync.current.request());
+      } catch (err) {
+        console.error('Failed to send time_sync:', err);
+      }
+
+      // Start heartbeat - send time_sync every 25 seconds (before typical 30s timeout);
+      // the reply doubles as the pong and refreshes the clock offset
       heartbeatIntervalRef.current = setInterval(() => {
         if (ws.readyState === WebSocket.OPEN) {
           // Check if we received pong recently (within 60 seconds)
@@ -264,11 +285,11 @@ export default function VotePage() {
             return;
           }
 
-          // Send ping
+          // Send time_sync as the ping
           try {
-            ws.send(JSON.stringify({ type: 'ping' }));
+            ws.send(clockSync.current.request());
           } catch (err) {
-            console.error('Failed to send ping:', err);
+            console.error('Failed to send time_sync:', err);
           }
         }
       }, 25000);
@@ -286,11 +307,46 @@ export default function VotePage() {
       // Update last pong time for any message (server is alive)
       lastPongRef.current = Date.now();
 
+      if (data.type === 'session') {
+        // Replayed messages (if resumed) follow and carry their own seq
+        streamRef.current = data.stream;
+        lastSeqRef.current = data.resumed ? lastSeqRef.current : data.seq;
+        return;
+      }
+
+      if (typeof data.seq === 'number') {
+        lastSeqRef.current = data.seq;
+      }
+
+      if (data.type === 'welcome') {
+        // Initial state for a fresh session: position in the stream plus the
+        // current candidate (the tally isn't shown to voters)
+        streamRef.current = data.stream;
+        data = { type: 'current_candidate', data: data.current_candidate };
+      }
+
       if (data.type === 'pong') {
         // Heartbeat response, already updated lastPongRef
         return;
       }
 
+      if (data.type === 'server_busy') {
+        // Sent right before a 1013 close; onclose waits this long to retry
+        retryAfterMsRef.current = data.retry_after * 1000;
+        return;
+      }
+
+      if (data.type === 'ping') {
+        // Server heartbeat - answer so the connection isn't dropped as idle
+        ws.send(JSON.stringify({ type: 'pong' }));
+        return;
+      }
+
+      if (data.type === 'time_sync') {
+        clockSync.current.handleReply(data);
+        return;
+      }
+
       if (data.type === 'current_candidate') {
         const newCandidate = data.data as CurrentCandidate | null;
 
@@ -415,10 +471,15 @@ export default function VotePage() {
         return;
       }
 
-      // Exponential backoff with jitter: 1s, 2s, 4s, 8s... max 30s
+      // Exponential backoff with jitter: 1s, 2s, 4s, 8s... max 30s.
+      // A busy server sends its own jittered hint in a server_busy frame
+      // and in the close reason ("...; retry_after=3.2")
       const baseDelay = Math.min(1000 * Math.pow(2, reconnectAttempts.current), 30000);
       const jitter = Math.random() * 1000; // Add 0-1s random jitter
-      const delay = baseDelay + jitter;
+      const reasonHint = /retry_after=([\d.]+)/.exec(event.reason || '');
+      const retryAfterMs = retryAfterMsRef.current ?? (reasonHint ? parseFloat(reasonHint[1]) * 1000 : null);
+      retryAfterMsRef.current = null;
+      const delay = retryAfterMs ?? baseDelay + jitter;
 
       console.log(`Reconnecting in ${Math.round(delay)}ms (attempt ${reconnectAttempts.current + 1}/${maxReconnectAttempts})`);
       setConnectionStatus('reconnecting');
@@ -532,6 +593,12 @@ export default function VotePage() {
     try {
       const response = await api.get(`/event-management/${event.id}/current-candidate`);
       const data = response.data;
+      if (data?.timer && typeof data.timer.ends_at_ts === 'number') {
+        // The polled body is cached and has no remaining_ms; derive it from the deadline
+        data.timer.remaining_ms = data.timer.running
+          ? Math.max(0, data.timer.ends_at_ts - clockSync.current.now())
+          : 0;
+      }
       if (data?.candidate && data?.timer?.started_at) {
         const incomingId = data.candidate.id;
         const candidateChanged = previousCandidateId.current !== incomingId;
@@ -545,7 +612,10 @@ export default function VotePage() {
         setCurrentCandidate(data);
         // Update local countdown from API data
         if (data.timer?.running && data.timer?.remaining_ms > 0) {
-          const targetMs = Date.now() + data.timer.remaining_ms;
+          const targetMs =
+            typeof data.timer.ends_at_ts === 'number'
+              ? data.timer.ends_at_ts
+              : clockSync.current.now() + data.timer.remaining_ms;
           countdownTarget.current = targetMs;
           setCountdownMs(data.timer.remaining_ms);
         } else {
@@ -86,6 +86,7 @@ export interface DisplayState {
   event_completed?: boolean;
   final_results?: VoteTally[];
   total_votes?: number;
+  seq?: number;
 }
 
 export interface LoginRequest {
@@ -0,0 +1,52 @@
+/**
+ * NTP-style estimate of the offset between this device's clock and the server's.
+ *
+ * The client sends `{ type: 'time_sync', client_sent }` over its WebSocket and the
+ * server answers with the times it received and sent the reply. The sample with
+ * the shortest round trip among the recent ones is trusted, so countdowns can run
+ * locally against the server's `ends_at_ts` even on phones with a wrong clock.
+ */
+
+export interface TimeSyncReply {
+  client_sent: number;
+  server_received: number;
+  server_sent: number;
+}
+
+interface Sample {
+  offset: number;
+  rtt: number;
+}
+
+const MAX_SAMPLES = 8;
+
+export class ClockSync {
+  private samples: Sample[] = [];
+  private offsetMs = 0;
+
+  request(): string {
+    return JSON.stringify({ type: 'time_sync', client_sent: Date.now() });
+  }
+
+  handleReply(reply: TimeSyncReply): void {
+    const receivedAt = Date.now();
+    if (typeof reply.client_sent !== 'number') return;
+
+    const rtt = receivedAt - reply.client_sent - (reply.server_sent - reply.server_received);
+    const offset =
+      (reply.server_received - reply.client_sent + (reply.server_sent - receivedAt)) / 2;
+
+    this.samples.push({ offset, rtt: Math.max(0, rtt) });
+    if (this.samples.length > MAX_SAMPLES) {
+      this.samples.shift();
+    }
+
+    const best = this.samples.reduce((a, b) => (b.rtt < a.rtt ? b : a));
+    this.offsetMs = best.offset;
+  }
+
+  /** Current time on the server clock, in epoch milliseconds. */
+  now(): number {
+    return Date.now() + this.offsetMs;
+  }
+}